@@ -0,0 +1,9 @@
+from django.contrib import admin
+from apps.analytics.models import DailyPublishStat
+
+
+@admin.register(DailyPublishStat)
+class DailyPublishStatAdmin(admin.ModelAdmin):
+    list_display = ['day', 'user', 'platform', 'status', 'content_type', 'count']
+    list_filter = ['platform', 'status', 'content_type', 'day']
+    list_select_related = ['user']
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.analytics.views import DashboardSummaryView
+
+app_name = 'dashboard'
+
+urlpatterns = [
+    path('summary', DashboardSummaryView.as_view(), name='summary'),
+]
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.analytics.services.stats_service import CountersExist, backfill_publish_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Approximate the daily publish counters for a range of days from current and archived post targets. '
+        'Each target is counted once, in its current status, on the day it was created; the live counters '
+        'count every status change on the day it happened. Use it for days from before the counters existed. '
+        'Days that already have counters are refused unless --force is given, which replaces them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='start', required=True, help='First day to backfill (YYYY-MM-DD).')
+        parser.add_argument('--to', dest='end', required=True, help='Last day to backfill (YYYY-MM-DD).')
+        parser.add_argument(
+            '--force', action='store_true', help='Replace existing counters in the range with the approximation.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start, end = parse_date(options['start']), parse_date(options['end'])
+        except ValueError:
+            start = end = None
+        if start is None or end is None or start > end:
+            raise CommandError('--from and --to must be dates (YYYY-MM-DD) with --from not after --to.')
+        try:
+            rows = backfill_publish_stats(start, end, force=options['force'])
+        except CountersExist as exc:
+            raise CommandError(f'{exc} Pass --force to replace them with the approximation.')
+        self.stdout.write(f'Wrote {rows} daily counter row(s).')
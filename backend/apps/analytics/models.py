@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.db import models
+
+from apps.integrations.models import Platform
+
+
+class DailyPublishStat(models.Model):
+    """Number of targets that moved into ``status`` on ``day``.
+
+    Maintained incrementally by ``services.stats_service.record_status_changes``.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
+    day = models.DateField()
+    platform = models.CharField(max_length=20, choices=Platform.choices)
+    status = models.CharField(max_length=10)
+    content_type = models.CharField(max_length=10)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('user', 'day', 'platform', 'status', 'content_type')
+
+    def __str__(self):
+        return f'{self.user_id}:{self.day}:{self.platform}:{self.status}:{self.content_type}'
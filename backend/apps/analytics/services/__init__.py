@@ -0,0 +1,13 @@
+from .stats_service import (
+    CountersExist,
+    backfill_publish_stats,
+    publish_stats,
+    record_status_changes,
+)
+
+__all__ = [
+    'CountersExist',
+    'backfill_publish_stats',
+    'publish_stats',
+    'record_status_changes',
+]
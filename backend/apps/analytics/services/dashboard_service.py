@@ -0,0 +1,112 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.capabilities.services.availability_service import evaluate_availability
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget
+
+RECENT_FAILURES = 5
+
+
+def dashboard_summary(user):
+    """Dashboard figures for ``user``, cached for ``DASHBOARD_SUMMARY_CACHE_TIMEOUT`` seconds.
+
+    Everything is computed with six queries whatever the size of the user's
+    history: two grouped counts each for posts and targets (live and
+    archived), the latest rejections, and the user's accounts.
+    """
+    key = f'dashboard-summary:{user.id}'
+    summary = cache.get(key)
+    if summary is None:
+        summary = build_dashboard_summary(user)
+        cache.set(key, summary, settings.DASHBOARD_SUMMARY_CACHE_TIMEOUT)
+    return summary
+
+
+def build_dashboard_summary(user):
+    return {
+        'posts': _post_counts(user),
+        'targets': _target_counts(user),
+        'recent_failures': _recent_failures(user),
+        'availability': _availability(user),
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def _post_counts(user):
+    by_content_type = dict.fromkeys(Post.ContentType.values, 0)
+    live = Post.objects.filter(user=user).values('content_type').annotate(total=Count('id')).order_by()
+    archived = ArchivedPost.objects.filter(user_id=user.id).values('content_type').annotate(total=Count('id')).order_by()
+    for row in [*live, *archived]:
+        by_content_type[row['content_type']] = by_content_type.get(row['content_type'], 0) + row['total']
+    return {'total': sum(by_content_type.values()), 'by_content_type': by_content_type}
+
+
+def _target_counts(user):
+    by_status = dict.fromkeys(PostTarget.Status.values, 0)
+    by_platform = defaultdict(lambda: dict.fromkeys(PostTarget.Status.values, 0))
+    live = (
+        PostTarget.objects.filter(post__user=user)
+        .values('social_account__platform', 'status')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    archived = (
+        ArchivedPostTarget.objects.filter(user_id=user.id)
+        .values('platform', 'status')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    rows = [(row['social_account__platform'], row['status'], row['total']) for row in live]
+    rows += [(row['platform'], row['status'], row['total']) for row in archived]
+    for platform, status, total in rows:
+        by_status[status] += total
+        by_platform[platform][status] += total
+    return {'by_status': by_status, 'by_platform': dict(by_platform)}
+
+
+def _recent_failures(user):
+    targets = (
+        PostTarget.objects.filter(post__user=user, status=PostTarget.Status.REJECTED)
+        .select_related('post', 'social_account')
+        .order_by('-id')[:RECENT_FAILURES]
+    )
+    return [
+        {
+            'post_target_id': target.id,
+            'post_id': target.post_id,
+            'content_type': target.post.content_type,
+            'caption': target.post.caption[:100],
+            'platform': target.social_account.platform,
+            'account': target.social_account.display_name,
+            'reason_code': target.reason_code,
+            'last_error': target.reason,
+            'created_at': target.created_at.isoformat(),
+        }
+        for target in targets
+    ]
+
+
+def _availability(user):
+    accounts = list(SocialAccount.objects.filter(user=user).order_by('id'))
+    platforms = {
+        platform.value: {
+            'platform': platform.value,
+            'connected_accounts': sum(account.platform == platform.value for account in accounts),
+            'content_types': {},
+        }
+        for platform in Platform
+    }
+    for content_type in Post.ContentType.values:
+        for item in evaluate_availability(user, content_type, None, accounts=accounts):
+            platforms[item.platform]['content_types'][content_type] = {
+                'available': item.available,
+                'reason': item.reason,
+                'requires_action': item.requires_action,
+                'action_hint': item.action_hint,
+            }
+    return list(platforms.values())
@@ -0,0 +1,97 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.analytics.models import DailyPublishStat
+from apps.posts.models import ArchivedPostTarget, PostTarget
+
+
+def record_status_changes(changes, day=None):
+    """Add status transitions to today's counters.
+
+    ``changes`` is an iterable of ``(user_id, platform, content_type, status)``
+    tuples, one per target that moved into ``status``. Call it in the same
+    transaction as the status update so counters never drift from the rows.
+    """
+    day = day or timezone.localdate()
+    for (user_id, platform, content_type, status), count in Counter(changes).items():
+        key = {
+            'user_id': user_id,
+            'day': day,
+            'platform': platform,
+            'status': status,
+            'content_type': content_type,
+        }
+        if DailyPublishStat.objects.filter(**key).update(count=F('count') + count):
+            continue
+        try:
+            with transaction.atomic():
+                DailyPublishStat.objects.create(count=count, **key)
+        except IntegrityError:
+            # Another transaction created the row first.
+            DailyPublishStat.objects.filter(**key).update(count=F('count') + count)
+
+
+def publish_stats(user, start, end):
+    """Daily counters for ``user`` between ``start`` and ``end`` inclusive."""
+    return list(
+        DailyPublishStat.objects.filter(user=user, day__range=(start, end))
+        .order_by('day', 'platform', 'status', 'content_type')
+        .values('day', 'platform', 'status', 'content_type', 'count')
+    )
+
+
+class CountersExist(Exception):
+    """Raised when a backfill would overwrite counters without ``force``."""
+
+
+def backfill_publish_stats(start, end, force=False):
+    """Approximate the counters for ``start`` to ``end`` inclusive from the targets.
+
+    The incremental counters record every transition on the day it happened;
+    the targets only keep their current status. The backfill therefore counts
+    each target once, in its current status, on the day it was created. That
+    suits days from before the counters existed. Days that already have
+    counters raise ``CountersExist`` unless ``force`` is set, which replaces
+    them with the approximation. Returns the number of counter rows written.
+    """
+    existing = DailyPublishStat.objects.filter(day__range=(start, end))
+    if not force and existing.exists():
+        raise CountersExist(f'Counters already exist between {start} and {end}.')
+    totals = Counter()
+    hot = (
+        PostTarget.objects.annotate(day=TruncDate('created_at'))
+        .filter(day__range=(start, end))
+        .values('post__user_id', 'day', 'social_account__platform', 'status', 'post__content_type')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    for row in hot:
+        key = (row['post__user_id'], row['day'], row['social_account__platform'], row['status'], row['post__content_type'])
+        totals[key] += row['total']
+    archived = (
+        ArchivedPostTarget.objects.annotate(day=TruncDate('created_at'))
+        .filter(day__range=(start, end))
+        .values('user_id', 'day', 'platform', 'status', 'content_type')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    for row in archived:
+        totals[(row['user_id'], row['day'], row['platform'], row['status'], row['content_type'])] += row['total']
+
+    with transaction.atomic():
+        existing.delete()
+        DailyPublishStat.objects.bulk_create(
+            [
+                DailyPublishStat(
+                    user_id=user_id, day=day, platform=platform, status=status,
+                    content_type=content_type, count=count,
+                )
+                for (user_id, day, platform, status, content_type), count in totals.items()
+            ],
+            batch_size=1000,
+        )
+    return len(totals)
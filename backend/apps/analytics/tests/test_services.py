@@ -0,0 +1,91 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.analytics.models import DailyPublishStat
+from apps.analytics.services.stats_service import CountersExist, backfill_publish_stats, record_status_changes
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+
+User = get_user_model()
+
+
+class PublishStatsServiceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+
+    def _counts(self):
+        return {
+            (row.platform, row.status, row.content_type): row.count
+            for row in DailyPublishStat.objects.filter(user=self.user)
+        }
+
+    def test_record_status_changes_increments_counters(self):
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'queued')] * 2)
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'queued'), (self.user.id, 'x', 'TEXT', 'rejected')])
+
+        self.assertEqual(self._counts(), {('x', 'queued', 'TEXT'): 3, ('x', 'rejected', 'TEXT'): 1})
+
+    def test_publish_records_transitions_once(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        x_account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        youtube = SocialAccount.objects.create(user=self.user, platform=Platform.YOUTUBE, display_name='YT')
+        PostTarget.objects.create(post=post, social_account=x_account)
+        PostTarget.objects.create(post=post, social_account=youtube)
+
+        client.post(f'/api/posts/{post.id}/publish')
+        client.post(f'/api/posts/{post.id}/publish')
+
+        self.assertEqual(self._counts(), {('x', 'queued', 'TEXT'): 1, ('youtube', 'rejected', 'TEXT'): 1})
+
+    def _published_target(self, days_ago):
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        target = PostTarget.objects.create(post=post, social_account=account, status=PostTarget.Status.PUBLISHED)
+        PostTarget.objects.filter(id=target.id).update(created_at=timezone.now() - timedelta(days=days_ago))
+
+    def test_backfill_fills_only_the_requested_days(self):
+        today = timezone.localdate()
+        self._published_target(days_ago=10)
+        self._published_target(days_ago=0)
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'queued')])
+
+        rows = backfill_publish_stats(today - timedelta(days=20), today - timedelta(days=1))
+
+        self.assertEqual(rows, 1)
+        self.assertEqual(
+            set(DailyPublishStat.objects.values_list('day', 'status', 'count')),
+            {(today - timedelta(days=10), 'published', 1), (today, 'queued', 1)},
+        )
+
+    def test_backfill_refuses_days_with_counters_unless_forced(self):
+        today = timezone.localdate()
+        self._published_target(days_ago=0)
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'queued')])
+
+        with self.assertRaises(CountersExist):
+            backfill_publish_stats(today, today)
+        self.assertEqual(self._counts(), {('x', 'queued', 'TEXT'): 1})
+
+        backfill_publish_stats(today, today, force=True)
+        self.assertEqual(self._counts(), {('x', 'published', 'TEXT'): 1})
+
+    def test_command_requires_force_to_replace_counters(self):
+        today = timezone.localdate().isoformat()
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'queued')])
+
+        with self.assertRaisesMessage(CommandError, 'Pass --force'):
+            call_command('backfill_publish_stats', '--from', today, '--to', today)
+        with self.assertRaises(CommandError):
+            call_command('backfill_publish_stats', '--from', today, '--to', 'yesterday')
+
+        out = StringIO()
+        call_command('backfill_publish_stats', '--from', today, '--to', today, '--force', stdout=out)
+        self.assertIn('Wrote 0 daily counter row(s).', out.getvalue())
@@ -0,0 +1,89 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.analytics.services.stats_service import record_status_changes
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget
+
+User = get_user_model()
+
+
+class PublishStatsViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_returns_counters_in_range(self):
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'published')], day=date(2024, 5, 1))
+        record_status_changes([(self.user.id, 'x', 'TEXT', 'published')], day=date(2024, 6, 1))
+
+        response = self.client.get('/api/stats/', {'from': '2024-05-01', 'to': '2024-05-31'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [
+            {'day': date(2024, 5, 1), 'platform': 'x', 'status': 'published', 'content_type': 'TEXT', 'count': 1},
+        ])
+
+    def test_rejects_invalid_range(self):
+        response = self.client.get('/api/stats/', {'from': '2024-02-30'})
+        self.assertEqual(response.status_code, 400)
+
+
+class DashboardSummaryViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+
+    def _post(self, content_type, status):
+        post = Post.objects.create(user=self.user, content_type=content_type, caption='Hello')
+        return PostTarget.objects.create(
+            post=post, social_account=self.account, status=status, last_error='Rate limited.' if status == 'rejected' else '',
+        )
+
+    def test_summarises_live_and_archived_history(self):
+        self._post(Post.ContentType.TEXT, PostTarget.Status.PUBLISHED)
+        failed = self._post(Post.ContentType.PHOTO, PostTarget.Status.REJECTED)
+        ArchivedPost.objects.create(id=900, user_id=self.user.id, content_type='TEXT', created_at=timezone.now())
+        ArchivedPostTarget.objects.create(
+            id=900, post_id=900, user_id=self.user.id, social_account_id=self.account.id, platform='x',
+            content_type='TEXT', status='published', created_at=timezone.now(),
+        )
+
+        with self.assertNumQueries(6):
+            response = self.client.get('/api/dashboard/summary')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['posts'], {'total': 3, 'by_content_type': {'TEXT': 2, 'PHOTO': 1, 'VIDEO': 0}})
+        self.assertEqual(response.data['targets']['by_status'], {'selected': 0, 'queued': 0, 'rejected': 1, 'published': 2})
+        self.assertEqual(response.data['targets']['by_platform']['x']['published'], 2)
+        self.assertEqual(
+            [(item['post_target_id'], item['last_error']) for item in response.data['recent_failures']],
+            [(failed.id, 'Rate limited.')],
+        )
+        x = next(item for item in response.data['availability'] if item['platform'] == 'x')
+        self.assertEqual(x['connected_accounts'], 1)
+        self.assertTrue(x['content_types']['TEXT']['available'])
+        youtube = next(item for item in response.data['availability'] if item['platform'] == 'youtube')
+        self.assertEqual(youtube['connected_accounts'], 0)
+        self.assertFalse(youtube['content_types']['VIDEO']['available'])
+
+    def test_summary_is_cached_per_user(self):
+        self.client.get('/api/dashboard/summary')
+        self._post(Post.ContentType.TEXT, PostTarget.Status.PUBLISHED)
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/dashboard/summary')
+
+        self.assertEqual(response.data['posts']['total'], 0)
+        other = User.objects.create_user(username='other', password='testpass')
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get('/api/dashboard/summary').data['targets']['by_platform'], {})
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.analytics.views import PublishStatsView
+
+app_name = 'analytics'
+
+urlpatterns = [
+    path('', PublishStatsView.as_view(), name='stats'),
+]
@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.analytics.services.dashboard_service import dashboard_summary
+from apps.analytics.services.stats_service import publish_stats
+from apps.common.db_router import replica_reads
+
+MAX_RANGE_DAYS = 366
+
+
+class PublishStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @replica_reads
+    def get(self, request):
+        end = timezone.localdate()
+        start = end - timedelta(days=29)
+        try:
+            if request.query_params.get('from'):
+                start = parse_date(request.query_params['from'])
+            if request.query_params.get('to'):
+                end = parse_date(request.query_params['to'])
+        except ValueError:
+            start = end = None
+        if not start or not end or start > end:
+            return Response({'detail': 'Invalid date range.'}, status=status.HTTP_400_BAD_REQUEST)
+        if (end - start).days >= MAX_RANGE_DAYS:
+            return Response({'detail': f'Date range is limited to {MAX_RANGE_DAYS} days.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(publish_stats(request.user, start, end))
+
+
+class DashboardSummaryView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @replica_reads
+    def get(self, request):
+        return Response(dashboard_summary(request.user))
@@ -4,3 +4,6 @@
 class CapabilitiesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.capabilities'
+
+    def ready(self):
+        from apps.capabilities import checks  # noqa: F401
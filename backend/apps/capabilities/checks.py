@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from apps.common.checks import uses_process_local_cache
+
+
+@register(Tags.caches)
+def check_availability_cache(app_configs, **kwargs):
+    """Availability is invalidated by bumping a version key, which other processes never see in a local cache."""
+    if not settings.REQUIRE_SHARED_CACHE or not settings.AVAILABILITY_CACHE_TIMEOUT:
+        return []
+    if not uses_process_local_cache():
+        return []
+    return [
+        Error(
+            'The availability cache needs a cache shared by all processes.',
+            hint='Set REDIS_URL, set AVAILABILITY_CACHE_TIMEOUT to 0, or set REQUIRE_SHARED_CACHE=false '
+                 'when running a single process.',
+            id='capabilities.E001',
+        ),
+    ]
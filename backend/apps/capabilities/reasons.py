@@ -0,0 +1,66 @@
+"""Integer codes for the rejection and failure reasons stored on post targets.
+
+Targets keep a small ``reason_code`` instead of repeating the same sentence on
+every row; ``last_error`` holds free text only for unexpected errors
+(``Reason.OTHER``). Codes are stored, so never renumber or reuse them.
+"""
+from django.db import models
+
+from apps.capabilities.services import availability_service as availability
+
+
+class Reason(models.IntegerChoices):
+    NONE = 0, ''
+    OTHER = 1, 'Unexpected error.'
+    ACCOUNT_UNAVAILABLE = 2, availability.REASON_ACCOUNT_UNAVAILABLE
+    NO_ACCOUNT = 10, availability.REASON_NO_ACCOUNT
+    IG_PRO_REQUIRED = 11, availability.REASON_IG_PRO_REQUIRED
+    IG_PERMS_MISSING = 12, availability.REASON_IG_PERMS_MISSING
+    FB_PAGE_REQUIRED = 13, availability.REASON_FB_PAGE_REQUIRED
+    TIKTOK_PREREQS = 14, availability.REASON_TIKTOK_PREREQS
+    TIKTOK_PHOTO_DISABLED = 15, availability.REASON_TIKTOK_PHOTO_DISABLED
+    TIKTOK_TEXT_UNSUPPORTED = 16, availability.REASON_TIKTOK_TEXT_UNSUPPORTED
+    YT_VIDEO_ONLY = 17, availability.REASON_YT_VIDEO_ONLY
+    LINKEDIN_SCOPE = 18, availability.REASON_LINKEDIN_SCOPE
+    X_MEDIA_DISABLED = 19, availability.REASON_X_MEDIA_DISABLED
+
+
+REASON_ACTIONS = {
+    Reason.NO_ACCOUNT: availability.ACTION_CONNECT_ACCOUNT,
+    Reason.IG_PRO_REQUIRED: availability.ACTION_IG_PRO,
+    Reason.IG_PERMS_MISSING: availability.ACTION_IG_PERMS,
+    Reason.FB_PAGE_REQUIRED: availability.ACTION_FB_PAGE,
+    Reason.TIKTOK_PREREQS: availability.ACTION_TIKTOK_PREREQS,
+    Reason.TIKTOK_PHOTO_DISABLED: availability.ACTION_TIKTOK_PHOTO,
+    Reason.LINKEDIN_SCOPE: availability.ACTION_LINKEDIN,
+    Reason.X_MEDIA_DISABLED: availability.ACTION_X_MEDIA,
+}
+
+# Registered sentences; NONE and OTHER have no fixed text to match.
+_CODES_BY_TEXT = {reason.label: reason for reason in Reason if reason > Reason.OTHER}
+
+
+def encode_reason(text):
+    """Return ``(reason_code, last_error)`` for a reason sentence.
+
+    Registered sentences become their code with an empty ``last_error``;
+    anything else is kept verbatim under ``Reason.OTHER``.
+    """
+    if not text:
+        return Reason.NONE, ''
+    code = _CODES_BY_TEXT.get(text)
+    if code is None:
+        return Reason.OTHER, text
+    return code, ''
+
+
+def reason_text(code, last_error=''):
+    """The sentence for ``code``, or the stored free text for unregistered errors."""
+    if code > Reason.OTHER and code in Reason.values:
+        return Reason(code).label
+    return last_error or ''
+
+
+def reason_action(code):
+    """The action hint that goes with ``code``, if any."""
+    return REASON_ACTIONS.get(code)
@@ -1,3 +1,7 @@
+from .availability_cache import (
+    cached_availability,
+    invalidate_availability,
+)
 from .availability_service import (
     evaluate_availability,
     AccountAvailability,
@@ -5,6 +9,8 @@ from .availability_service import (
 )
 
 __all__ = [
+    'cached_availability',
+    'invalidate_availability',
     'evaluate_availability',
     'AccountAvailability',
     'PlatformAvailability',
@@ -0,0 +1,39 @@
+from dataclasses import asdict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.capabilities.services.availability_service import evaluate_availability
+from apps.common.db_router import read_from_primary
+
+
+def _version_key(user_id):
+    return f'availability:version:{user_id}'
+
+
+def cached_availability(user, content_type):
+    """Serialized ``evaluate_availability`` for a content type, cached per user.
+
+    Entries are keyed by a per-user version, so ``invalidate_availability``
+    drops every content type for a user with one cache write. Misses are
+    computed on the primary even inside ``read_from_replica()``: a lagging
+    replica would otherwise cache stale flags under the new version.
+    """
+    version = cache.get_or_set(_version_key(user.id), 1, timeout=None)
+    key = f'availability:{user.id}:{version}:{content_type}'
+    data = cache.get(key)
+    if data is None:
+        with read_from_primary():
+            data = [asdict(item) for item in evaluate_availability(user, content_type, None)]
+        cache.set(key, data, settings.AVAILABILITY_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_availability(user_ids):
+    """Forget cached availability for each of ``user_ids``; call once per change set."""
+    for user_id in set(user_ids):
+        key = _version_key(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 2, timeout=None)
@@ -25,6 +25,7 @@ class PlatformAvailability:
 
 
 REASON_NO_ACCOUNT = 'No connected account.'
+REASON_ACCOUNT_UNAVAILABLE = 'Account not available for publishing.'
 REASON_IG_PRO_REQUIRED = 'Instagram requires a Professional account for publishing.'
 REASON_IG_PERMS_MISSING = 'Instagram publishing permissions are missing or invalid.'
 REASON_FB_PAGE_REQUIRED = 'Facebook publishing requires a connected Page.'
@@ -45,8 +46,14 @@ ACTION_X_MEDIA = 'Configure X tier for media.'
 ACTION_CONNECT_ACCOUNT = 'Connect account.'
 
 
-def evaluate_availability(user, content_type, optional_media_metadata=None):
-    accounts = SocialAccount.objects.filter(user=user).order_by('id')
+def evaluate_availability(user, content_type, optional_media_metadata=None, accounts=None):
+    """Availability of each platform for ``content_type``.
+
+    Pass ``accounts`` (the user's accounts ordered by id) to evaluate several
+    content types from one query.
+    """
+    if accounts is None:
+        accounts = SocialAccount.objects.filter(user=user).order_by('id')
     accounts_by_platform = {platform.value: [] for platform in Platform}
     for account in accounts:
         accounts_by_platform.setdefault(account.platform, []).append(account)
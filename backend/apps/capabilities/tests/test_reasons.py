@@ -0,0 +1,58 @@
+from importlib import import_module
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from apps.capabilities.reasons import Reason, encode_reason, reason_action, reason_text
+from apps.capabilities.services.availability_service import ACTION_IG_PRO, REASON_IG_PRO_REQUIRED, REASON_YT_VIDEO_ONLY
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+
+User = get_user_model()
+
+
+class ReasonRegistryTest(SimpleTestCase):
+    def test_registered_sentences_become_codes(self):
+        self.assertEqual(encode_reason(REASON_IG_PRO_REQUIRED), (Reason.IG_PRO_REQUIRED, ''))
+        self.assertEqual(reason_text(Reason.IG_PRO_REQUIRED), REASON_IG_PRO_REQUIRED)
+        self.assertEqual(reason_action(Reason.IG_PRO_REQUIRED), ACTION_IG_PRO)
+
+    def test_unexpected_errors_keep_their_text(self):
+        self.assertEqual(encode_reason('Platform answered 503.'), (Reason.OTHER, 'Platform answered 503.'))
+        self.assertEqual(reason_text(Reason.OTHER, 'Platform answered 503.'), 'Platform answered 503.')
+        self.assertEqual(encode_reason(''), (Reason.NONE, ''))
+        self.assertEqual(reason_text(Reason.NONE), '')
+
+    def test_codes_keep_the_text_the_migration_encoded(self):
+        migration = import_module('apps.posts.migrations.0012_target_reason_codes')
+
+        for code, text in migration.REASONS.items():
+            self.assertEqual(Reason(code).label, text)
+
+
+class PublishReasonCodeTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_rejections_store_the_code_and_resolve_to_text(self):
+        account = SocialAccount.objects.create(user=self.user, platform=Platform.YOUTUBE, display_name='YT')
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        target = PostTarget.objects.create(post=post, social_account=account)
+
+        response = self.client.post(f'/api/posts/{post.id}/publish')
+
+        self.assertEqual(response.data['rejected'][0]['reason_code'], Reason.YT_VIDEO_ONLY)
+        self.assertEqual(response.data['rejected'][0]['reason'], REASON_YT_VIDEO_ONLY)
+        target.refresh_from_db()
+        self.assertEqual((target.reason_code, target.last_error), (Reason.YT_VIDEO_ONLY, ''))
+        self.assertEqual(target.reason, REASON_YT_VIDEO_ONLY)
+
+    def test_reason_filter_uses_the_index(self):
+        plan = PostTarget.objects.filter(reason_code=Reason.YT_VIDEO_ONLY).order_by('-id').explain()
+
+        self.assertIn('posts_target_reason_idx', plan)
@@ -1,6 +1,7 @@
 ﻿from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 
+from apps.capabilities.checks import check_availability_cache
 from apps.capabilities.services.availability_service import (
     REASON_IG_PERMS_MISSING,
     REASON_IG_PRO_REQUIRED,
@@ -85,3 +86,19 @@ class CapabilityServiceTests(TestCase):
         x_platform = self._get_platform(availability, Platform.X.value)
         self.assertFalse(x_platform.available)
         self.assertEqual(x_platform.reason, REASON_X_MEDIA_DISABLED)
+
+
+class AvailabilityCacheCheckTest(SimpleTestCase):
+    REDIS = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://localhost'}}
+
+    @override_settings(REQUIRE_SHARED_CACHE=True)
+    def test_process_local_cache_is_an_error_when_a_shared_cache_is_required(self):
+        self.assertEqual([error.id for error in check_availability_cache(None)], ['capabilities.E001'])
+
+    def test_allowed_for_single_process_installs_shared_caches_or_no_caching(self):
+        with override_settings(REQUIRE_SHARED_CACHE=False):
+            self.assertEqual(check_availability_cache(None), [])
+        with override_settings(REQUIRE_SHARED_CACHE=True, AVAILABILITY_CACHE_TIMEOUT=0):
+            self.assertEqual(check_availability_cache(None), [])
+        with override_settings(REQUIRE_SHARED_CACHE=True, CACHES=self.REDIS):
+            self.assertEqual(check_availability_cache(None), [])
@@ -0,0 +1,95 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.capabilities.services import availability_cache
+from apps.capabilities.services.availability_cache import invalidate_availability
+from apps.common.db_router import ReadReplicaRouter
+from apps.integrations.models import Platform, SocialAccount
+
+User = get_user_model()
+
+
+class CapabilitiesValidateMetadataTest(TestCase):
+    url = '/api/capabilities/validate?mode=metadata'
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        SocialAccount.objects.create(user=self.user, platform=Platform.YOUTUBE, display_name='YT')
+
+    def test_video_descriptor_validates_without_upload(self):
+        response = self.client.post(self.url, {
+            'content_type': 'VIDEO',
+            'caption': 'Launch',
+            'video_file': {'name': 'launch.mp4', 'size': 500 * 1024 * 1024, 'mime_type': 'video/mp4', 'duration': 42.0},
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        youtube = next(item for item in response.data['availability'] if item['platform'] == Platform.YOUTUBE.value)
+        self.assertTrue(youtube['available'])
+
+    def test_missing_descriptor_uses_same_rules(self):
+        response = self.client.post(self.url, {'content_type': 'PHOTO', 'caption': 'Launch'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('image_file', response.data['errors'])
+
+    def test_descriptor_mime_type_must_match_media_kind(self):
+        response = self.client.post(self.url, {
+            'content_type': 'PHOTO',
+            'caption': 'Launch',
+            'image_file': {'name': 'launch.mp4', 'size': 1024, 'mime_type': 'video/mp4'},
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('mime_type', response.data['errors']['image_file'])
+
+
+class CapabilitiesCacheTest(TestCase):
+    url = '/api/capabilities/'
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = SocialAccount.objects.create(user=self.user, platform=Platform.LINKEDIN, display_name='LI')
+
+    def _linkedin(self):
+        response = self.client.get(self.url, {'content_type': 'TEXT'})
+        return next(item for item in response.data if item['platform'] == Platform.LINKEDIN.value)
+
+    def test_availability_is_cached_until_accounts_change(self):
+        self.assertFalse(self._linkedin()['available'])
+
+        SocialAccount.objects.filter(id=self.account.id).update(linkedin_access_granted=True)
+        with self.assertNumQueries(0):
+            self.assertFalse(self._linkedin()['available'])
+
+        invalidate_availability([self.user.id])
+        self.assertTrue(self._linkedin()['available'])
+
+    def test_saving_an_account_invalidates(self):
+        self._linkedin()
+
+        self.account.linkedin_access_granted = True
+        self.account.save()
+
+        self.assertTrue(self._linkedin()['available'])
+
+    @override_settings(DATABASE_REPLICA_ALIAS='default')
+    def test_misses_are_computed_on_the_primary(self):
+        routed = []
+        evaluate = availability_cache.evaluate_availability
+
+        def spy(*args, **kwargs):
+            routed.append(ReadReplicaRouter().db_for_read(SocialAccount))
+            return evaluate(*args, **kwargs)
+
+        with mock.patch.object(availability_cache, 'evaluate_availability', side_effect=spy):
+            self._linkedin()
+
+        # The view reads from the replica alias; None means the primary.
+        self.assertEqual(routed, [None])
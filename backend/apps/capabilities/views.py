@@ -5,33 +5,46 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.capabilities.services.availability_cache import cached_availability
 from apps.capabilities.services.availability_service import evaluate_availability
+from apps.common.db_router import replica_reads
+from apps.common.throttling import ComposerThrottle
 from apps.posts.models import Post
-from apps.posts.serializers import DraftPostSerializer
+from apps.posts.serializers import DraftPostMetadataSerializer, DraftPostSerializer
 
 
 class CapabilitiesView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [ComposerThrottle]
 
+    @replica_reads
     def get(self, request):
         content_type = request.query_params.get('content_type')
         if content_type not in Post.ContentType.values:
             return Response({'detail': 'Invalid content_type.'}, status=status.HTTP_400_BAD_REQUEST)
-        availability = evaluate_availability(request.user, content_type, None)
-        return Response([asdict(item) for item in availability])
+        return Response(cached_availability(request.user, content_type))
 
 
 class CapabilitiesValidateView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [ComposerThrottle]
 
+    @replica_reads
     def post(self, request):
-        serializer = DraftPostSerializer(data=request.data)
+        # mode=metadata validates declared file descriptors so clients can check
+        # a draft before uploading the media itself.
+        metadata_only = request.query_params.get('mode') == 'metadata'
+        serializer_class = DraftPostMetadataSerializer if metadata_only else DraftPostSerializer
+        serializer = serializer_class(data=request.data)
         is_valid = serializer.is_valid()
 
         content_type = request.data.get('content_type')
+        media_metadata = request.data.get('media_metadata')
+        if metadata_only and is_valid:
+            media_metadata = serializer.media_metadata_for_availability()
         availability = []
         if content_type in Post.ContentType.values:
-            availability = evaluate_availability(request.user, content_type, request.data.get('media_metadata'))
+            availability = evaluate_availability(request.user, content_type, media_metadata)
 
         if not is_valid:
             return Response(
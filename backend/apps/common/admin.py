@@ -1,4 +1,82 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 # Common utilities and models
 
+CURSOR_VAR = 'before'
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that never runs an unbounded COUNT(*).
+
+    Unfiltered querysets on PostgreSQL use the planner's row estimate. Anything
+    else is counted up to ``count_limit`` rows; pages beyond that are reached
+    with keyset links (see ``KeysetChangeList``).
+    """
+
+    count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = _estimated_row_count(queryset)
+            if estimate is not None and estimate > self.count_limit:
+                return estimate
+        return queryset.order_by()[:self.count_limit].count()
+
+
+def _estimated_row_count(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row[0] if row and row[0] >= 0 else None
+
+
+class KeysetChangeList(ChangeList):
+    """Changelist that pages with ``?before=<pk>`` instead of a growing OFFSET.
+
+    Keyset links are offered only for the default ``-pk`` ordering.
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        cursor = self.params.get(CURSOR_VAR) if ORDER_VAR not in self.params else None
+        if cursor and cursor.isdigit():
+            queryset = queryset.filter(pk__lt=int(cursor))
+        return queryset
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.next_cursor_url = None
+        if ORDER_VAR in self.params or self.page_num != 1:
+            return
+        results = list(self.result_list)
+        if len(results) == self.list_per_page:
+            self.next_cursor_url = self.get_query_string({CURSOR_VAR: results[-1].pk}, [PAGE_VAR])
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """ModelAdmin for tables with millions of rows: no exact counts, keyset paging."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ['-pk']
+    change_list_template = 'admin/keyset_change_list.html'
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
@@ -5,3 +5,6 @@ class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.common'
 
+    def ready(self):
+        from apps.common import checks  # noqa: F401
+
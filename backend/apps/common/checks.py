@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Tags, register
+from rest_framework.settings import api_settings
+
+
+def uses_process_local_cache(alias='default'):
+    """Whether the ``alias`` cache lives in each process's memory rather than being shared."""
+    return isinstance(caches[alias], LocMemCache)
+
+
+@register(Tags.caches)
+def check_throttle_cache(app_configs, **kwargs):
+    """Throttle counters in a process-local cache only limit each process, not the user."""
+    from apps.common.throttling import SlidingWindowThrottle
+
+    if not settings.REQUIRE_SHARED_CACHE or not uses_process_local_cache():
+        return []
+    rates = api_settings.DEFAULT_THROTTLE_RATES
+    scopes = sorted(
+        throttle.scope for throttle in SlidingWindowThrottle.__subclasses__() if rates.get(throttle.scope)
+    )
+    if not scopes:
+        return []
+    return [
+        Error(
+            f'Throttle scopes {", ".join(scopes)} need a cache shared by all processes.',
+            hint='Set REDIS_URL, remove the rates from DEFAULT_THROTTLE_RATES, or set REQUIRE_SHARED_CACHE=false '
+                 'when running a single process.',
+            id='common.E001',
+        ),
+    ]
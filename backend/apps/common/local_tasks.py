@@ -0,0 +1,247 @@
+"""Run Celery tasks on a thread pool inside the app server.
+
+With ``LOCAL_TASK_EXECUTION`` enabled, ``apply_async``/``delay`` hand tasks to
+a bounded pool in the current process and return immediately, so small
+installs get asynchronous publishing without a broker or worker. Tasks still
+run through ``Task.apply``, so signals and task metrics behave as usual.
+Pending work is drained when the process exits; calls that cannot run any
+more are logged and passed to the task's abandon handler, if it has one.
+"""
+import atexit
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from celery.contrib.django.task import DjangoTask
+from celery.exceptions import Ignore
+from celery.utils import uuid
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# Request header marking tasks run by the local executor.
+LOCAL_HEADER = 'local_executor'
+
+
+class LocalTaskExecutor:
+    """A bounded thread pool with delayed submissions and a graceful drain.
+
+    At most ``max_pending`` tasks are queued or running at once; submitting
+    more blocks the caller until a slot frees up. Tasks submitted with a
+    ``countdown`` wait on a single scheduler thread instead of a worker.
+    """
+
+    def __init__(self, max_workers, max_pending):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='local-task')
+        self._capacity = threading.BoundedSemaphore(max(max_pending, max_workers))
+        self._condition = threading.Condition()
+        self._delayed = []
+        self._sequence = itertools.count()
+        self._outstanding = 0
+        self._closed = False
+        self._queued = {}
+        self._scheduler = threading.Thread(target=self._schedule, name='local-task-scheduler', daemon=True)
+        self._scheduler.start()
+
+    @property
+    def outstanding(self):
+        """Tasks submitted but not finished, including delayed ones."""
+        with self._condition:
+            return self._outstanding
+
+    def submit(self, task, args=None, kwargs=None, countdown=None, headers=None, retries=0, task_id=None):
+        headers = {**(headers or {}), LOCAL_HEADER: True}
+        call = (task, tuple(args or ()), dict(kwargs or {}), headers, retries, task_id or uuid())
+        with self._condition:
+            if self._closed:
+                self._abandon(call)
+                raise RuntimeError('The local task executor has been shut down.')
+            self._outstanding += 1
+            if countdown:
+                heapq.heappush(self._delayed, (time.monotonic() + countdown, next(self._sequence), call))
+                self._condition.notify_all()
+                return
+        self._start(call)
+
+    def drain(self, timeout=None):
+        """Wait for queued, running and delayed tasks, then stop the pool.
+
+        Work still outstanding after ``timeout`` seconds is given up: delayed
+        and queued calls are passed to ``_abandon`` and tasks still running
+        are left to finish. Returns the number of tasks given up.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if self._closed:
+                return 0
+            while self._outstanding:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            abandoned = self._outstanding
+            self._closed = True
+            dropped = [call for _, _, call in self._delayed]
+            self._delayed.clear()
+            # Cancelling a future runs its done callback, which forgets it.
+            queued = dict(self._queued)
+            self._condition.notify_all()
+        self._pool.shutdown(wait=not abandoned, cancel_futures=True)
+        dropped += [call for future, call in queued.items() if future.cancelled()]
+        if abandoned:
+            logger.warning('Abandoned %d local task(s) at shutdown.', abandoned)
+        for call in dropped:
+            self._abandon(call)
+        return abandoned
+
+    def _start(self, call):
+        self._capacity.acquire()
+        try:
+            future = self._pool.submit(self._run, call)
+        except RuntimeError:
+            self._capacity.release()
+            self._abandon(call)
+            self._finish()
+            return
+        with self._condition:
+            self._queued[future] = call
+        # Runs at once if the future is already done.
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future):
+        with self._condition:
+            self._queued.pop(future, None)
+
+    def _abandon(self, call):
+        task, args, kwargs, headers = call[:4]
+        logger.error('Dropped local task %s%r.', task.name, args)
+        handler = _abandon_handlers.get(task.name)
+        if handler is None:
+            return
+        try:
+            handler(args, kwargs, headers)
+        except Exception:
+            logger.exception('Abandon handler for %s failed.', task.name)
+
+    def _run(self, call):
+        task, args, kwargs, headers, retries, task_id = call
+        close_old_connections()
+        try:
+            result = task.apply(args, kwargs, task_id=task_id, headers=headers, retries=retries, throw=False)
+            if result.failed():
+                logger.error('Local task %s failed: %r', task.name, result.result, exc_info=result.result)
+        except Exception:
+            logger.exception('Local task %s crashed.', task.name)
+        finally:
+            close_old_connections()
+            self._capacity.release()
+            self._finish()
+
+    def _finish(self):
+        with self._condition:
+            self._outstanding -= 1
+            self._condition.notify_all()
+
+    def _schedule(self):
+        while True:
+            with self._condition:
+                while not self._closed and (not self._delayed or self._delayed[0][0] > time.monotonic()):
+                    timeout = self._delayed[0][0] - time.monotonic() if self._delayed else None
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                _, _, call = heapq.heappop(self._delayed)
+            self._start(call)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_abandon_handlers = {}
+
+
+def abandon_handler(task_name):
+    """Register ``func(args, kwargs, headers)`` for calls of ``task_name`` the executor gives up on."""
+    def register(func):
+        _abandon_handlers[task_name] = func
+        return func
+    return register
+
+
+def get_local_executor():
+    """Return the process-wide executor, or None when local execution is off."""
+    global _executor
+    if not settings.LOCAL_TASK_EXECUTION:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = LocalTaskExecutor(settings.LOCAL_TASK_WORKERS, settings.LOCAL_TASK_MAX_PENDING)
+            _register_drain(_executor.drain, settings.LOCAL_TASK_DRAIN_TIMEOUT)
+        return _executor
+
+
+def _register_drain(drain, timeout):
+    # concurrent.futures stops accepting work in a threading exit hook, which
+    # runs before atexit handlers. Hooks run newest first, so registering one
+    # drains the pool while it still takes retries. The hook is private to
+    # CPython; without it the drain runs from atexit, where queued tasks still
+    # finish but countdowns and retries coming due are abandoned.
+    register = getattr(threading, '_register_atexit', None)
+    if register is None:
+        atexit.register(drain, timeout)
+    else:
+        register(drain, timeout)
+
+
+def runs_locally(request):
+    """Whether a task request came from the local executor."""
+    return bool(request.is_eager and (request.headers or {}).get(LOCAL_HEADER))
+
+
+def retry_task(task, countdown, kwargs=None):
+    """Retry ``task`` after ``countdown`` seconds; use as ``raise retry_task(self, ...)``.
+
+    ``kwargs`` replaces the task's keyword arguments for the retry. Eager
+    retries would re-run the task at once in the calling thread, so local
+    tasks are resubmitted to the executor instead.
+    """
+    request = task.request
+    kwargs = request.kwargs if kwargs is None else kwargs
+    if not runs_locally(request):
+        return task.retry(kwargs=kwargs, countdown=countdown)
+    executor = get_local_executor()
+    if executor is None:
+        return task.retry(kwargs=kwargs, countdown=countdown)
+    try:
+        executor.submit(
+            task, request.args, kwargs,
+            countdown=countdown, headers=request.headers, retries=request.retries + 1, task_id=request.id,
+        )
+    except RuntimeError:
+        pass  # Shutting down; the call went to the abandon handler.
+    return Ignore()
+
+
+class LocalTask(DjangoTask):
+    """Task class that sends work to the local executor when it is enabled."""
+
+    def apply_async(self, args=None, kwargs=None, task_id=None, producer=None, link=None, link_error=None,
+                    shadow=None, **options):
+        executor = get_local_executor()
+        if executor is None:
+            return super().apply_async(
+                args, kwargs, task_id=task_id, producer=producer, link=link, link_error=link_error,
+                shadow=shadow, **options,
+            )
+        task_id = task_id or uuid()
+        executor.submit(
+            self, args, kwargs,
+            countdown=options.get('countdown'),
+            headers=options.get('headers'),
+            retries=options.get('retries', 0),
+            task_id=task_id,
+        )
+        return self.AsyncResult(task_id)
@@ -0,0 +1,81 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Time spent handling a request, by view.',
+    ['view', 'method'],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_TOTAL = Counter(
+    'http_requests_total',
+    'Requests handled, by view and response status.',
+    ['view', 'method', 'status'],
+)
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'Database queries issued per request, by view.',
+    ['view', 'method'],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_DURATION = Histogram(
+    'http_request_db_duration_seconds',
+    'Time spent in database queries per request, by view.',
+    ['view', 'method'],
+    buckets=LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'Response body size, by view. Streaming responses are not counted.',
+    ['view', 'method'],
+    buckets=SIZE_BUCKETS,
+)
+
+TASK_QUEUE_LATENCY = Histogram(
+    'celery_task_queue_latency_seconds',
+    'Time between a task being enqueued and a worker starting it.',
+    ['task', 'platform'],
+    buckets=LATENCY_BUCKETS + (30.0, 60.0, 300.0),
+)
+TASK_DURATION = Histogram(
+    'celery_task_duration_seconds',
+    'Time spent running a task, by task and platform.',
+    ['task', 'platform'],
+    buckets=LATENCY_BUCKETS + (30.0, 60.0, 300.0),
+)
+TASK_OUTCOMES = Counter(
+    'celery_task_outcomes_total',
+    'Finished task runs by outcome (success, failure, retry).',
+    ['task', 'platform', 'outcome'],
+)
+
+
+def metrics_registry():
+    """Return the registry to export.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set, every web and worker process writes
+    its samples to that directory and the registry aggregates all of them.
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_metrics():
+    """Return the Prometheus text exposition and its content type."""
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
@@ -0,0 +1,58 @@
+import time
+from contextlib import ExitStack
+
+from django.db import connections
+
+from apps.common.metrics import (
+    REQUEST_DB_DURATION,
+    REQUEST_DB_QUERIES,
+    REQUEST_LATENCY,
+    REQUESTS_TOTAL,
+    RESPONSE_SIZE,
+)
+
+
+class _QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class RequestMetricsMiddleware:
+    """Record latency, database usage and response size for every resolved view."""
+
+    excluded_views = {'metrics'}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = _QueryTimer()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            start = time.perf_counter()
+            response = self.get_response(request)
+            elapsed = time.perf_counter() - start
+
+        match = request.resolver_match
+        view = match.view_name if match else 'unresolved'
+        if view in self.excluded_views:
+            return response
+
+        method = request.method
+        REQUEST_LATENCY.labels(view, method).observe(elapsed)
+        REQUESTS_TOTAL.labels(view, method, str(response.status_code)).inc()
+        REQUEST_DB_QUERIES.labels(view, method).observe(timer.count)
+        REQUEST_DB_DURATION.labels(view, method).observe(timer.duration)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(view, method).observe(len(response.content))
+        return response
@@ -0,0 +1,54 @@
+import os
+import time
+
+from celery import signals
+from prometheus_client import start_http_server
+
+from apps.common.metrics import TASK_DURATION, TASK_OUTCOMES, TASK_QUEUE_LATENCY, metrics_registry
+
+UNKNOWN_PLATFORM = 'none'
+
+_started_at = {}
+
+
+def _header(task, name):
+    value = getattr(task.request, name, None)
+    if value is None:
+        value = (task.request.headers or {}).get(name)
+    return value
+
+
+def _platform(task):
+    return _header(task, 'platform') or UNKNOWN_PLATFORM
+
+
+@signals.before_task_publish.connect
+def record_enqueue_time(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault('enqueued_at', time.time())
+
+
+@signals.task_prerun.connect
+def record_task_start(task_id=None, task=None, **kwargs):
+    now = time.time()
+    _started_at[task_id] = time.perf_counter()
+    enqueued_at = _header(task, 'enqueued_at')
+    if enqueued_at is not None:
+        TASK_QUEUE_LATENCY.labels(task.name, _platform(task)).observe(max(now - float(enqueued_at), 0.0))
+
+
+@signals.task_postrun.connect
+def record_task_finish(task_id=None, task=None, state=None, **kwargs):
+    started = _started_at.pop(task_id, None)
+    platform = _platform(task)
+    if started is not None:
+        TASK_DURATION.labels(task.name, platform).observe(time.perf_counter() - started)
+    TASK_OUTCOMES.labels(task.name, platform, (state or 'unknown').lower()).inc()
+
+
+@signals.worker_init.connect
+def start_metrics_server(**kwargs):
+    # Workers have no web server of their own; expose the same registry on a port.
+    port = os.environ.get('CELERY_METRICS_PORT')
+    if port:
+        start_http_server(int(port), registry=metrics_registry())
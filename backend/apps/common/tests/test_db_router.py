@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.common.db_router import ReadReplicaRouter, read_from_replica
+from apps.posts.models import Post
+
+User = get_user_model()
+
+# A second local database from the development settings; nothing copies rows
+# to it, so reads routed there cannot see what a test wrote to ``default``.
+REPLICA = 'local_replica'
+
+
+class ReadReplicaRouterTest(TestCase):
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+
+    def test_reads_stay_on_default_outside_replica_block(self):
+        self.assertIsNone(self.router.db_for_read(Post))
+
+    @override_settings(DATABASE_REPLICA_ALIAS='missing')
+    def test_unconfigured_replica_is_ignored(self):
+        with read_from_replica():
+            self.assertIsNone(self.router.db_for_read(Post))
+
+    @override_settings(DATABASE_REPLICA_ALIAS=REPLICA)
+    def test_reads_inside_replica_block_use_replica_alias(self):
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_read(Post), REPLICA)
+        self.assertIsNone(self.router.db_for_read(Post))
+
+    def test_writes_always_use_default(self):
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_write(Post), 'default')
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=REPLICA)
+class ReplicaRoutingTest(TransactionTestCase):
+    databases = {'default', REPLICA}
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+
+    def test_post_list_reads_from_replica(self):
+        response = self.client.get('/api/posts/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
+
+    def test_post_detail_sees_the_callers_writes(self):
+        with CaptureQueriesContext(connections[REPLICA]) as replica_queries:
+            response = self.client.get(f'/api/posts/{self.post.id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(replica_queries.captured_queries)
+
+    def test_publish_stays_on_default(self):
+        with CaptureQueriesContext(connections[REPLICA]) as replica_queries:
+            response = self.client.post(f'/api/posts/{self.post.id}/publish')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(replica_queries.captured_queries)
@@ -0,0 +1,153 @@
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from apps.common.local_tasks import LocalTaskExecutor, _abandon_handlers, _register_drain, abandon_handler
+from apps.integrations.models import Platform, SocialAccount
+from apps.integrations.services.publish_client import PublishResult
+from apps.posts.models import Post, PostTarget, PublishOutboxEntry
+from apps.posts.tasks import publish_target
+
+User = get_user_model()
+
+
+@override_settings(
+    PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT=1,
+    PUBLISH_ACCOUNT_RETRY_DELAY=0.01,
+)
+class LocalTaskExecutorTest(TransactionTestCase):
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.publish.return_value = PublishResult(ok=True)
+        client_patcher = mock.patch('apps.posts.tasks.get_publish_client', return_value=self.client)
+        client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+        # The in-memory SQLite test database locks whole tables, so one pool
+        # thread keeps tasks from colliding with each other.
+        self.executor = LocalTaskExecutor(max_workers=1, max_pending=10)
+        self.addCleanup(self.executor.drain, 5)
+        patcher = mock.patch('apps.common.local_tasks.get_local_executor', return_value=self.executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+
+    def _target(self):
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        return PostTarget.objects.create(post=post, social_account=self.account, status=PostTarget.Status.QUEUED)
+
+    def test_delay_returns_before_the_task_runs(self):
+        target = self._target()
+
+        publish_target.delay(target.id)
+        self.assertEqual(PostTarget.objects.get(id=target.id).status, PostTarget.Status.QUEUED)
+
+        self.assertEqual(self.executor.drain(5), 0)
+        self.assertEqual(PostTarget.objects.get(id=target.id).status, PostTarget.Status.PUBLISHED)
+
+    @override_settings(PUBLISH_ACCOUNT_ORDER_MAX_RETRIES=3)
+    def test_busy_account_retries_on_the_pool(self):
+        earlier = self._target()
+        target = self._target()
+
+        # The earlier target is never sent, so this one waits its turn on the
+        # scheduler until creation order is given up.
+        publish_target.delay(target.id)
+
+        self.assertEqual(self.executor.drain(5), 0)
+        self.assertEqual(PostTarget.objects.get(id=target.id).status, PostTarget.Status.PUBLISHED)
+        self.assertEqual(PostTarget.objects.get(id=earlier.id).status, PostTarget.Status.QUEUED)
+        self.assertEqual(self.client.publish.call_count, 1)
+
+    def test_drain_abandons_work_after_timeout(self):
+        target = self._target()
+        publish_target.apply_async((target.id,), countdown=60)
+
+        with self.assertLogs('apps.common.local_tasks', 'WARNING'):
+            self.assertEqual(self.executor.drain(0.05), 1)
+        self.assertEqual(PostTarget.objects.get(id=target.id).status, PostTarget.Status.QUEUED)
+        # The dropped publish goes back to the outbox for the next relay.
+        self.assertEqual(list(PublishOutboxEntry.objects.values_list('post_target_id', flat=True)), [target.id])
+        with self.assertRaises(RuntimeError), self.assertLogs('apps.common.local_tasks', 'ERROR'):
+            publish_target.delay(target.id)
+
+
+EXIT_SCRIPT = textwrap.dedent("""
+    import django
+    django.setup()
+
+    from django.conf import settings
+    from apps.common.local_tasks import get_local_executor
+
+    class Result:
+        def failed(self):
+            return False
+
+    class Task:
+        name = 'probe'
+
+        def apply(self, args, kwargs, **options):
+            print('ran', *args, flush=True)
+            return Result()
+
+    settings.LOCAL_TASK_EXECUTION = True
+    get_local_executor().submit(Task(), (1,), countdown=0.2)
+""")
+
+
+class BlockingTask:
+    name = 'tests.blocking'
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def apply(self, args, kwargs, **options):
+        self.release.wait(5)
+        return mock.Mock(failed=mock.Mock(return_value=False))
+
+
+class LocalTaskDrainTest(SimpleTestCase):
+    def test_queued_calls_cancelled_by_drain_are_abandoned(self):
+        task = BlockingTask()
+        abandoned = []
+        abandon_handler(task.name)(lambda args, kwargs, headers: abandoned.append(args))
+        self.addCleanup(_abandon_handlers.pop, task.name)
+        executor = LocalTaskExecutor(max_workers=1, max_pending=10)
+        executor.submit(task, (1,))
+        executor.submit(task, (2,))
+
+        with self.assertLogs('apps.common.local_tasks', 'WARNING'):
+            self.assertEqual(executor.drain(0.05), 2)
+        task.release.set()
+
+        self.assertEqual(abandoned, [(2,)])
+
+    def test_falls_back_to_atexit_without_the_threading_hook(self):
+        drain = mock.Mock()
+        with mock.patch.dict(threading.__dict__), mock.patch('atexit.register') as register:
+            del threading._register_atexit
+            _register_drain(drain, 5)
+
+        register.assert_called_once_with(drain, 5)
+
+
+class LocalTaskExitTest(SimpleTestCase):
+    def test_exit_runs_pending_countdown_tasks(self):
+        result = subprocess.run(
+            [sys.executable, '-c', EXIT_SCRIPT],
+            cwd=Path(settings.BASE_DIR) / 'backend',
+            env={'DJANGO_SETTINGS_MODULE': 'config.settings', 'PATH': ''},
+            capture_output=True, text=True, timeout=30,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, 'ran 1\n')
+        self.assertNotIn('Dropped', result.stderr)
@@ -0,0 +1,54 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from apps.posts.models import Post
+
+User = get_user_model()
+
+
+class RequestMetricsMiddlewareTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_records_viewset_action_metrics(self):
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        labels = {'view': 'posts:posts-publish', 'method': 'POST'}
+        before = self._sample('http_request_duration_seconds_count', **labels)
+        queries_before = self._sample('http_request_db_queries_sum', **labels)
+
+        response = self.client.post(f'/api/posts/{post.id}/publish')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._sample('http_request_duration_seconds_count', **labels), before + 1)
+        self.assertGreater(self._sample('http_request_db_queries_sum', **labels), queries_before)
+        self.assertGreater(self._sample('http_response_size_bytes_sum', **labels), 0)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_endpoint_renders_prometheus_text(self):
+        self.client.get('/api/capabilities/', {'content_type': 'TEXT'})
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(b'http_request_duration_seconds_bucket{', response.content)
+        self.assertIn(b'view="capabilities:capabilities"', response.content)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_endpoint_requires_the_token_or_a_staff_user(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+
+        staff = User.objects.create_user(username='staff', password='testpass', is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    def test_metrics_endpoint_is_closed_without_a_token(self):
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer ').status_code, 403)
@@ -0,0 +1,50 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+from apps.posts.tasks import publish_target
+
+User = get_user_model()
+
+TASK_NAME = 'apps.posts.tasks.publish_target'
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TaskMetricsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_publish_records_duration_and_outcome_per_platform(self):
+        account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        PostTarget.objects.create(post=post, social_account=account)
+        runs_before = _sample('celery_task_duration_seconds_count', task=TASK_NAME, platform='x')
+        successes_before = _sample('celery_task_outcomes_total', task=TASK_NAME, platform='x', outcome='success')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/posts/{post.id}/publish')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_sample('celery_task_duration_seconds_count', task=TASK_NAME, platform='x'), runs_before + 1)
+        self.assertEqual(
+            _sample('celery_task_outcomes_total', task=TASK_NAME, platform='x', outcome='success'),
+            successes_before + 1,
+        )
+
+    def test_queue_latency_uses_enqueue_header(self):
+        latency_before = _sample('celery_task_queue_latency_seconds_sum', task=TASK_NAME, platform='youtube')
+
+        publish_target.apply((1,), headers={'platform': 'youtube', 'enqueued_at': time.time() - 5})
+
+        latency = _sample('celery_task_queue_latency_seconds_sum', task=TASK_NAME, platform='youtube') - latency_before
+        self.assertGreaterEqual(latency, 5)
@@ -0,0 +1,100 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.common.checks import check_throttle_cache
+from apps.common.throttling import SlidingWindowThrottle
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+
+User = get_user_model()
+
+RATES = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {'composer': '3/min', 'publish': '2/min'}}
+
+
+@override_settings(REST_FRAMEWORK=RATES)
+class SlidingWindowThrottleTest(TestCase):
+    validate_url = '/api/capabilities/validate'
+
+    def setUp(self):
+        cache.clear()
+        self.now = 600.0
+        patcher = mock.patch.object(SlidingWindowThrottle, 'timer', lambda _: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _validate(self):
+        return self.client.post(self.validate_url, {'content_type': 'TEXT', 'caption': 'Hi'}, format='json')
+
+    def test_limits_composer_endpoint_with_retry_after(self):
+        for _ in range(3):
+            self.assertEqual(self._validate().status_code, 200)
+
+        response = self._validate()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '61')
+
+    def test_previous_window_decays(self):
+        for _ in range(3):
+            self._validate()
+
+        # Halfway through the next window the previous three count as 1.5.
+        self.now += 90
+        self.assertEqual(self._validate().status_code, 200)
+        self.assertEqual(self._validate().status_code, 200)
+        response = self._validate()
+        self.assertEqual(response.status_code, 429)
+        # 1.5 + 2 stays at or above 3 until the previous share falls below 1.
+        self.assertEqual(response['Retry-After'], '11')
+
+        self.now += 11
+        self.assertEqual(self._validate().status_code, 200)
+
+    def test_users_and_endpoints_are_limited_separately(self):
+        for _ in range(3):
+            self._validate()
+        self.assertEqual(self._validate().status_code, 429)
+
+        self.assertEqual(self.client.get('/api/capabilities/', {'content_type': 'TEXT'}).status_code, 200)
+        other = User.objects.create_user(username='other', password='testpass')
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self._validate().status_code, 200)
+
+    def test_publish_has_its_own_rate(self):
+        account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        PostTarget.objects.create(post=post, social_account=account)
+
+        statuses = [self.client.post(f'/api/posts/{post.id}/publish').status_code for _ in range(3)]
+
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(self.client.get('/api/posts/').status_code, 200)
+
+    @override_settings(REST_FRAMEWORK={**RATES, 'DEFAULT_THROTTLE_RATES': {}})
+    def test_missing_rate_disables_scope(self):
+        for _ in range(5):
+            self.assertEqual(self._validate().status_code, 200)
+
+
+class ThrottleCacheCheckTest(SimpleTestCase):
+    @override_settings(REQUIRE_SHARED_CACHE=True, REST_FRAMEWORK=RATES)
+    def test_configured_scopes_need_a_shared_cache(self):
+        errors = check_throttle_cache(None)
+
+        self.assertEqual([error.id for error in errors], ['common.E001'])
+        self.assertIn('composer, publish', errors[0].msg)
+
+    def test_no_error_without_rates_or_for_single_process_installs(self):
+        no_rates = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {'composer': None}}
+        with override_settings(REQUIRE_SHARED_CACHE=True, REST_FRAMEWORK=no_rates):
+            self.assertEqual(check_throttle_cache(None), [])
+        with override_settings(REQUIRE_SHARED_CACHE=False, REST_FRAMEWORK=RATES):
+            self.assertEqual(check_throttle_cache(None), [])
@@ -0,0 +1,86 @@
+import math
+import time
+
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """Per-user, per-endpoint rate limit using a sliding-window counter in the shared cache.
+
+    Requests are counted in fixed windows; the rate is estimated as the
+    current window's count plus the previous window's count weighted by how
+    much of it still overlaps the sliding window. That costs one
+    ``get_many`` and one ``incr`` per allowed request, however high the rate.
+    Rates come from ``DEFAULT_THROTTLE_RATES[scope]`` (e.g. ``'30/min'``);
+    ``None`` disables the scope.
+    """
+
+    scope = None
+    cache = cache
+    timer = time.time
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def parse_rate(self, rate):
+        num, period = rate.split('/')
+        return int(num), {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[0]]
+
+    def get_cache_key(self, request, view):
+        user = request.user
+        ident = user.pk if user and user.is_authenticated else self.get_ident(request)
+        endpoint = request.resolver_match.view_name if request.resolver_match else request.path
+        return f'throttle:{self.scope}:{endpoint}:{ident}'
+
+    def allow_request(self, request, view):
+        rate = self.get_rate()
+        if rate is None:
+            return True
+        limit, window = self.parse_rate(rate)
+        now = self.timer()
+        current_window = int(now // window)
+        elapsed = (now % window) / window
+        key = self.get_cache_key(request, view)
+        current_key = f'{key}:{current_window}'
+        previous_key = f'{key}:{current_window - 1}'
+
+        counts = self.cache.get_many([previous_key, current_key])
+        previous = counts.get(previous_key, 0)
+        current = counts.get(current_key, 0)
+        if previous * (1 - elapsed) + current >= limit:
+            self.wait_seconds = self._wait(limit, window, elapsed, previous, current)
+            return False
+
+        # Keys outlive their window so the next window can weigh them.
+        if not self.cache.add(current_key, 1, timeout=window * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, timeout=window * 2)
+        return True
+
+    def _wait(self, limit, window, elapsed, previous, current):
+        if current < limit:
+            # The previous window's share has to decay enough to fit one more request.
+            fraction = (1 - elapsed) - (limit - current) / previous
+        else:
+            # Wait for the next window, then for this window's share to decay.
+            fraction = (1 - elapsed) + (1 - limit / current)
+        # The estimate must drop strictly below the limit, hence the extra second.
+        return max(1, math.floor(fraction * window) + 1)
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ComposerThrottle(SlidingWindowThrottle):
+    scope = 'composer'
+
+
+class PublishThrottle(SlidingWindowThrottle):
+    scope = 'publish'
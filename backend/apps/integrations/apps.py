@@ -4,3 +4,6 @@
 class IntegrationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.integrations'
+
+    def ready(self):
+        from apps.integrations import signals  # noqa: F401
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.integrations.services.health_service import refresh_account_health
+
+
+class Command(BaseCommand):
+    help = 'Refresh SocialAccount availability flags from the platforms.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Check every account, not only stale ones.')
+        parser.add_argument('--batch-size', type=int)
+        parser.add_argument('--workers', type=int)
+
+    def handle(self, *args, **options):
+        result = refresh_account_health(
+            batch_size=options['batch_size'],
+            max_workers=options['workers'],
+            stale_after=timedelta(0) if options['all'] else None,
+        )
+        self.stdout.write(f'Checked {result.checked} account(s), {result.changed} changed, {result.failed} failed.')
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='socialaccount',
+            name='last_checked_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -20,6 +20,8 @@ class SocialAccount(models.Model):
 
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     platform = models.CharField(max_length=20, choices=Platform.choices)
+    # The platform's own id for the account; the natural key for bulk sync.
+    external_id = models.CharField(max_length=255, null=True, blank=True)
     display_name = models.CharField(max_length=255)
     account_type = models.CharField(max_length=64, choices=AccountType.choices, blank=True)
     permissions_valid = models.BooleanField(default=False)
@@ -28,7 +30,12 @@ class SocialAccount(models.Model):
     linkedin_access_granted = models.BooleanField(default=False)
     x_media_upload_enabled = models.BooleanField(default=False)
     x_api_tier = models.CharField(max_length=64, blank=True)
+    # Set by the health check job (services.health_service) when the flags above were last refreshed.
+    last_checked_at = models.DateTimeField(null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        unique_together = ('user', 'platform', 'external_id')
+
     def __str__(self):
         return f'{self.platform}:{self.display_name}'
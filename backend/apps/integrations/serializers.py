@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+
+from apps.integrations.models import Platform, SocialAccount
+
+
+class AccountSyncItemSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField()
+    platform = serializers.ChoiceField(choices=Platform.choices)
+    external_id = serializers.CharField(max_length=255)
+    display_name = serializers.CharField(max_length=255, required=False)
+    account_type = serializers.ChoiceField(choices=SocialAccount.AccountType.choices, required=False, allow_blank=True)
+    permissions_valid = serializers.BooleanField(required=False)
+    tiktok_photo_post_enabled = serializers.BooleanField(required=False)
+    tiktok_prerequisites_met = serializers.BooleanField(required=False)
+    linkedin_access_granted = serializers.BooleanField(required=False)
+    x_media_upload_enabled = serializers.BooleanField(required=False)
+    x_api_tier = serializers.CharField(max_length=64, required=False, allow_blank=True)
+
+
+class AccountSyncSerializer(serializers.Serializer):
+    accounts = AccountSyncItemSerializer(many=True, allow_empty=False)
+
+    def validate_accounts(self, accounts):
+        if len(accounts) > settings.ACCOUNT_SYNC_MAX_ITEMS:
+            raise serializers.ValidationError(f'At most {settings.ACCOUNT_SYNC_MAX_ITEMS} accounts per request.')
+        user_ids = {item['user_id'] for item in accounts}
+        known = set(get_user_model().objects.filter(id__in=user_ids).values_list('id', flat=True))
+        if user_ids - known:
+            raise serializers.ValidationError(f'Unknown user ids: {sorted(user_ids - known)}.')
+        return accounts
@@ -0,0 +1,33 @@
+from .account_sync import (
+    AccountSyncResult,
+    sync_social_accounts,
+)
+from .health_service import (
+    HEALTH_FIELDS,
+    FakeHealthChecker,
+    HealthChecker,
+    get_health_checker,
+    refresh_account_health,
+)
+from .publish_client import (
+    FakePublishClient,
+    HttpPublishClient,
+    PublishClient,
+    PublishResult,
+    get_publish_client,
+)
+
+__all__ = [
+    'HEALTH_FIELDS',
+    'AccountSyncResult',
+    'FakeHealthChecker',
+    'FakePublishClient',
+    'HealthChecker',
+    'HttpPublishClient',
+    'PublishClient',
+    'PublishResult',
+    'get_health_checker',
+    'get_publish_client',
+    'refresh_account_health',
+    'sync_social_accounts',
+]
@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+
+from apps.capabilities.services.availability_cache import invalidate_availability
+from apps.integrations.models import SocialAccount
+from apps.integrations.services.health_service import HEALTH_FIELDS
+
+NATURAL_KEY = ['user', 'platform', 'external_id']
+# Fields the account-connection service owns.
+SYNC_FIELDS = ['display_name', 'account_type', *HEALTH_FIELDS]
+
+
+@dataclass
+class AccountSyncResult:
+    created: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    unchanged: int = 0
+
+
+def _key(item):
+    return item['user_id'], item['platform'], item['external_id']
+
+
+def sync_social_accounts(items, batch_size=1000):
+    """Upsert accounts on (user, platform, external_id) and report what changed.
+
+    ``items`` are dicts with ``user_id``, ``platform``, ``external_id`` and any
+    of ``SYNC_FIELDS``; omitted fields keep their stored value (or the model
+    default for new accounts). Only new or changed rows are written, with
+    ``bulk_create(update_conflicts=True)``, and cached availability is
+    invalidated once per affected user.
+    """
+    incoming = {_key(item): item for item in items}
+    existing = _existing_accounts(incoming, batch_size)
+
+    rows = []
+    created_keys = []
+    updated = []
+    result = AccountSyncResult()
+    for key, item in incoming.items():
+        account = existing.get(key)
+        values = {name: item[name] for name in SYNC_FIELDS if name in item}
+        if account is None:
+            created_keys.append(key)
+        else:
+            changed = [name for name, value in values.items() if getattr(account, name) != value]
+            if not changed:
+                result.unchanged += 1
+                continue
+            values = {**{name: getattr(account, name) for name in SYNC_FIELDS}, **values}
+            updated.append((account, changed))
+        user_id, platform, external_id = key
+        rows.append(SocialAccount(user_id=user_id, platform=platform, external_id=external_id, **values))
+
+    SocialAccount.objects.bulk_create(
+        rows,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=NATURAL_KEY,
+        update_fields=SYNC_FIELDS,
+    )
+
+    if created_keys:
+        created = _existing_accounts(dict.fromkeys(created_keys), batch_size)
+        result.created = [_describe(created[key]) for key in created_keys if key in created]
+    result.updated = [{**_describe(account), 'changed': changed} for account, changed in updated]
+    invalidate_availability({key[0] for key in created_keys} | {account.user_id for account, _ in updated})
+    return result
+
+
+def _existing_accounts(keys, batch_size):
+    """Load the accounts for ``keys`` in batches, keyed like ``_key``."""
+    keys = list(keys)
+    accounts = {}
+    for offset in range(0, len(keys), batch_size):
+        chunk = keys[offset:offset + batch_size]
+        wanted = set(chunk)
+        queryset = SocialAccount.objects.filter(
+            user_id__in={key[0] for key in chunk},
+            platform__in={key[1] for key in chunk},
+            external_id__in={key[2] for key in chunk},
+        ).only('id', 'user_id', 'platform', 'external_id', *SYNC_FIELDS)
+        for account in queryset:
+            key = (account.user_id, account.platform, account.external_id)
+            if key in wanted:
+                accounts[key] = account
+    return accounts
+
+
+def _describe(account):
+    return {
+        'id': account.id,
+        'user_id': account.user_id,
+        'platform': account.platform,
+        'external_id': account.external_id,
+    }
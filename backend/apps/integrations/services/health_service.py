@@ -0,0 +1,129 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.capabilities.services.availability_cache import invalidate_availability
+from apps.integrations.models import SocialAccount
+
+logger = logging.getLogger(__name__)
+
+# Availability flags that the health check owns.
+HEALTH_FIELDS = [
+    'permissions_valid',
+    'tiktok_photo_post_enabled',
+    'tiktok_prerequisites_met',
+    'linkedin_access_granted',
+    'x_media_upload_enabled',
+    'x_api_tier',
+]
+
+
+@dataclass
+class HealthRefreshResult:
+    checked: int = 0
+    changed: int = 0
+    failed: int = 0
+
+
+class HealthChecker:
+    """Asks a platform for the current state of one account.
+
+    ``check`` returns a dict with any of ``HEALTH_FIELDS``; fields left out
+    keep their stored value. It is called from worker threads and must not
+    touch the database.
+    """
+
+    def check(self, account):
+        raise NotImplementedError
+
+
+class FakeHealthChecker(HealthChecker):
+    """Local stand-in for platform APIs.
+
+    Returns ``overrides[account.id]`` (or nothing, keeping the stored flags)
+    after an optional simulated ``latency`` in seconds.
+    """
+
+    def __init__(self, overrides=None, latency=0.0):
+        self.overrides = overrides or {}
+        self.latency = latency
+
+    def check(self, account):
+        if self.latency:
+            time.sleep(self.latency)
+        return dict(self.overrides.get(account.id, {}))
+
+
+def get_health_checker():
+    return import_string(settings.SOCIAL_ACCOUNT_HEALTH_CHECKER)()
+
+
+def refresh_account_health(checker=None, batch_size=None, max_workers=None, stale_after=None):
+    """Refresh the availability flags of every account not checked within ``stale_after``.
+
+    Accounts are processed oldest-check first, ``batch_size`` at a time, with
+    up to ``max_workers`` checks in flight. Each batch is written back with
+    one ``bulk_update``. Accounts whose check fails keep their flags and
+    ``last_checked_at`` so the next run retries them.
+    """
+    checker = checker or get_health_checker()
+    batch_size = batch_size or settings.SOCIAL_ACCOUNT_HEALTH_BATCH_SIZE
+    max_workers = max_workers or settings.SOCIAL_ACCOUNT_HEALTH_MAX_WORKERS
+    if stale_after is None:
+        stale_after = timedelta(seconds=settings.SOCIAL_ACCOUNT_HEALTH_INTERVAL)
+
+    started_at = timezone.now()
+    due = Q(last_checked_at__isnull=True) | Q(last_checked_at__lt=started_at - stale_after)
+    result = HealthRefreshResult()
+    failed_ids = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            queryset = SocialAccount.objects.filter(due).order_by(F('last_checked_at').asc(nulls_first=True), 'id')
+            if failed_ids:
+                # Failed accounts stay due; skip them for the rest of this run.
+                queryset = queryset.exclude(id__in=failed_ids)
+            accounts = list(queryset.only('id', 'user_id', 'platform', 'last_checked_at', *HEALTH_FIELDS)[:batch_size])
+            if not accounts:
+                break
+            checked = []
+            changed_user_ids = set()
+            for account, outcome in zip(accounts, executor.map(_safe_check(checker), accounts)):
+                if outcome is None:
+                    failed_ids.add(account.id)
+                    continue
+                if _apply(account, outcome):
+                    result.changed += 1
+                    changed_user_ids.add(account.user_id)
+                account.last_checked_at = started_at
+                checked.append(account)
+            SocialAccount.objects.bulk_update(checked, HEALTH_FIELDS + ['last_checked_at'])
+            invalidate_availability(changed_user_ids)
+            result.checked += len(checked)
+    result.failed = len(failed_ids)
+    return result
+
+
+def _safe_check(checker):
+    def check(account):
+        try:
+            return checker.check(account)
+        except Exception:
+            logger.exception('Health check failed for social account %s', account.id)
+            return None
+    return check
+
+
+def _apply(account, outcome):
+    changed = False
+    for field in HEALTH_FIELDS:
+        if field in outcome and getattr(account, field) != outcome[field]:
+            setattr(account, field, outcome[field])
+            changed = True
+    return changed
@@ -0,0 +1,88 @@
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+@dataclass
+class PublishResult:
+    ok: bool
+    error: str = ''
+    # Transient failures (unreachable platform, 5xx, 429) are worth retrying.
+    retryable: bool = False
+
+# HTTP statuses that mean "try again later" rather than "this post was refused".
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class PublishClient:
+    """Sends one post target to its platform.
+
+    ``publish`` receives a ``PostTarget`` with ``post`` and ``social_account``
+    loaded, and the caption rendered for the account's platform, and returns a
+    ``PublishResult``. Transport failures should be reported as a failed
+    result rather than raised.
+    """
+
+    def publish(self, target, caption):
+        raise NotImplementedError
+
+
+class FakePublishClient(PublishClient):
+    """Local stand-in for platform APIs: accepts everything after ``latency`` seconds."""
+
+    def __init__(self, latency=0.0, error_rate=0.0):
+        self.latency = latency
+        self.error_rate = error_rate
+
+    def publish(self, target, caption):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error_rate and random.random() < self.error_rate:
+            return PublishResult(ok=False, error='Simulated platform error.')
+        return PublishResult(ok=True)
+
+
+class HttpPublishClient(PublishClient):
+    """Posts targets to ``<base_url>/<platform>/publish`` as JSON.
+
+    Used against the fake platform server in ``apps.integrations.fake_platform``;
+    any non-2xx answer or transport error is a failed publish. Transport errors
+    and ``RETRYABLE_STATUSES`` are marked retryable.
+    """
+
+    def __init__(self, base_url=None, timeout=None):
+        self.base_url = (base_url or settings.PUBLISH_CLIENT_BASE_URL).rstrip('/')
+        self.timeout = timeout or settings.PUBLISH_CLIENT_TIMEOUT
+
+    def publish(self, target, caption):
+        platform = target.social_account.platform
+        body = json.dumps({
+            'post_target_id': target.id,
+            'account': target.social_account_id,
+            'caption': caption,
+        }).encode()
+        request = urllib.request.Request(
+            f'{self.base_url}/{platform}/publish',
+            data=body,
+            headers={'Content-Type': 'application/json'},
+            method='POST',
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                return PublishResult(ok=True)
+        except urllib.error.HTTPError as exc:
+            return PublishResult(
+                ok=False, error=f'Platform answered {exc.code}.', retryable=exc.code in RETRYABLE_STATUSES,
+            )
+        except OSError as exc:
+            return PublishResult(ok=False, error=f'Platform unreachable: {exc}.', retryable=True)
+
+
+def get_publish_client():
+    return import_string(settings.PUBLISH_CLIENT)()
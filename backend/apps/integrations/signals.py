@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.capabilities.services.availability_cache import invalidate_availability
+from apps.integrations.models import SocialAccount
+
+
+@receiver(post_save, sender=SocialAccount)
+@receiver(post_delete, sender=SocialAccount)
+def invalidate_account_availability(sender, instance, raw=False, **kwargs):
+    # Bulk writes bypass this; services.account_sync and services.health_service
+    # invalidate once per affected user instead.
+    if raw:
+        return
+    invalidate_availability([instance.user_id])
@@ -0,0 +1,10 @@
+from dataclasses import asdict
+
+from celery import shared_task
+
+from apps.integrations.services.health_service import refresh_account_health
+
+
+@shared_task
+def refresh_social_account_health():
+    return asdict(refresh_account_health())
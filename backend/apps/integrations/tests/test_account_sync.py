@@ -0,0 +1,94 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.capabilities.services.availability_cache import cached_availability
+from apps.integrations.models import Platform, SocialAccount
+
+User = get_user_model()
+
+
+class AccountSyncViewTest(TestCase):
+    url = '/api/integrations/accounts/sync'
+
+    def setUp(self):
+        cache.clear()
+        self.staff = User.objects.create_user(username='sync', password='testpass', is_staff=True)
+        self.users = [User.objects.create_user(username=f'user{index}', password='testpass') for index in range(3)]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.staff)
+
+    def _item(self, user, external_id, **fields):
+        return {'user_id': user.id, 'platform': 'linkedin', 'external_id': external_id, 'display_name': 'Page', **fields}
+
+    def test_creates_updates_and_skips_unchanged(self):
+        existing = SocialAccount.objects.create(
+            user=self.users[0], platform=Platform.LINKEDIN, external_id='li-1', display_name='Page',
+        )
+        untouched = SocialAccount.objects.create(
+            user=self.users[1], platform=Platform.LINKEDIN, external_id='li-2', display_name='Page',
+        )
+
+        response = self.client.post(self.url, {'accounts': [
+            self._item(self.users[0], 'li-1', linkedin_access_granted=True),
+            self._item(self.users[1], 'li-2'),
+            self._item(self.users[2], 'li-3', permissions_valid=True),
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['unchanged'], 1)
+        self.assertEqual(
+            response.data['updated'],
+            [{'id': existing.id, 'user_id': self.users[0].id, 'platform': 'linkedin', 'external_id': 'li-1',
+              'changed': ['linkedin_access_granted']}],
+        )
+        created = SocialAccount.objects.get(external_id='li-3')
+        self.assertEqual([item['id'] for item in response.data['created']], [created.id])
+        self.assertTrue(created.permissions_valid)
+        existing.refresh_from_db()
+        self.assertTrue(existing.linkedin_access_granted)
+        self.assertEqual(SocialAccount.objects.get(id=untouched.id).display_name, 'Page')
+
+    def test_omitted_fields_keep_stored_values(self):
+        SocialAccount.objects.create(
+            user=self.users[0], platform=Platform.X, external_id='x-1', display_name='X', x_api_tier='pro',
+        )
+
+        self.client.post(self.url, {'accounts': [
+            {'user_id': self.users[0].id, 'platform': 'x', 'external_id': 'x-1', 'x_media_upload_enabled': True},
+        ]}, format='json')
+
+        account = SocialAccount.objects.get(external_id='x-1')
+        self.assertEqual((account.display_name, account.x_api_tier, account.x_media_upload_enabled), ('X', 'pro', True))
+
+    def test_query_count_does_not_grow_with_accounts(self):
+        items = [self._item(user, f'li-{user.id}-{index}') for user in self.users for index in range(20)]
+
+        # existing lookup, user check, upsert, created ids read back.
+        with self.assertNumQueries(4):
+            response = self.client.post(self.url, {'accounts': items}, format='json')
+
+        self.assertEqual(len(response.data['created']), 60)
+
+    def test_invalidates_cached_availability_of_affected_users(self):
+        self.assertFalse(next(
+            item for item in cached_availability(self.users[0], 'TEXT') if item['platform'] == 'linkedin'
+        )['available'])
+
+        self.client.post(self.url, {'accounts': [
+            self._item(self.users[0], 'li-1', linkedin_access_granted=True),
+        ]}, format='json')
+
+        self.assertTrue(next(
+            item for item in cached_availability(self.users[0], 'TEXT') if item['platform'] == 'linkedin'
+        )['available'])
+
+    def test_requires_staff_and_known_users(self):
+        response = self.client.post(self.url, {'accounts': [
+            {'user_id': 999999, 'platform': 'x', 'external_id': 'x-1', 'display_name': 'X'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        self.client.force_authenticate(user=self.users[0])
+        self.assertEqual(self.client.post(self.url, {'accounts': []}, format='json').status_code, 403)
@@ -0,0 +1,51 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.integrations.fake_platform import FakePlatformServer
+from apps.integrations.models import Platform, SocialAccount
+from apps.integrations.services.publish_client import HttpPublishClient
+from apps.posts.models import Post, PostTarget
+
+User = get_user_model()
+
+
+class HttpPublishClientTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='testuser', password='testpass')
+        post = Post.objects.create(user=user, content_type=Post.ContentType.TEXT, caption='Hello')
+        account = SocialAccount.objects.create(user=user, platform=Platform.X, display_name='X')
+        self.target = PostTarget.objects.create(post=post, social_account=account)
+
+    def test_publishes_against_fake_platform(self):
+        with FakePlatformServer() as server:
+            result = HttpPublishClient(base_url=server.url, timeout=5).publish(self.target, 'Hello\n\n#launch')
+
+        self.assertTrue(result.ok)
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(server.payloads[0]['caption'], 'Hello\n\n#launch')
+
+    def test_platform_errors_are_failed_results(self):
+        with FakePlatformServer(error_rate=1.0) as server:
+            result = HttpPublishClient(base_url=server.url, timeout=5).publish(self.target, 'Hello')
+
+        self.assertFalse(result.ok)
+        self.assertTrue(result.retryable)
+        self.assertEqual(result.error, 'Platform answered 503.')
+
+    def test_validation_errors_are_not_retryable(self):
+        with FakePlatformServer(error_rate=1.0, error_status=400) as server:
+            result = HttpPublishClient(base_url=server.url, timeout=5).publish(self.target, 'Hello')
+
+        self.assertFalse(result.ok)
+        self.assertFalse(result.retryable)
+        self.assertEqual(result.error, 'Platform answered 400.')
+
+    def test_unreachable_platform_is_a_failed_result(self):
+        server = FakePlatformServer().start()
+        server.stop()
+
+        result = HttpPublishClient(base_url=server.url, timeout=1).publish(self.target, 'Hello')
+
+        self.assertFalse(result.ok)
+        self.assertTrue(result.retryable)
+        self.assertTrue(result.error.startswith('Platform unreachable'))
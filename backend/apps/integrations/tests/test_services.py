@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.integrations.services.health_service import FakeHealthChecker, HealthChecker, refresh_account_health
+
+User = get_user_model()
+
+
+class FailingChecker(HealthChecker):
+    def check(self, account):
+        raise RuntimeError('platform unavailable')
+
+
+class AccountHealthRefreshTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.accounts = [
+            SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name=f'X {index}')
+            for index in range(5)
+        ]
+
+    def test_refreshes_flags_in_batches(self):
+        checker = FakeHealthChecker(overrides={self.accounts[0].id: {'x_media_upload_enabled': True}})
+
+        result = refresh_account_health(checker, batch_size=2, max_workers=4)
+
+        self.assertEqual((result.checked, result.changed, result.failed), (5, 1, 0))
+        self.accounts[0].refresh_from_db()
+        self.assertTrue(self.accounts[0].x_media_upload_enabled)
+        self.assertFalse(SocialAccount.objects.filter(last_checked_at__isnull=True).exists())
+
+    def test_skips_recently_checked_accounts(self):
+        SocialAccount.objects.filter(id=self.accounts[0].id).update(last_checked_at=timezone.now())
+
+        result = refresh_account_health(FakeHealthChecker(), stale_after=timedelta(hours=1))
+
+        self.assertEqual(result.checked, 4)
+
+    def test_failed_checks_keep_accounts_due(self):
+        with self.assertLogs('apps.integrations.services.health_service', 'ERROR'):
+            result = refresh_account_health(FailingChecker(), batch_size=2)
+
+        self.assertEqual((result.checked, result.failed), (0, 5))
+        self.assertEqual(SocialAccount.objects.filter(last_checked_at__isnull=True).count(), 5)
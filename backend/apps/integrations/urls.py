@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.integrations.views import AccountSyncView
+
+app_name = 'integrations'
+
+urlpatterns = [
+    path('accounts/sync', AccountSyncView.as_view(), name='accounts-sync'),
+]
@@ -0,0 +1,21 @@
+from dataclasses import asdict
+
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.integrations.serializers import AccountSyncSerializer
+from apps.integrations.services.account_sync import sync_social_accounts
+
+
+class AccountSyncView(APIView):
+    """Bulk upsert endpoint for the account-connection service (staff credentials)."""
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = AccountSyncSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = sync_social_accounts(serializer.validated_data['accounts'])
+        return Response(asdict(result), status=status.HTTP_200_OK)
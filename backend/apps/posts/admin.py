@@ -1,16 +1,54 @@
 from django.contrib import admin
-from apps.posts.models import Post, PostTarget
+from apps.common.admin import LargeTableAdmin
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget, PostTemplate
+from apps.posts.services.search import search_posts
 
 
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(LargeTableAdmin):
     list_display = ['id', 'user', 'content_type', 'created_at']
+    list_select_related = ['user']
     list_filter = ['content_type', 'created_at']
     search_fields = ['caption', 'user__username']
 
+    def get_search_results(self, request, queryset, search_term):
+        # Caption search goes through the full-text index instead of LIKE '%...%'.
+        if not search_term:
+            return queryset, False
+        matches = search_posts(queryset, search_term) | queryset.filter(user__username=search_term)
+        return matches, False
+
 
 @admin.register(PostTarget)
-class PostTargetAdmin(admin.ModelAdmin):
-    list_display = ['id', 'post', 'social_account', 'status', 'created_at']
-    list_filter = ['status', 'created_at']
+class PostTargetAdmin(LargeTableAdmin):
+    list_display = ['id', 'post', 'social_account', 'status', 'reason', 'created_at']
+    list_select_related = ['post', 'social_account']
+    list_filter = ['status', 'reason_code', 'created_at']
+
+
+@admin.register(PostTemplate)
+class PostTemplateAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'name', 'content_type', 'created_at']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
+    filter_horizontal = ['social_accounts']
+
+
+class ArchiveAdmin(LargeTableAdmin):
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ArchivedPost)
+class ArchivedPostAdmin(ArchiveAdmin):
+    list_display = ['id', 'user_id', 'content_type', 'created_at', 'archived_at']
+    list_filter = ['content_type', 'created_at']
+
 
+@admin.register(ArchivedPostTarget)
+class ArchivedPostTargetAdmin(ArchiveAdmin):
+    list_display = ['id', 'post_id', 'social_account_id', 'platform', 'status', 'reason', 'created_at']
+    list_filter = ['status', 'reason_code', 'platform', 'created_at']
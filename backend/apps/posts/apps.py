@@ -4,3 +4,10 @@
 class PostsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.posts'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        from apps.posts import signals
+
+        post_migrate.connect(signals.reinstall_search_index, sender=self)
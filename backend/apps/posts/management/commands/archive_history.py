@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.posts.services.archival import archive_cutoff, archive_post_targets, archive_posts
+
+
+class Command(BaseCommand):
+    help = 'Move published and rejected targets, and optionally old posts, into the archive tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ARCHIVE_AFTER_DAYS)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--posts', action='store_true', help='Also archive old posts whose targets have all been archived.')
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+        targets = archive_post_targets(cutoff, options['batch_size'])
+        self.stdout.write(f'Archived {targets} post target(s).')
+        if options['posts']:
+            posts = archive_posts(cutoff, options['batch_size'])
+            self.stdout.write(f'Archived {posts} post(s).')
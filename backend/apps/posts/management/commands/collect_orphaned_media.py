@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.posts.services.media_gc import collect_orphaned_media
+
+
+class Command(BaseCommand):
+    help = 'Delete media files that no post, template or archived post references.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.MEDIA_GC_BATCH_SIZE)
+        parser.add_argument(
+            '--grace-hours', type=float, default=settings.MEDIA_GC_GRACE_PERIOD / 3600,
+            help='Keep files modified more recently than this.',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report orphans without deleting them.')
+
+    def handle(self, *args, **options):
+        result = collect_orphaned_media(
+            grace=options['grace_hours'] * 3600,
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+        )
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(
+            f'Scanned {result.scanned} file(s): {result.referenced} referenced, '
+            f'{result.recent} within the grace period. {verb} {result.deleted} orphan(s).'
+        )
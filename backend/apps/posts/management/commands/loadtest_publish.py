@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.integrations.models import Platform
+from apps.posts.services.loadtest import run_publish_load_test
+
+
+class Command(BaseCommand):
+    help = 'Publish seeded posts through the API against a local fake platform and report throughput and latency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10)
+        parser.add_argument('--posts-per-user', type=int, default=10)
+        parser.add_argument(
+            '--platforms', default='x,linkedin',
+            help=f'Comma-separated platforms to target (from {", ".join(Platform.values)}).',
+        )
+        parser.add_argument('--workers', type=int, default=8, help='Publish worker threads.')
+        parser.add_argument('--latency-ms', type=float, default=50.0, help='Fake platform response time.')
+        parser.add_argument('--jitter-ms', type=float, default=0.0, help='Extra random response time, up to this much.')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of publishes the platform fails.')
+        parser.add_argument('--timeout', type=float, default=120.0, help='Seconds to wait for workers to finish.')
+        parser.add_argument(
+            '--account-limit', type=int,
+            help='Override PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT (0 = unlimited) to compare throughput.',
+        )
+        parser.add_argument('--retry-delay', type=float, help='Override PUBLISH_ACCOUNT_RETRY_DELAY, in seconds.')
+        parser.add_argument('--keep-data', action='store_true', help='Keep the seeded users, posts and targets.')
+
+    def handle(self, *args, **options):
+        platforms = [platform.strip() for platform in options['platforms'].split(',') if platform.strip()]
+        unknown = set(platforms) - set(Platform.values)
+        if not platforms or unknown:
+            raise CommandError(f'Unknown platforms: {", ".join(sorted(unknown)) or "none given"}.')
+        if not 0 <= options['error_rate'] <= 1:
+            raise CommandError('--error-rate must be between 0 and 1.')
+        if options['workers'] < 1:
+            raise CommandError('--workers must be at least 1.')
+
+        if connection.vendor == 'sqlite':
+            self.stderr.write('SQLite allows one writer at a time; expect lock errors and pessimistic numbers.')
+        report = run_publish_load_test(
+            users=options['users'],
+            posts_per_user=options['posts_per_user'],
+            platforms=platforms,
+            workers=options['workers'],
+            latency=options['latency_ms'] / 1000,
+            jitter=options['jitter_ms'] / 1000,
+            error_rate=options['error_rate'],
+            timeout=options['timeout'],
+            keep_data=options['keep_data'],
+            account_limit=options['account_limit'],
+            retry_delay=options['retry_delay'],
+        )
+        for line in report.lines():
+            self.stdout.write(line)
+        if report.unfinished:
+            self.stderr.write(f'{report.unfinished} target(s) did not finish within {options["timeout"]}s.')
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.integrations.models import Platform
+from apps.posts.routing import LANE_INTERACTIVE, LANES, publish_concurrency, publish_queue
+from config.celery import app as celery_app
+
+
+class Command(BaseCommand):
+    help = 'Run a Celery worker pool for one platform publishing lane.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('platform', choices=Platform.values)
+        parser.add_argument('--lane', choices=LANES, default=LANE_INTERACTIVE)
+        parser.add_argument('--concurrency', type=int, help='Override PUBLISH_WORKER_CONCURRENCY.')
+        parser.add_argument('--loglevel', default='INFO')
+
+    def handle(self, *args, **options):
+        platform = options['platform']
+        lane = options['lane']
+        concurrency = options['concurrency'] or publish_concurrency(platform, lane)
+        if concurrency < 1:
+            raise CommandError('Concurrency must be at least 1.')
+        celery_app.worker_main([
+            'worker',
+            f'--queues={publish_queue(platform, lane)}',
+            f'--concurrency={concurrency}',
+            f'--hostname={platform}-{lane}@%h',
+            f'--loglevel={options["loglevel"]}',
+        ])
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.posts.models import Post
+from apps.posts.services.hashtags import sync_post_hashtags
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the normalized hashtag index from Post.hashtags, e.g. after a bulk import.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = 0
+        synced = 0
+        while True:
+            posts = list(
+                Post.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .only('id', 'user_id', 'hashtags')[:batch_size]
+            )
+            if not posts:
+                break
+            sync_post_hashtags(posts)
+            synced += len(posts)
+            last_id = posts[-1].id
+        self.stdout.write(f'Synced hashtags for {synced} post(s).')
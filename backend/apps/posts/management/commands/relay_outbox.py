@@ -0,0 +1,25 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.posts.services.outbox import relay_outbox
+
+
+class Command(BaseCommand):
+    help = 'Drain the publish outbox to the broker in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.PUBLISH_OUTBOX_BATCH_SIZE)
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds to sleep when the outbox is empty.')
+        parser.add_argument('--once', action='store_true', help='Drain the outbox once and exit.')
+
+    def handle(self, *args, **options):
+        while True:
+            relayed = relay_outbox(options['batch_size'])
+            if relayed:
+                self.stdout.write(f'Relayed {relayed} publish(es).')
+            if options['once']:
+                return
+            if not relayed:
+                time.sleep(options['interval'])
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishOutboxEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('platform', models.CharField(max_length=20)),
+                ('lane', models.CharField(default='interactive', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('post_target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='posts.posttarget')),
+            ],
+        ),
+    ]
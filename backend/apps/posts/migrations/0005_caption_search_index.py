@@ -0,0 +1,62 @@
+from django.db import migrations
+
+# The DDL as of this migration, so later changes to services.search do not
+# change what it does; services.search.ensure_search_index reinstalls it
+# after every migrate when a table rebuild has dropped the triggers. SQLite gets an external-content FTS5 table kept current
+# by triggers; PostgreSQL a GIN expression index. Other backends get nothing.
+INSTALL_SQL = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS posts_post_fts USING fts5(caption, content='posts_post', content_rowid='id')",
+        """CREATE TRIGGER IF NOT EXISTS posts_post_fts_ai AFTER INSERT ON posts_post BEGIN
+            INSERT INTO posts_post_fts(rowid, caption) VALUES (new.id, new.caption);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS posts_post_fts_ad AFTER DELETE ON posts_post BEGIN
+            INSERT INTO posts_post_fts(posts_post_fts, rowid, caption) VALUES ('delete', old.id, old.caption);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS posts_post_fts_au AFTER UPDATE OF caption ON posts_post BEGIN
+            INSERT INTO posts_post_fts(posts_post_fts, rowid, caption) VALUES ('delete', old.id, old.caption);
+            INSERT INTO posts_post_fts(rowid, caption) VALUES (new.id, new.caption);
+        END""",
+        "INSERT INTO posts_post_fts(posts_post_fts) VALUES ('rebuild')",
+    ],
+    'postgresql': [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS posts_post_caption_fts ON posts_post "
+        "USING GIN (to_tsvector('simple', caption))",
+    ],
+}
+DROP_SQL = {
+    'sqlite': [
+        'DROP TRIGGER IF EXISTS posts_post_fts_ai',
+        'DROP TRIGGER IF EXISTS posts_post_fts_ad',
+        'DROP TRIGGER IF EXISTS posts_post_fts_au',
+        'DROP TABLE IF EXISTS posts_post_fts',
+    ],
+    'postgresql': ['DROP INDEX CONCURRENTLY IF EXISTS posts_post_caption_fts'],
+}
+
+
+def _run(statements, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            cursor.execute(statement)
+
+
+def install(apps, schema_editor):
+    _run(INSTALL_SQL, schema_editor)
+
+
+def drop(apps, schema_editor):
+    _run(DROP_SQL, schema_editor)
+
+
+class Migration(migrations.Migration):
+    # PostgreSQL builds the index CONCURRENTLY, which cannot run in a transaction.
+    atomic = False
+
+    dependencies = [
+        ('posts', '0004_hashtag_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, drop),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0005_caption_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['content_type', '-id'], name='posts_post_content_d18d52_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['created_at'], name='posts_post_created_dadbfe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posttarget',
+            index=models.Index(fields=['status', '-id'], name='posts_postt_status_cccdac_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posttarget',
+            index=models.Index(fields=['created_at'], name='posts_postt_created_04292e_idx'),
+        ),
+    ]
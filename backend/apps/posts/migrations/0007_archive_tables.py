@@ -0,0 +1,46 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0006_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedPostTarget',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('post_id', models.BigIntegerField()),
+                ('user_id', models.BigIntegerField()),
+                ('social_account_id', models.BigIntegerField()),
+                ('platform', models.CharField(choices=[('instagram', 'Instagram'), ('facebook', 'Facebook'), ('tiktok', 'TikTok'), ('youtube', 'YouTube'), ('linkedin', 'LinkedIn'), ('x', 'X')], max_length=20)),
+                ('status', models.CharField(choices=[('selected', 'Selected'), ('queued', 'Queued'), ('rejected', 'Rejected'), ('published', 'Published')], max_length=10)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_id', '-created_at'], name='posts_archi_user_id_0f420f_idx'), models.Index(fields=['post_id'], name='posts_archi_post_id_a97071_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedPost',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('user_id', models.BigIntegerField()),
+                ('content_type', models.CharField(choices=[('TEXT', 'Text'), ('PHOTO', 'Photo'), ('VIDEO', 'Video')], max_length=10)),
+                ('caption', models.TextField(blank=True)),
+                ('hashtags', models.JSONField(blank=True, default=list)),
+                ('image_file', models.CharField(blank=True, max_length=255)),
+                ('video_file', models.CharField(blank=True, max_length=255)),
+                ('media_metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_id', '-created_at'], name='posts_archi_user_id_6c4924_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0007_archive_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedposttarget',
+            name='content_type',
+            field=models.CharField(blank=True, choices=[('TEXT', 'Text'), ('PHOTO', 'Photo'), ('VIDEO', 'Video')], max_length=10),
+        ),
+    ]
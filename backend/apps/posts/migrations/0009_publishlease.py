@@ -0,0 +1,26 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0002_account_last_checked_at'),
+        ('posts', '0008_archivedposttarget_content_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot', models.PositiveSmallIntegerField()),
+                ('post_target_id', models.BigIntegerField(blank=True, null=True)),
+                ('expires_at', models.DateTimeField(blank=True, null=True)),
+                ('social_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='integrations.socialaccount')),
+            ],
+            options={
+                'unique_together': {('social_account', 'slot')},
+            },
+        ),
+    ]
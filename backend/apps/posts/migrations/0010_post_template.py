@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0002_account_last_checked_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('posts', '0009_publishlease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('content_type', models.CharField(choices=[('TEXT', 'Text'), ('PHOTO', 'Photo'), ('VIDEO', 'Video')], max_length=10)),
+                ('caption', models.TextField(blank=True)),
+                ('hashtags', models.JSONField(blank=True, default=list)),
+                ('image_file', models.FileField(blank=True, null=True, upload_to='images/')),
+                ('video_file', models.FileField(blank=True, null=True, upload_to='videos/')),
+                ('media_metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('social_accounts', models.ManyToManyField(blank=True, related_name='+', to='integrations.socialaccount')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_templates', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
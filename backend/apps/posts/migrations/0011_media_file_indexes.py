@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0010_post_template'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archivedpost',
+            index=models.Index(fields=['image_file'], name='posts_archi_image_f_46bf0d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedpost',
+            index=models.Index(fields=['video_file'], name='posts_archi_video_f_a32d9e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['image_file'], name='posts_post_image_f_7237b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['video_file'], name='posts_post_video_f_f0e0a8_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+from django.db import migrations, models
+from django.db.models import Case, F, Value, When
+
+MODELS = ('PostTarget', 'ArchivedPostTarget')
+
+OTHER = 1
+# Registered reason sentences as of this migration; later changes to
+# apps.capabilities.reasons must not change what it does.
+REASONS = {
+    2: 'Account not available for publishing.',
+    10: 'No connected account.',
+    11: 'Instagram requires a Professional account for publishing.',
+    12: 'Instagram publishing permissions are missing or invalid.',
+    13: 'Facebook publishing requires a connected Page.',
+    14: 'TikTok prerequisites or domain verification incomplete.',
+    15: 'TikTok photo posting not enabled for this account.',
+    16: 'TikTok supports photo and video posts only.',
+    17: 'YouTube supports video uploads only.',
+    18: 'Requires additional LinkedIn API access/scope.',
+    19: 'X media upload not enabled for current API tier/config.',
+}
+
+
+def encode_reasons(apps, schema_editor):
+    # One UPDATE per table; whatever text is not a registered sentence is free text.
+    for name in MODELS:
+        model = apps.get_model('posts', name)
+        model.objects.exclude(last_error='').update(
+            reason_code=Case(
+                *[When(last_error=text, then=Value(code)) for code, text in REASONS.items()],
+                default=Value(OTHER),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+            last_error=Case(
+                When(last_error__in=REASONS.values(), then=Value('')),
+                default=F('last_error'),
+                output_field=models.TextField(),
+            ),
+        )
+
+
+def decode_reasons(apps, schema_editor):
+    for name in MODELS:
+        model = apps.get_model('posts', name)
+        model.objects.filter(reason_code__in=REASONS).update(
+            last_error=Case(
+                *[When(reason_code=code, then=Value(text)) for code, text in REASONS.items()],
+                output_field=models.TextField(),
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0011_media_file_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedposttarget',
+            name='reason_code',
+            field=models.PositiveSmallIntegerField(choices=[(0, ''), (1, 'Unexpected error.'), (2, 'Account not available for publishing.'), (10, 'No connected account.'), (11, 'Instagram requires a Professional account for publishing.'), (12, 'Instagram publishing permissions are missing or invalid.'), (13, 'Facebook publishing requires a connected Page.'), (14, 'TikTok prerequisites or domain verification incomplete.'), (15, 'TikTok photo posting not enabled for this account.'), (16, 'TikTok supports photo and video posts only.'), (17, 'YouTube supports video uploads only.'), (18, 'Requires additional LinkedIn API access/scope.'), (19, 'X media upload not enabled for current API tier/config.')], default=0),
+        ),
+        migrations.AddField(
+            model_name='posttarget',
+            name='reason_code',
+            field=models.PositiveSmallIntegerField(choices=[(0, ''), (1, 'Unexpected error.'), (2, 'Account not available for publishing.'), (10, 'No connected account.'), (11, 'Instagram requires a Professional account for publishing.'), (12, 'Instagram publishing permissions are missing or invalid.'), (13, 'Facebook publishing requires a connected Page.'), (14, 'TikTok prerequisites or domain verification incomplete.'), (15, 'TikTok photo posting not enabled for this account.'), (16, 'TikTok supports photo and video posts only.'), (17, 'YouTube supports video uploads only.'), (18, 'Requires additional LinkedIn API access/scope.'), (19, 'X media upload not enabled for current API tier/config.')], default=0),
+        ),
+        migrations.AddIndex(
+            model_name='posttarget',
+            index=models.Index(fields=['reason_code', '-id'], name='posts_target_reason_idx'),
+        ),
+        migrations.RunPython(encode_reasons, decode_reasons),
+    ]
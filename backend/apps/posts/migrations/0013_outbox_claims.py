@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0012_target_reason_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publishoutboxentry',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='publishoutboxentry',
+            name='relay_id',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
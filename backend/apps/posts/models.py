@@ -1,7 +1,11 @@
 ﻿from django.conf import settings
 from django.db import models
 
-from apps.integrations.models import SocialAccount
+from apps.capabilities.reasons import Reason, reason_text
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.routing import LANE_INTERACTIVE
+
+HASHTAG_MAX_LENGTH = 255
 
 
 class Post(models.Model):
@@ -19,6 +23,16 @@ class Post(models.Model):
     media_metadata = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Match the admin changelist filters, which order by -id.
+        indexes = [
+            models.Index(fields=['content_type', '-id']),
+            models.Index(fields=['created_at']),
+            # Media garbage collection looks files up by storage name.
+            models.Index(fields=['image_file']),
+            models.Index(fields=['video_file']),
+        ]
+
     def __str__(self):
         return f'{self.user_id}:{self.content_type}:{self.id}'
 
@@ -33,11 +47,191 @@ class PostTarget(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='targets')
     social_account = models.ForeignKey(SocialAccount, on_delete=models.CASCADE)
     status = models.CharField(max_length=10, choices=Status.choices, default=Status.SELECTED)
+    # Why the target was rejected or failed; last_error only holds free text
+    # for errors outside the registry (Reason.OTHER).
+    reason_code = models.PositiveSmallIntegerField(choices=Reason.choices, default=Reason.NONE)
     last_error = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('post', 'social_account')
+        indexes = [
+            models.Index(fields=['status', '-id']),
+            models.Index(fields=['created_at']),
+            models.Index(fields=['reason_code', '-id'], name='posts_target_reason_idx'),
+        ]
 
     def __str__(self):
         return f'{self.post_id}:{self.social_account_id}:{self.status}'
+
+    @property
+    def reason(self):
+        return reason_text(self.reason_code, self.last_error)
+
+
+class PostTemplate(models.Model):
+    """Reusable post content and target accounts.
+
+    Media fields point at the same stored files as the post they were saved
+    from; creating a post from a template never copies bytes.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='post_templates')
+    name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=10, choices=Post.ContentType.choices)
+    caption = models.TextField(blank=True)
+    hashtags = models.JSONField(default=list, blank=True)
+    image_file = models.FileField(upload_to='images/', null=True, blank=True)
+    video_file = models.FileField(upload_to='videos/', null=True, blank=True)
+    media_metadata = models.JSONField(default=dict, blank=True)
+    social_accounts = models.ManyToManyField(SocialAccount, blank=True, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'{self.user_id}:{self.name}'
+
+
+class Hashtag(models.Model):
+    name = models.CharField(max_length=HASHTAG_MAX_LENGTH, unique=True)
+
+    def __str__(self):
+        return f'#{self.name}'
+
+
+class PostHashtag(models.Model):
+    """Normalized copy of ``Post.hashtags``, kept in sync by ``services.hashtags``.
+
+    ``user`` is denormalized from the post so per-user tag lookups and counts
+    are answered from the (user, hashtag, post) index alone.
+    """
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='hashtag_links')
+    hashtag = models.ForeignKey(Hashtag, on_delete=models.CASCADE, related_name='post_links')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False, related_name='+')
+
+    class Meta:
+        unique_together = ('post', 'hashtag')
+        indexes = [models.Index(fields=['user', 'hashtag', 'post'])]
+
+    def __str__(self):
+        return f'{self.post_id}:{self.hashtag_id}'
+
+
+class RenderedCaption(models.Model):
+    """Caption text rendered for one platform, shared by every target on it.
+
+    ``source_hash`` identifies the caption, hashtags and renderer version the
+    text was built from; a mismatch means the row is stale.
+    """
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='rendered_captions')
+    platform = models.CharField(max_length=20, choices=Platform.choices)
+    text = models.TextField()
+    source_hash = models.CharField(max_length=40)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('post', 'platform')
+
+    def __str__(self):
+        return f'{self.post_id}:{self.platform}'
+
+
+class PublishOutboxEntry(models.Model):
+    """A publish waiting to be sent to the broker.
+
+    Rows are written in the same transaction as the ``PostTarget`` status
+    change and drained by ``services.outbox.relay_outbox``, which claims a
+    batch by setting ``claimed_at`` and ``relay_id`` before sending it.
+    """
+
+    post_target = models.ForeignKey(PostTarget, on_delete=models.CASCADE, related_name='+')
+    platform = models.CharField(max_length=20)
+    lane = models.CharField(max_length=20, default=LANE_INTERACTIVE)
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    relay_id = models.CharField(max_length=32, blank=True)
+
+    def __str__(self):
+        return f'{self.post_target_id}:{self.platform}:{self.lane}'
+
+
+class PublishLease(models.Model):
+    """One of the in-flight publish slots of a social account.
+
+    ``services.account_leases`` creates ``PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT``
+    rows per account; a slot is free when it has no holder or its lease expired.
+    """
+
+    social_account = models.ForeignKey(SocialAccount, on_delete=models.CASCADE, related_name='+')
+    slot = models.PositiveSmallIntegerField()
+    post_target_id = models.BigIntegerField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ['social_account', 'slot']
+
+    def __str__(self):
+        return f'{self.social_account_id}:{self.slot}:{self.post_target_id}'
+
+
+class ArchivedPostTarget(models.Model):
+    """A terminal ``PostTarget`` moved out of the hot table by ``services.archival``.
+
+    Keeps the original primary key and plain ids instead of foreign keys, so
+    rows survive their post being archived or deleted.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    post_id = models.BigIntegerField()
+    user_id = models.BigIntegerField()
+    social_account_id = models.BigIntegerField()
+    platform = models.CharField(max_length=20, choices=Platform.choices)
+    content_type = models.CharField(max_length=10, choices=Post.ContentType.choices, blank=True)
+    status = models.CharField(max_length=10, choices=PostTarget.Status.choices)
+    reason_code = models.PositiveSmallIntegerField(choices=Reason.choices, default=Reason.NONE)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user_id', '-created_at']),
+            models.Index(fields=['post_id']),
+        ]
+
+    def __str__(self):
+        return f'{self.post_id}:{self.social_account_id}:{self.status}'
+
+    @property
+    def reason(self):
+        return reason_text(self.reason_code, self.last_error)
+
+
+class ArchivedPost(models.Model):
+    """An old ``Post`` with no remaining targets, moved out of the hot table.
+
+    Media files are left in storage; ``image_file`` and ``video_file`` keep
+    their storage names.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    user_id = models.BigIntegerField()
+    content_type = models.CharField(max_length=10, choices=Post.ContentType.choices)
+    caption = models.TextField(blank=True)
+    hashtags = models.JSONField(default=list, blank=True)
+    image_file = models.CharField(max_length=255, blank=True)
+    video_file = models.CharField(max_length=255, blank=True)
+    media_metadata = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user_id', '-created_at']),
+            models.Index(fields=['image_file']),
+            models.Index(fields=['video_file']),
+        ]
+
+    def __str__(self):
+        return f'{self.user_id}:{self.content_type}:{self.id}'
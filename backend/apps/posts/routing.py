@@ -0,0 +1,30 @@
+from django.conf import settings
+
+LANE_INTERACTIVE = 'interactive'
+LANE_BULK = 'bulk'
+LANES = (LANE_INTERACTIVE, LANE_BULK)
+
+PUBLISH_TASK_NAME = 'apps.posts.tasks.publish_target'
+
+
+def publish_queue(platform, lane=LANE_INTERACTIVE):
+    return f'{settings.PUBLISH_QUEUE_PREFIX}.{platform}.{lane}'
+
+
+def publish_concurrency(platform, lane):
+    return settings.PUBLISH_WORKER_CONCURRENCY.get(platform, {}).get(lane, 1)
+
+
+def route_publish_task(name, args, kwargs, options, task=None, **kw):
+    """Celery router: send each publish to its platform and lane queue.
+
+    Each (platform, lane) queue is consumed by its own worker pool, so a slow
+    platform or a bulk backlog cannot hold up user-initiated publishes elsewhere.
+    """
+    if name != PUBLISH_TASK_NAME:
+        return None
+    headers = options.get('headers') or {}
+    platform = headers.get('platform')
+    if not platform:
+        return None
+    return {'queue': publish_queue(platform, headers.get('lane') or LANE_INTERACTIVE)}
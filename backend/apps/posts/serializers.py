@@ -1,13 +1,14 @@
-﻿from rest_framework import serializers
+﻿from django.urls import reverse
+from rest_framework import serializers
 
-from apps.posts.models import Post, PostTarget
+from apps.posts.models import HASHTAG_MAX_LENGTH, Post, PostTarget, PostTemplate
 from apps.integrations.models import SocialAccount
 
 
 class DraftPostSerializer(serializers.Serializer):
     content_type = serializers.ChoiceField(choices=Post.ContentType.choices)
     caption = serializers.CharField(required=False, allow_blank=True)
-    hashtags = serializers.ListField(child=serializers.CharField(), required=False)
+    hashtags = serializers.ListField(child=serializers.CharField(max_length=HASHTAG_MAX_LENGTH), required=False)
     image_file = serializers.FileField(required=False, allow_null=True)
     video_file = serializers.FileField(required=False, allow_null=True)
     media_metadata = serializers.DictField(required=False)
@@ -43,6 +44,37 @@ class DraftPostSerializer(serializers.Serializer):
         return attrs
 
 
+class MediaDescriptorSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    size = serializers.IntegerField(min_value=1)
+    mime_type = serializers.CharField()
+    duration = serializers.FloatField(required=False, min_value=0)
+
+    def __init__(self, *args, media_kind=None, **kwargs):
+        self.media_kind = media_kind
+        super().__init__(*args, **kwargs)
+
+    def validate_mime_type(self, value):
+        if self.media_kind and not value.startswith(f'{self.media_kind}/'):
+            raise serializers.ValidationError(f'Expected a {self.media_kind} mime type.')
+        return value
+
+
+class DraftPostMetadataSerializer(DraftPostSerializer):
+    """Validates a draft from declared file descriptors instead of uploaded bytes."""
+
+    image_file = MediaDescriptorSerializer(media_kind='image', required=False, allow_null=True)
+    video_file = MediaDescriptorSerializer(media_kind='video', required=False, allow_null=True)
+
+    def media_metadata_for_availability(self):
+        media_metadata = dict(self.validated_data.get('media_metadata') or {})
+        descriptor = self.validated_data.get('video_file') or self.validated_data.get('image_file')
+        if descriptor:
+            for key, value in descriptor.items():
+                media_metadata.setdefault(key, value)
+        return media_metadata
+
+
 class PostSerializer(serializers.ModelSerializer):
     caption = serializers.CharField(required=True, allow_blank=False)
     target_account_ids = serializers.ListField(
@@ -50,6 +82,9 @@ class PostSerializer(serializers.ModelSerializer):
         write_only=True,
         required=False,
     )
+    hashtags = serializers.ListField(child=serializers.CharField(max_length=HASHTAG_MAX_LENGTH), required=False)
+    image_preview_url = serializers.SerializerMethodField()
+    video_preview_url = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -60,10 +95,26 @@ class PostSerializer(serializers.ModelSerializer):
             'hashtags',
             'image_file',
             'video_file',
+            'image_preview_url',
+            'video_preview_url',
             'media_metadata',
             'target_account_ids',
         ]
 
+    def get_image_preview_url(self, obj):
+        return self._preview_url(obj, 'image')
+
+    def get_video_preview_url(self, obj):
+        return self._preview_url(obj, 'video')
+
+    def _preview_url(self, obj, kind):
+        # Previews go through the ranged, owner-checked media action rather than MEDIA_URL.
+        if not getattr(obj, f'{kind}_file'):
+            return None
+        url = reverse('posts:posts-media', kwargs={'pk': obj.pk, 'kind': kind})
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
     def validate(self, attrs):
         content_type = attrs.get('content_type') or getattr(self.instance, 'content_type', None)
         caption = attrs.get('caption')
@@ -106,3 +157,47 @@ class PostSerializer(serializers.ModelSerializer):
             for account in accounts:
                 PostTarget.objects.create(post=post, social_account=account)
         return post
+
+
+class DuplicatePostSerializer(serializers.Serializer):
+    caption = serializers.CharField(required=False, allow_blank=False)
+
+
+class SaveTemplateSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=255)
+
+
+class PostTemplateSerializer(serializers.ModelSerializer):
+    social_account_ids = serializers.PrimaryKeyRelatedField(
+        source='social_accounts',
+        many=True,
+        required=False,
+        queryset=SocialAccount.objects.none(),
+    )
+    hashtags = serializers.ListField(child=serializers.CharField(max_length=HASHTAG_MAX_LENGTH), required=False)
+
+    class Meta:
+        model = PostTemplate
+        fields = [
+            'id',
+            'name',
+            'content_type',
+            'caption',
+            'hashtags',
+            'image_file',
+            'video_file',
+            'media_metadata',
+            'social_account_ids',
+            'created_at',
+        ]
+        read_only_fields = ['created_at']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is not None:
+            self.fields['social_account_ids'].child_relation.queryset = SocialAccount.objects.filter(user=request.user)
+
+    def create(self, validated_data):
+        validated_data['user'] = self.context['request'].user
+        return super().create(validated_data)
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.posts.models import PostTarget, PublishLease
+
+
+def account_publish_limit():
+    """In-flight publishes allowed per social account; 0 turns the limit off."""
+    return settings.PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT
+
+
+def is_next_in_line(target, limit):
+    """Whether ``target`` may start: fewer than ``limit`` older targets of its account are still queued.
+
+    Older queued targets are either in flight (holding a slot) or waiting, so
+    targets of one account start in creation order.
+    """
+    older = PostTarget.objects.filter(
+        social_account_id=target.social_account_id,
+        status=PostTarget.Status.QUEUED,
+        id__lt=target.id,
+    )
+    return older[:limit].count() < limit
+
+
+def acquire_publish_slot(target, limit, ttl=None):
+    """Take a free in-flight slot of ``target``'s account and return its number, or ``None``.
+
+    Each attempt is a single conditional UPDATE, so concurrent workers never
+    share a slot. Expired leases (a crashed worker) are free, and a redelivered
+    task gets its own slot back.
+    """
+    ttl = ttl if ttl is not None else settings.PUBLISH_ACCOUNT_LEASE_TTL
+    account_id = target.social_account_id
+    PublishLease.objects.bulk_create(
+        [PublishLease(social_account_id=account_id, slot=slot) for slot in range(limit)],
+        ignore_conflicts=True,
+    )
+    now = timezone.now()
+    free = Q(post_target_id__isnull=True) | Q(expires_at__lt=now) | Q(post_target_id=target.id)
+    for slot in range(limit):
+        taken = PublishLease.objects.filter(free, social_account_id=account_id, slot=slot).update(
+            post_target_id=target.id, expires_at=now + timedelta(seconds=ttl),
+        )
+        if taken:
+            return slot
+    return None
+
+
+def release_publish_slot(target, slot):
+    PublishLease.objects.filter(
+        social_account_id=target.social_account_id, slot=slot, post_target_id=target.id,
+    ).update(post_target_id=None, expires_at=None)
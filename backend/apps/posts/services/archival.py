@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget
+
+TERMINAL_STATUSES = (PostTarget.Status.PUBLISHED, PostTarget.Status.REJECTED)
+
+
+def archive_cutoff(days=None):
+    days = settings.ARCHIVE_AFTER_DAYS if days is None else days
+    return timezone.now() - timedelta(days=days)
+
+
+def archive_post_targets(cutoff, batch_size=1000):
+    """Move terminal targets created before ``cutoff`` into ``ArchivedPostTarget``.
+
+    Each batch is copied and deleted in one transaction and the copy ignores
+    rows that are already archived, so an interrupted run can simply be
+    started again. Returns the number of targets archived.
+    """
+    archived = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                PostTarget.objects.filter(status__in=TERMINAL_STATUSES, created_at__lt=cutoff)
+                .order_by('id')
+                .values(
+                    'id', 'post_id', 'post__user_id', 'post__content_type', 'social_account_id',
+                    'social_account__platform', 'status', 'reason_code', 'last_error', 'created_at',
+                )[:batch_size]
+            )
+            if not rows:
+                break
+            ArchivedPostTarget.objects.bulk_create(
+                [
+                    ArchivedPostTarget(
+                        id=row['id'],
+                        post_id=row['post_id'],
+                        user_id=row['post__user_id'],
+                        social_account_id=row['social_account_id'],
+                        platform=row['social_account__platform'],
+                        content_type=row['post__content_type'],
+                        status=row['status'],
+                        reason_code=row['reason_code'],
+                        last_error=row['last_error'],
+                        created_at=row['created_at'],
+                    )
+                    for row in rows
+                ],
+                ignore_conflicts=True,
+            )
+            PostTarget.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        archived += len(rows)
+    return archived
+
+
+def archive_posts(cutoff, batch_size=1000):
+    """Move posts created before ``cutoff`` whose targets have all been archived into ``ArchivedPost``.
+
+    Run after ``archive_post_targets``. Posts that never had a target, such as
+    old drafts, stay live. Media files stay in storage and are referenced from
+    the archive row. Returns the number of posts archived.
+    """
+    archived = 0
+    has_targets = PostTarget.objects.filter(post=OuterRef('pk'))
+    has_archived_targets = ArchivedPostTarget.objects.filter(post_id=OuterRef('pk'))
+    while True:
+        with transaction.atomic():
+            posts = list(
+                Post.objects.filter(created_at__lt=cutoff)
+                .filter(~Exists(has_targets), Exists(has_archived_targets))
+                .order_by('id')[:batch_size]
+            )
+            if not posts:
+                break
+            ArchivedPost.objects.bulk_create(
+                [
+                    ArchivedPost(
+                        id=post.id,
+                        user_id=post.user_id,
+                        content_type=post.content_type,
+                        caption=post.caption,
+                        hashtags=post.hashtags,
+                        image_file=post.image_file.name or '',
+                        video_file=post.video_file.name or '',
+                        media_metadata=post.media_metadata,
+                        created_at=post.created_at,
+                    )
+                    for post in posts
+                ],
+                ignore_conflicts=True,
+            )
+            Post.objects.filter(id__in=[post.id for post in posts]).delete()
+        archived += len(posts)
+    return archived
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from apps.integrations.models import Platform
+from apps.posts.models import RenderedCaption
+
+URL_RE = re.compile(r'https?://\S+')
+ELLIPSIS = '…'
+
+# Bump when the rules or the renderer change so stored captions are re-rendered.
+RENDERER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CaptionRules:
+    max_length: int
+    max_hashtags: Optional[int] = None
+    # Length each URL counts as, for platforms that shorten links (X counts every link as 23).
+    url_length: Optional[int] = None
+
+
+CAPTION_RULES = {
+    Platform.INSTAGRAM.value: CaptionRules(max_length=2200, max_hashtags=30),
+    Platform.FACEBOOK.value: CaptionRules(max_length=63206),
+    Platform.TIKTOK.value: CaptionRules(max_length=2200),
+    Platform.YOUTUBE.value: CaptionRules(max_length=5000, max_hashtags=15),
+    Platform.LINKEDIN.value: CaptionRules(max_length=3000),
+    Platform.X.value: CaptionRules(max_length=280, url_length=23),
+}
+
+
+def normalize_hashtags(hashtags):
+    """Strip '#' and whitespace and drop case-insensitive duplicates, keeping order."""
+    seen = set()
+    tags = []
+    for tag in hashtags or []:
+        tag = str(tag).strip().lstrip('#').strip()
+        if tag and tag.lower() not in seen:
+            seen.add(tag.lower())
+            tags.append(tag)
+    return tags
+
+
+def caption_source_hash(caption, hashtags):
+    source = json.dumps([RENDERER_VERSION, caption or '', list(hashtags or [])])
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def rendered_length(text, rules):
+    if not rules.url_length:
+        return len(text)
+    urls = URL_RE.findall(text)
+    return len(text) - sum(len(url) for url in urls) + rules.url_length * len(urls)
+
+
+def render_caption(caption, hashtags, platform):
+    """Render ``caption`` and ``hashtags`` as the text to post on ``platform``.
+
+    Hashtags are capped per platform and dropped from the end when they do not
+    fit. If the caption alone is too long it is cut at a word boundary, never
+    inside a link, and ends with an ellipsis.
+    """
+    rules = CAPTION_RULES[platform]
+    caption = (caption or '').strip()
+    tags = [f'#{tag}' for tag in normalize_hashtags(hashtags)]
+    if rules.max_hashtags is not None:
+        tags = tags[:rules.max_hashtags]
+
+    while tags:
+        text = _join(caption, tags)
+        if rendered_length(text, rules) <= rules.max_length:
+            return text
+        tags.pop()
+    return _truncate(caption, rules)
+
+
+def _join(caption, tags):
+    hashtag_line = ' '.join(tags)
+    if caption and hashtag_line:
+        return f'{caption}\n\n{hashtag_line}'
+    return caption or hashtag_line
+
+
+def _truncate(text, rules):
+    if rendered_length(text, rules) <= rules.max_length:
+        return text
+    budget = rules.max_length - len(ELLIPSIS)
+    words = re.split(r'(\s+)', text)
+    kept = ''
+    for word in words:
+        if rendered_length(kept + word, rules) > budget:
+            break
+        kept += word
+    if not kept.strip():
+        # A single word longer than the limit; links are left out rather than cut.
+        kept = '' if URL_RE.match(text) else text[:budget]
+    return kept.rstrip() + ELLIPSIS
+
+
+def get_rendered_captions(post, platforms):
+    """Return ``{platform: text}`` for ``post``, rendering only missing or stale captions.
+
+    Rendered text is stored per (post, platform), so publishing to many
+    accounts on one platform renders the caption once.
+    """
+    platforms = set(platforms)
+    source_hash = caption_source_hash(post.caption, post.hashtags)
+    stored = {
+        row.platform: row
+        for row in RenderedCaption.objects.filter(post=post, platform__in=platforms)
+    }
+    texts = {}
+    created = []
+    updated = []
+    for platform in platforms:
+        row = stored.get(platform)
+        if row and row.source_hash == source_hash:
+            texts[platform] = row.text
+            continue
+        text = render_caption(post.caption, post.hashtags, platform)
+        texts[platform] = text
+        if row:
+            row.text = text
+            row.source_hash = source_hash
+            updated.append(row)
+        else:
+            created.append(RenderedCaption(post=post, platform=platform, text=text, source_hash=source_hash))
+    if created:
+        RenderedCaption.objects.bulk_create(created, ignore_conflicts=True)
+    if updated:
+        RenderedCaption.objects.bulk_update(updated, ['text', 'source_hash'])
+    return texts
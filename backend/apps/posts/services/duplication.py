@@ -0,0 +1,54 @@
+from django.db import transaction
+
+from apps.integrations.models import SocialAccount
+from apps.posts.models import Post, PostTarget, PostTemplate
+
+# Content copied between posts and templates. File fields are copied by
+# storage name, so the copy shares the stored bytes with its source.
+CONTENT_FIELDS = ['content_type', 'caption', 'hashtags', 'image_file', 'video_file', 'media_metadata']
+
+
+def _content(source, **overrides):
+    content = {field: getattr(source, field) for field in CONTENT_FIELDS}
+    for field in ('image_file', 'video_file'):
+        content[field] = content[field].name if content[field] else None
+    content['hashtags'] = list(content['hashtags'])
+    content['media_metadata'] = dict(content['media_metadata'])
+    content.update({key: value for key, value in overrides.items() if value is not None})
+    return content
+
+
+def _create_post(user_id, content, social_account_ids):
+    post = Post.objects.create(user_id=user_id, **content)
+    PostTarget.objects.bulk_create(
+        PostTarget(post=post, social_account_id=account_id) for account_id in social_account_ids
+    )
+    return post
+
+
+@transaction.atomic
+def duplicate_post(post, caption=None):
+    """Copy ``post`` and its target accounts into a new, unpublished post.
+
+    Media is shared by reference and every target is cloned in one insert
+    with a fresh ``selected`` status. Replacing the media on either post later
+    uploads a new file and leaves the other post's file untouched.
+    """
+    account_ids = post.targets.values_list('social_account_id', flat=True)
+    return _create_post(post.user_id, _content(post, caption=caption), list(account_ids))
+
+
+@transaction.atomic
+def save_as_template(post, name):
+    template = PostTemplate.objects.create(user_id=post.user_id, name=name, **_content(post))
+    template.social_accounts.set(post.targets.values_list('social_account_id', flat=True))
+    return template
+
+
+@transaction.atomic
+def create_post_from_template(template, caption=None):
+    # Accounts disconnected since the template was saved drop out of the M2M.
+    account_ids = SocialAccount.objects.filter(
+        user_id=template.user_id, id__in=template.social_accounts.values('id'),
+    ).values_list('id', flat=True)
+    return _create_post(template.user_id, _content(template, caption=caption), list(account_ids))
@@ -0,0 +1,179 @@
+import csv
+import json
+
+from django.db.models import Exists, OuterRef, Prefetch
+
+from apps.common.db_router import read_from_replica
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget
+
+EXPORT_COLUMNS = [
+    'post_id',
+    'post_created_at',
+    'content_type',
+    'caption',
+    'hashtags',
+    'target_id',
+    'platform',
+    'social_account_id',
+    'status',
+    'reason_code',
+    'last_error',
+    'target_created_at',
+    'archived',
+]
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+# Rows are rendered and sent this many at a time.
+FLUSH_ROWS = 500
+
+
+def export_rows(user, chunk_size=2000):
+    """Yield one dict per target (or per target-less post) across live and archived history.
+
+    Live posts are read with ``iterator(chunk_size)`` and their targets are
+    prefetched one chunk at a time. Archived targets follow, with their post
+    fields looked up per chunk. Archived posts that have no targets come last.
+    Memory use depends on ``chunk_size``, not on the size of the history.
+    """
+    target_fields = [
+        'id', 'post_id', 'social_account_id', 'status', 'reason_code', 'last_error', 'created_at',
+        'social_account__platform',
+    ]
+    targets = Prefetch(
+        'targets',
+        queryset=PostTarget.objects.select_related('social_account').only(*target_fields).order_by('id'),
+    )
+    posts = (
+        Post.objects.filter(user=user)
+        .only('id', 'created_at', 'content_type', 'caption', 'hashtags')
+        .order_by('id')
+        .prefetch_related(targets)
+    )
+    for post in posts.iterator(chunk_size=chunk_size):
+        post_fields = _post_fields(post, archived=False)
+        post_targets = post.targets.all()
+        if not post_targets:
+            yield {**post_fields, **_EMPTY_TARGET}
+        for target in post_targets:
+            yield {
+                **post_fields,
+                'target_id': target.id,
+                'platform': target.social_account.platform,
+                'social_account_id': target.social_account_id,
+                'status': target.status,
+                'reason_code': target.reason_code,
+                'last_error': target.reason,
+                'target_created_at': target.created_at,
+            }
+
+    archived_targets = ArchivedPostTarget.objects.filter(user_id=user.id).order_by('post_id', 'id')
+    chunk = []
+    for target in archived_targets.iterator(chunk_size=chunk_size):
+        chunk.append(target)
+        if len(chunk) >= chunk_size:
+            yield from _archived_target_rows(chunk)
+            chunk = []
+    yield from _archived_target_rows(chunk)
+
+    has_targets = ArchivedPostTarget.objects.filter(post_id=OuterRef('id'))
+    lone_posts = ArchivedPost.objects.filter(user_id=user.id).exclude(Exists(has_targets)).order_by('id')
+    for post in lone_posts.iterator(chunk_size=chunk_size):
+        yield {**_post_fields(post, archived=True), **_EMPTY_TARGET}
+
+
+_EMPTY_TARGET = dict.fromkeys(
+    ['target_id', 'platform', 'social_account_id', 'status', 'reason_code', 'last_error', 'target_created_at'],
+)
+
+
+def _post_fields(post, archived):
+    return {
+        'post_id': post.id,
+        'post_created_at': post.created_at,
+        'content_type': post.content_type,
+        'caption': post.caption,
+        'hashtags': post.hashtags,
+        'archived': archived,
+    }
+
+
+def _archived_target_rows(targets):
+    if not targets:
+        return
+    post_ids = {target.post_id for target in targets}
+    fields = ['id', 'created_at', 'content_type', 'caption', 'hashtags']
+    posts = {post.id: _post_fields(post, archived=False) for post in Post.objects.filter(id__in=post_ids).only(*fields)}
+    posts.update({
+        post.id: _post_fields(post, archived=True)
+        for post in ArchivedPost.objects.filter(id__in=post_ids - posts.keys()).only(*fields)
+    })
+    for target in targets:
+        post_fields = posts.get(target.post_id) or {
+            'post_id': target.post_id, 'post_created_at': None, 'content_type': target.content_type,
+            'caption': None, 'hashtags': None,
+        }
+        yield {
+            **post_fields,
+            'target_id': target.id,
+            'platform': target.platform,
+            'social_account_id': target.social_account_id,
+            'status': target.status,
+            'reason_code': target.reason_code,
+            'last_error': target.reason,
+            'target_created_at': target.created_at,
+            'archived': True,
+        }
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def render_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    buffer = []
+    for row in rows:
+        row = {**row, 'hashtags': ' '.join(row['hashtags'] or [])}
+        buffer.append(writer.writerow([_csv_value(row[column]) for column in EXPORT_COLUMNS]))
+        if len(buffer) >= FLUSH_ROWS:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+def render_ndjson(rows):
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps({column: row[column] for column in EXPORT_COLUMNS}, default=str) + '\n')
+        if len(buffer) >= FLUSH_ROWS:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def stream_export(user, output, chunk_size=2000):
+    """Rendered export chunks for ``StreamingHttpResponse``; reads go to the replica if configured."""
+    render = render_csv if output == 'csv' else render_ndjson
+    chunks = render(export_rows(user, chunk_size))
+    # The body is produced after the view returns, possibly on another thread
+    # under ASGI, so the replica context is entered around each step instead.
+    while True:
+        with read_from_replica():
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
@@ -0,0 +1,66 @@
+from django.db.models import Count
+
+from apps.posts.models import HASHTAG_MAX_LENGTH, Hashtag, PostHashtag
+from apps.posts.services.captions import normalize_hashtags
+
+
+def normalize_hashtag(tag):
+    return str(tag).strip().lstrip('#').strip().lower()
+
+
+def sync_post_hashtags(posts):
+    """Bring the hashtag index in line with ``Post.hashtags`` for ``posts``.
+
+    Works on any number of posts with a fixed number of queries, so bulk
+    imports should call it once with everything they created. Tags longer
+    than ``HASHTAG_MAX_LENGTH`` are not indexed.
+    """
+    posts = [post for post in posts if post.pk]
+    if not posts:
+        return
+    names_by_post = {
+        post.pk: {tag.lower() for tag in normalize_hashtags(post.hashtags) if len(tag) <= HASHTAG_MAX_LENGTH}
+        for post in posts
+    }
+    user_by_post = {post.pk: post.user_id for post in posts}
+    names = set().union(*names_by_post.values())
+    hashtag_ids = {}
+    if names:
+        Hashtag.objects.bulk_create([Hashtag(name=name) for name in names], ignore_conflicts=True)
+        hashtag_ids = dict(Hashtag.objects.filter(name__in=names).values_list('name', 'id'))
+
+    wanted = {
+        (post_id, hashtag_ids[name])
+        for post_id, post_names in names_by_post.items()
+        for name in post_names
+    }
+    existing = {
+        (post_id, hashtag_id): link_id
+        for link_id, post_id, hashtag_id in PostHashtag.objects.filter(
+            post_id__in=names_by_post,
+        ).values_list('id', 'post_id', 'hashtag_id')
+    }
+    stale_ids = [link_id for pair, link_id in existing.items() if pair not in wanted]
+    if stale_ids:
+        PostHashtag.objects.filter(id__in=stale_ids).delete()
+    PostHashtag.objects.bulk_create(
+        [
+            PostHashtag(post_id=post_id, hashtag_id=hashtag_id, user_id=user_by_post[post_id])
+            for post_id, hashtag_id in wanted - existing.keys()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def filter_posts_by_hashtag(queryset, user, tag):
+    post_ids = PostHashtag.objects.filter(user=user, hashtag__name=normalize_hashtag(tag)).values('post_id')
+    return queryset.filter(id__in=post_ids)
+
+
+def hashtag_frequencies(user, limit=50):
+    return list(
+        PostHashtag.objects.filter(user=user)
+        .values('hashtag__name')
+        .annotate(count=Count('post'))
+        .order_by('-count', 'hashtag__name')[:limit]
+    )
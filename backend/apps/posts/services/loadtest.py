@@ -0,0 +1,269 @@
+import logging
+import math
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import OperationalError, close_old_connections
+
+from apps.integrations.fake_platform import FakePlatformServer
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+from apps.posts.routing import LANES, publish_queue
+from apps.posts.services.outbox import relay_outbox
+from config.celery import app as celery_app
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+TERMINAL_STATUSES = [PostTarget.Status.PUBLISHED, PostTarget.Status.REJECTED]
+
+# Flags that make a seeded account available for every content type.
+AVAILABLE_ACCOUNT_FIELDS = {
+    'permissions_valid': True,
+    'tiktok_photo_post_enabled': True,
+    'tiktok_prerequisites_met': True,
+    'linkedin_access_granted': True,
+    'x_media_upload_enabled': True,
+    'x_api_tier': 'pro',
+}
+ACCOUNT_TYPES = {
+    Platform.INSTAGRAM: SocialAccount.AccountType.INSTAGRAM_PROFESSIONAL,
+    Platform.FACEBOOK: SocialAccount.AccountType.FACEBOOK_PAGE,
+}
+
+
+@dataclass
+class LoadTestReport:
+    targets: int = 0
+    published: int = 0
+    rejected: int = 0
+    rejected_at_publish: int = 0
+    failed_requests: int = 0
+    unfinished: int = 0
+    elapsed: float = 0.0
+    latencies: list = field(default_factory=list, repr=False)
+
+    @property
+    def throughput(self):
+        return (self.published + self.rejected) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct):
+        """Nearest-rank percentile of end-to-end latency, in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = max(0, min(len(ordered), math.ceil(pct / 100 * len(ordered))) - 1)
+        return ordered[index]
+
+    def lines(self):
+        return [
+            f'Targets queued:      {self.targets}',
+            f'Published:           {self.published}',
+            f'Rejected by worker:  {self.rejected}',
+            f'Rejected at publish: {self.rejected_at_publish}',
+            f'Failed requests:     {self.failed_requests}',
+            f'Unfinished:          {self.unfinished}',
+            f'Elapsed:             {self.elapsed:.2f}s',
+            f'Throughput:          {self.throughput:.1f} targets/s',
+            f'Latency p50:         {self.percentile(50) * 1000:.0f} ms',
+            f'Latency p99:         {self.percentile(99) * 1000:.0f} ms',
+        ]
+
+
+def seed_accounts(prefix, users, platforms):
+    """Create ``users`` users with one available account per platform; returns ``[(user, account_ids)]``."""
+    User.objects.bulk_create(
+        User(username=f'{prefix}-{index}', password=make_password(None)) for index in range(users)
+    )
+    seeded = list(User.objects.filter(username__startswith=f'{prefix}-').order_by('id'))
+    SocialAccount.objects.bulk_create(
+        SocialAccount(
+            user=user,
+            platform=platform,
+            display_name=f'{platform} load test',
+            account_type=ACCOUNT_TYPES.get(platform, ''),
+            **AVAILABLE_ACCOUNT_FIELDS,
+        )
+        for user in seeded
+        for platform in platforms
+    )
+    account_ids = {}
+    for user_id, account_id in SocialAccount.objects.filter(user__in=seeded).values_list('user_id', 'id'):
+        account_ids.setdefault(user_id, []).append(account_id)
+    return [(user, account_ids[user.id]) for user in seeded]
+
+
+def run_publish_load_test(
+    users=10,
+    posts_per_user=10,
+    platforms=(Platform.X, Platform.LINKEDIN),
+    workers=8,
+    latency=0.05,
+    jitter=0.0,
+    error_rate=0.0,
+    timeout=120.0,
+    poll_interval=0.05,
+    keep_data=False,
+    account_limit=None,
+    retry_delay=None,
+):
+    """Publish through the API and measure how fast workers finish the targets.
+
+    Posts are created and published with ``PostViewSet`` via the test client.
+    The outbox is relayed to the in-memory broker by a background thread.
+    An embedded Celery worker pool of ``workers`` threads runs ``publish_target``
+    against a ``FakePlatformServer``. End-to-end latency runs from the start of
+    the publish request to the first poll that sees the target's final status,
+    so it is accurate to about ``poll_interval``. ``account_limit`` and
+    ``retry_delay`` override the per-account in-flight limit for the run.
+    """
+    # Test-only helpers are imported here so that importing this module from
+    # app code does not pull in django.test and Celery's testing worker.
+    from rest_framework.test import APIClient
+
+    prefix = f'loadtest-{uuid.uuid4().hex[:8]}'
+    report = LoadTestReport()
+    server = FakePlatformServer(latency=latency, jitter=jitter, error_rate=error_rate)
+    queues = [publish_queue(platform, lane) for platform in platforms for lane in LANES]
+    account_settings = {}
+    if account_limit is not None:
+        account_settings['PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT'] = account_limit
+    if retry_delay is not None:
+        account_settings['PUBLISH_ACCOUNT_RETRY_DELAY'] = retry_delay
+    with server, _publish_settings(server.url, **account_settings), _embedded_worker(queues, workers):
+        seeded = seed_accounts(prefix, users, platforms)
+        client = APIClient(raise_request_exception=False)
+        started = {}
+        with _background_relay(poll_interval):
+            began = time.perf_counter()
+            for user, account_ids in seeded:
+                client.force_authenticate(user=user)
+                for index in range(posts_per_user):
+                    created = client.post('/api/posts/', {
+                        'content_type': Post.ContentType.TEXT,
+                        'caption': f'Load test post {index}',
+                        'target_account_ids': account_ids,
+                    }, format='json')
+                    if created.status_code != 201:
+                        report.failed_requests += 1
+                        continue
+                    publish_started = time.perf_counter()
+                    response = client.post(f'/api/posts/{created.data["id"]}/publish')
+                    if response.status_code != 200:
+                        report.failed_requests += 1
+                        continue
+                    for target_id in response.data['queued_post_target_ids']:
+                        started[target_id] = publish_started
+                    report.rejected_at_publish += len(response.data['rejected'])
+            finished = _wait_for_targets(started, timeout, poll_interval)
+            report.elapsed = time.perf_counter() - began
+
+    report.targets = len(started)
+    for target_id, (finished_at, status) in finished.items():
+        report.latencies.append(finished_at - started[target_id])
+        if status == PostTarget.Status.PUBLISHED:
+            report.published += 1
+        else:
+            report.rejected += 1
+    report.unfinished = len(started) - len(finished)
+    if not keep_data:
+        User.objects.filter(username__startswith=f'{prefix}-').delete()
+    return report
+
+
+def _wait_for_targets(started, timeout, poll_interval, chunk_size=500):
+    pending = set(started)
+    finished = {}
+    deadline = time.perf_counter() + timeout
+    while pending and time.perf_counter() < deadline:
+        ids = list(pending)
+        for offset in range(0, len(ids), chunk_size):
+            rows = PostTarget.objects.filter(
+                id__in=ids[offset:offset + chunk_size], status__in=TERMINAL_STATUSES,
+            ).values_list('id', 'status')
+            now = time.perf_counter()
+            for target_id, status in rows:
+                finished[target_id] = (now, status)
+                pending.discard(target_id)
+        if pending:
+            time.sleep(poll_interval)
+    return finished
+
+
+@contextmanager
+def _publish_settings(base_url, **extra):
+    from django.test.utils import override_settings
+
+    overrides = override_settings(
+        **extra,
+        PUBLISH_CLIENT='apps.integrations.services.publish_client.HttpPublishClient',
+        PUBLISH_CLIENT_BASE_URL=base_url,
+        PUBLISH_OUTBOX_RELAY_ON_COMMIT=False,
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+        # Seeded users publish far faster than any real client; measure the pipeline, not the throttle.
+        REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}},
+    )
+    previous = {
+        'CELERY_TASK_ALWAYS_EAGER': celery_app.conf.task_always_eager,
+        'CELERY_BROKER_TRANSPORT_OPTIONS': celery_app.conf.broker_transport_options,
+    }
+    celery_app.conf.CELERY_TASK_ALWAYS_EAGER = False
+    # The in-memory broker polls idle queues once a second by default, which
+    # would dominate the measured latency.
+    celery_app.conf.CELERY_BROKER_TRANSPORT_OPTIONS = {'polling_interval': 0.01}
+    try:
+        with overrides:
+            yield
+    finally:
+        for key, value in previous.items():
+            setattr(celery_app.conf, key, value)
+
+
+@contextmanager
+def _embedded_worker(queues, concurrency):
+    from celery.contrib.testing.worker import start_worker
+
+    with start_worker(
+        celery_app,
+        pool='threads',
+        concurrency=concurrency,
+        queues=queues,
+        perform_ping_check=False,
+        loglevel='WARNING',
+    ) as worker:
+        yield worker
+
+
+@contextmanager
+def _background_relay(interval):
+    stop = threading.Event()
+
+    def relay():
+        try:
+            while not stop.is_set():
+                try:
+                    relayed = relay_outbox()
+                except OperationalError:
+                    # SQLite refuses concurrent writers; the batch is retried.
+                    logger.warning('Outbox relay failed, retrying.', exc_info=True)
+                    relayed = 0
+                if not relayed:
+                    stop.wait(interval)
+            relay_outbox()
+        finally:
+            close_old_connections()
+
+    thread = threading.Thread(target=relay, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
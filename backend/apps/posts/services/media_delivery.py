@@ -0,0 +1,132 @@
+import mimetypes
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.http import http_date, parse_http_date_safe
+
+DELIVERY_DJANGO = 'django'
+DELIVERY_X_ACCEL_REDIRECT = 'x-accel-redirect'
+DELIVERY_X_SENDFILE = 'x-sendfile'
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+class RangeFile:
+    """Read-only view of ``length`` bytes of ``file`` starting at ``start``.
+
+    Exposes ``fileno`` so WSGI servers with ``wsgi.file_wrapper`` can sendfile
+    the slice (they start at the current offset and stop at Content-Length);
+    everything else gets bounded ``read`` calls.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        try:
+            return self.file.fileno()
+        except (OSError, ValueError) as exc:
+            raise AttributeError('fileno') from exc
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """Return ``(start, end)`` (inclusive) for a single byte range, or ``None`` to send the whole file.
+
+    Multiple ranges and malformed headers are ignored, as RFC 9110 allows.
+    Raises ``RangeNotSatisfiable`` when the range lies outside the file.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise RangeNotSatisfiable
+    return start, end
+
+
+def serve_media(request, field_file):
+    """Respond with ``field_file``, honouring ``Range`` and ``If-Range``.
+
+    Access checks belong to the caller. With ``MEDIA_DELIVERY`` set to
+    ``x-accel-redirect`` or ``x-sendfile`` the bytes are left to the front-end
+    server, which also handles ranges.
+    """
+    content_type = mimetypes.guess_type(field_file.name)[0] or 'application/octet-stream'
+    mode = settings.MEDIA_DELIVERY
+    if mode == DELIVERY_X_ACCEL_REDIRECT:
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + field_file.name
+        return response
+    if mode == DELIVERY_X_SENDFILE:
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = field_file.path
+        return response
+
+    storage = field_file.storage
+    size = field_file.size
+    modified = int(storage.get_modified_time(field_file.name).timestamp())
+    etag = f'"{size:x}-{modified:x}"'
+    validators = {'ETag': etag, 'Last-Modified': http_date(modified), 'Accept-Ranges': 'bytes'}
+
+    byte_range = None
+    if _if_range_matches(request.headers.get('If-Range'), etag, modified):
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            _set_headers(response, validators)
+            return response
+
+    file = storage.open(field_file.name, 'rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+    else:
+        start, end = byte_range
+        response = FileResponse(RangeFile(file, start, end - start + 1), content_type=content_type, status=206)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    _set_headers(response, validators)
+    return response
+
+
+def _set_headers(response, headers):
+    for name, value in headers.items():
+        response[name] = value
+
+
+def _if_range_matches(if_range, etag, modified):
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        # If-Range requires a strong comparison; weak tags never match.
+        return if_range == etag
+    return parse_http_date_safe(if_range) == modified
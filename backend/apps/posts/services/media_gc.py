@@ -0,0 +1,127 @@
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.utils import timezone
+
+from apps.posts.models import ArchivedPost, Post, PostTemplate
+
+# Columns that hold media storage names. Duplicated posts and templates share
+# files, so a file is only orphaned when none of these reference it.
+MEDIA_REFERENCES = (
+    (Post, 'image_file'),
+    (Post, 'video_file'),
+    (PostTemplate, 'image_file'),
+    (PostTemplate, 'video_file'),
+    (ArchivedPost, 'image_file'),
+    (ArchivedPost, 'video_file'),
+)
+
+# Storage directories written by the upload fields above.
+MEDIA_DIRECTORIES = ('images', 'videos')
+
+
+@dataclass
+class MediaCollectionResult:
+    scanned: int = 0
+    referenced: int = 0
+    recent: int = 0
+    deleted: int = 0
+
+
+def iter_media_files(storage=None, directories=MEDIA_DIRECTORIES):
+    """Yield the storage names of every file under ``directories``.
+
+    File system storage is walked with ``os.scandir`` so large directories are
+    streamed instead of listed up front; other backends fall back to
+    ``Storage.listdir``.
+    """
+    storage = storage or default_storage
+    for directory in directories:
+        if isinstance(storage, FileSystemStorage):
+            yield from _scan_directory(storage.path(directory), directory)
+        else:
+            yield from _list_directory(storage, directory)
+
+
+def _scan_directory(path, name):
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_directory(entry.path, f'{name}/{entry.name}')
+            elif entry.is_file(follow_symlinks=False):
+                yield f'{name}/{entry.name}'
+
+
+def _list_directory(storage, name):
+    try:
+        directories, files = storage.listdir(name)
+    except FileNotFoundError:
+        return
+    for file_name in files:
+        yield f'{name}/{file_name}'
+    for directory in directories:
+        yield from _list_directory(storage, f'{name}/{directory}')
+
+
+def referenced_names(names):
+    """Return the subset of ``names`` referenced by any media column."""
+    names = list(names)
+    referenced = set()
+    for model, field in MEDIA_REFERENCES:
+        referenced.update(
+            model.objects.filter(**{f'{field}__in': names}).values_list(field, flat=True)
+        )
+    return referenced
+
+
+def collect_orphaned_media(grace=None, batch_size=None, dry_run=False, storage=None):
+    """Delete media files that no post, template or archived post references.
+
+    Storage is scanned in batches of ``batch_size`` names and each batch is
+    checked with one ``IN`` lookup per media column. Files modified within
+    ``grace`` seconds are kept: uploads are written to storage before the row
+    referencing them commits. References are checked again right before the
+    delete to narrow the window for concurrent duplicates.
+    """
+    storage = storage or default_storage
+    grace = settings.MEDIA_GC_GRACE_PERIOD if grace is None else grace
+    batch_size = batch_size or settings.MEDIA_GC_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(seconds=grace)
+    result = MediaCollectionResult()
+
+    files = iter_media_files(storage)
+    while batch := list(islice(files, batch_size)):
+        result.scanned += len(batch)
+        referenced = referenced_names(batch)
+        result.referenced += len(referenced)
+
+        candidates = []
+        for name in batch:
+            if name in referenced:
+                continue
+            try:
+                modified = storage.get_modified_time(name)
+            except FileNotFoundError:
+                continue
+            if modified >= cutoff:
+                result.recent += 1
+            else:
+                candidates.append(name)
+        if not candidates:
+            continue
+
+        orphans = set(candidates) - referenced_names(candidates)
+        result.referenced += len(candidates) - len(orphans)
+        for name in sorted(orphans):
+            if not dry_run:
+                storage.delete(name)
+            result.deleted += 1
+    return result
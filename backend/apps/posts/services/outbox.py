@@ -0,0 +1,67 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.posts.models import PublishOutboxEntry
+from apps.posts.routing import LANE_INTERACTIVE
+from apps.posts.tasks import enqueue_publish_target
+from config.celery import app as celery_app
+
+
+def add_to_outbox(post_targets, lane=LANE_INTERACTIVE):
+    """Record publishes for ``post_targets``; call inside the status-change transaction."""
+    entries = [
+        PublishOutboxEntry(post_target=target, platform=target.social_account.platform, lane=lane)
+        for target in post_targets
+    ]
+    PublishOutboxEntry.objects.bulk_create(entries)
+    if entries and settings.PUBLISH_OUTBOX_RELAY_ON_COMMIT:
+        transaction.on_commit(relay_outbox)
+    return entries
+
+
+def relay_outbox(batch_size=None):
+    """Send pending outbox entries to the broker, oldest first, in batches.
+
+    Each batch is claimed in a short transaction, sent with no transaction or
+    row locks held, and deleted in a second short transaction. An entry is
+    deleted only after its message has been handed to the broker, so delivery
+    is at-least-once: if the relay dies in between, the claim goes stale after
+    ``PUBLISH_OUTBOX_CLAIM_TIMEOUT`` seconds and the batch is sent again.
+    Returns the number of entries relayed.
+    """
+    batch_size = batch_size or settings.PUBLISH_OUTBOX_BATCH_SIZE
+    relay_id = uuid.uuid4().hex
+    relayed = 0
+    while True:
+        entries = _claim_batch(relay_id, batch_size)
+        if not entries:
+            break
+        with celery_app.producer_or_acquire() as producer:
+            for entry in entries:
+                enqueue_publish_target(entry.post_target_id, entry.platform, entry.lane, producer=producer)
+        PublishOutboxEntry.objects.filter(id__in=[entry.id for entry in entries], relay_id=relay_id).delete()
+        relayed += len(entries)
+        if len(entries) < batch_size:
+            break
+    return relayed
+
+
+def _claim_batch(relay_id, batch_size):
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.PUBLISH_OUTBOX_CLAIM_TIMEOUT)
+    claimable = Q(claimed_at__isnull=True) | Q(claimed_at__lt=stale)
+    with transaction.atomic():
+        entries = list(
+            PublishOutboxEntry.objects.select_for_update(skip_locked=True)
+            .filter(claimable)
+            .order_by('id')[:batch_size]
+        )
+        PublishOutboxEntry.objects.filter(id__in=[entry.id for entry in entries]).update(
+            claimed_at=now, relay_id=relay_id,
+        )
+    return entries
@@ -0,0 +1,84 @@
+"""Full-text search over ``Post.caption``.
+
+SQLite uses an external-content FTS5 table kept current by triggers;
+PostgreSQL uses a GIN expression index on ``to_tsvector('simple', caption)``,
+which the database maintains itself. Other backends fall back to ``icontains``.
+"""
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'posts_post_fts'
+PG_INDEX = 'posts_post_caption_fts'
+
+SQLITE_INDEX_SQL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(caption, content='posts_post', content_rowid='id')",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON posts_post BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, caption) VALUES (new.id, new.caption);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON posts_post BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, caption) VALUES ('delete', old.id, old.caption);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF caption ON posts_post BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, caption) VALUES ('delete', old.id, old.caption);
+        INSERT INTO {FTS_TABLE}(rowid, caption) VALUES (new.id, new.caption);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+POSTGRES_INDEX_SQL = [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {PG_INDEX} ON posts_post USING GIN (to_tsvector('simple', caption))",
+]
+SQLITE_OBJECTS = {FTS_TABLE, f'{FTS_TABLE}_ai', f'{FTS_TABLE}_ad', f'{FTS_TABLE}_au'}
+
+
+def search_index_missing(connection):
+    """Whether any part of the search index is missing from ``connection``."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE %s",
+                [f'{FTS_TABLE}%'],
+            )
+            return not SQLITE_OBJECTS <= {name for name, in cursor.fetchall()}
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT 1 FROM pg_indexes WHERE indexname = %s', [PG_INDEX])
+            return cursor.fetchone() is None
+    return False
+
+
+def ensure_search_index(connection):
+    """(Re)create the search index when any part of it is missing.
+
+    Migration 0005 creates the index; SQLite drops the triggers whenever a
+    later migration rebuilds ``posts_post`` (e.g. an ``AlterField``), so this
+    runs after every ``migrate`` and rebuilds the FTS table from the posts.
+    Returns whether anything was installed.
+    """
+    if not search_index_missing(connection):
+        return False
+    statements = {'sqlite': SQLITE_INDEX_SQL, 'postgresql': POSTGRES_INDEX_SQL}[connection.vendor]
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    return True
+
+
+def _fts5_query(query):
+    # Quote every term so user input is never parsed as FTS5 syntax; terms are ANDed.
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in query.split())
+
+
+def search_posts(queryset, query):
+    query = query.strip()
+    if not query:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        matches = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [_fts5_query(query)])
+        return queryset.filter(id__in=matches)
+    if vendor == 'postgresql':
+        matches = RawSQL(
+            "SELECT id FROM posts_post WHERE to_tsvector('simple', caption) @@ plainto_tsquery('simple', %s)",
+            [query],
+        )
+        return queryset.filter(id__in=matches)
+    return queryset.filter(caption__icontains=query)
@@ -0,0 +1,24 @@
+from django.db import connections
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.posts.models import Post
+from apps.posts.services.hashtags import sync_post_hashtags
+from apps.posts.services.search import ensure_search_index
+
+SEARCH_INDEX_MIGRATION = ('posts', '0005_caption_search_index')
+
+
+@receiver(post_save, sender=Post)
+def sync_hashtag_index(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and 'hashtags' not in update_fields):
+        return
+    sync_post_hashtags([instance])
+
+
+def reinstall_search_index(sender, using='default', **kwargs):
+    """Connected to ``post_migrate``: put back search triggers a table rebuild dropped."""
+    connection = connections[using]
+    if SEARCH_INDEX_MIGRATION in MigrationRecorder(connection).applied_migrations():
+        ensure_search_index(connection)
@@ -1,6 +1,112 @@
 ﻿from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+
+from apps.analytics.services.stats_service import record_status_changes
+from apps.capabilities.reasons import encode_reason
+from apps.common.local_tasks import abandon_handler, retry_task, runs_locally
+from apps.integrations.services.publish_client import get_publish_client
+from apps.posts.models import PostTarget, PublishOutboxEntry
+from apps.posts.routing import LANE_INTERACTIVE
+from apps.posts.services.account_leases import (
+    account_publish_limit,
+    acquire_publish_slot,
+    is_next_in_line,
+    release_publish_slot,
+)
+from apps.posts.services.captions import get_rendered_captions
+from apps.posts.services.media_gc import collect_orphaned_media as collect_media
+
+
+@shared_task(bind=True, max_retries=None)
+def publish_target(self, post_target_id, failed_attempts=0):
+    """Send a queued target to its platform and record the outcome.
+
+    Targets that are no longer queued (already published, or redelivered by
+    the at-least-once outbox) are left alone. When the account already has
+    ``PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT`` publishes in flight, or older targets
+    of it are still waiting, the task is retried shortly instead of holding a
+    worker. After ``PUBLISH_ACCOUNT_ORDER_MAX_RETRIES`` retries, creation order
+    is no longer enforced, so a target whose message was lost cannot block
+    its account forever. Transient platform failures are retried with
+    exponential backoff up to ``PUBLISH_TRANSIENT_MAX_RETRIES`` times before
+    the target is rejected; ``failed_attempts`` counts them.
+    """
+    target = (
+        PostTarget.objects.select_related('post', 'social_account')
+        .filter(id=post_target_id, status=PostTarget.Status.QUEUED)
+        .first()
+    )
+    if target is None:
+        return {'post_target_id': post_target_id, 'status': None}
+
+    limit = account_publish_limit()
+    slot = None
+    # Eager tasks already run one at a time and retrying them would recurse;
+    # the local executor runs them concurrently and retries on its scheduler.
+    can_retry = not self.request.is_eager or runs_locally(self.request)
+    if limit and can_retry:
+        in_order = self.request.retries >= settings.PUBLISH_ACCOUNT_ORDER_MAX_RETRIES or is_next_in_line(target, limit)
+        slot = acquire_publish_slot(target, limit) if in_order else None
+        if slot is None:
+            raise retry_task(self, countdown=settings.PUBLISH_ACCOUNT_RETRY_DELAY)
+    try:
+        platform = target.social_account.platform
+        # Normally stored by the publish request; only stale captions are re-rendered here.
+        caption = get_rendered_captions(target.post, {platform})[platform]
+        result = get_publish_client().publish(target, caption)
+        if result.retryable and can_retry and failed_attempts < settings.PUBLISH_TRANSIENT_MAX_RETRIES:
+            raise retry_task(
+                self,
+                countdown=settings.PUBLISH_TRANSIENT_RETRY_DELAY * 2 ** failed_attempts,
+                kwargs={'failed_attempts': failed_attempts + 1},
+            )
+        status = PostTarget.Status.PUBLISHED if result.ok else PostTarget.Status.REJECTED
+        reason_code, last_error = encode_reason(result.error)
+        with transaction.atomic():
+            updated = PostTarget.objects.filter(id=target.id, status=PostTarget.Status.QUEUED).update(
+                status=status, reason_code=reason_code, last_error=last_error,
+            )
+            if updated:
+                record_status_changes([
+                    (target.post.user_id, target.social_account.platform, target.post.content_type, status),
+                ])
+    finally:
+        if slot is not None:
+            release_publish_slot(target, slot)
+    return {'post_target_id': post_target_id, 'status': status if updated else None}
+
+
+@abandon_handler('apps.posts.tasks.publish_target')
+def requeue_abandoned_publish(args, kwargs, headers):
+    """Put a publish the local executor dropped back in the outbox for the next relay."""
+    target = (
+        PostTarget.objects.select_related('social_account')
+        .filter(id=args[0], status=PostTarget.Status.QUEUED)
+        .first()
+    )
+    if target is not None:
+        PublishOutboxEntry.objects.create(
+            post_target=target,
+            platform=target.social_account.platform,
+            lane=(headers or {}).get('lane', LANE_INTERACTIVE),
+        )
+
+
+def enqueue_publish_target(post_target_id, platform, lane=LANE_INTERACTIVE, **options):
+    """Queue ``publish_target`` on the queue for ``platform`` and ``lane``.
+
+    User-initiated publishes use the interactive lane; bulk and scheduled
+    publishing should pass ``LANE_BULK``. Request handlers should not call this
+    directly but write a ``PublishOutboxEntry`` (see ``services.outbox``).
+    """
+    return publish_target.apply_async(
+        (post_target_id,),
+        headers={'platform': platform, 'lane': lane},
+        **options,
+    )
 
 
 @shared_task
-def publish_target(post_target_id):
-    return {'post_target_id': post_target_id}
+def collect_orphaned_media():
+    return collect_media().deleted
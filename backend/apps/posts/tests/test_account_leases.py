@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget, PublishLease
+from apps.posts.services.account_leases import acquire_publish_slot, is_next_in_line, release_publish_slot
+from apps.posts.tasks import publish_target
+
+User = get_user_model()
+
+
+class LeaseTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        self.other_account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X 2')
+
+    def _target(self, account=None):
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        return PostTarget.objects.create(
+            post=post, social_account=account or self.account, status=PostTarget.Status.QUEUED,
+        )
+
+
+class AccountLeaseTest(LeaseTestCase):
+    def test_slots_are_limited_per_account(self):
+        first, second, third = self._target(), self._target(), self._target()
+        elsewhere = self._target(self.other_account)
+
+        self.assertEqual(acquire_publish_slot(first, limit=2), 0)
+        self.assertEqual(acquire_publish_slot(second, limit=2), 1)
+        self.assertIsNone(acquire_publish_slot(third, limit=2))
+        self.assertEqual(acquire_publish_slot(elsewhere, limit=2), 0)
+
+        release_publish_slot(first, 0)
+        self.assertEqual(acquire_publish_slot(third, limit=2), 0)
+
+    def test_expired_and_own_leases_are_reclaimed(self):
+        crashed, waiting = self._target(), self._target()
+        acquire_publish_slot(crashed, limit=1)
+
+        self.assertEqual(acquire_publish_slot(crashed, limit=1), 0)
+        self.assertIsNone(acquire_publish_slot(waiting, limit=1))
+
+        PublishLease.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(acquire_publish_slot(waiting, limit=1), 0)
+
+    def test_targets_start_in_creation_order(self):
+        first, second, third = self._target(), self._target(), self._target()
+
+        self.assertTrue(is_next_in_line(first, limit=1))
+        self.assertFalse(is_next_in_line(second, limit=1))
+        self.assertTrue(is_next_in_line(second, limit=2))
+        self.assertFalse(is_next_in_line(third, limit=2))
+
+        PostTarget.objects.filter(id=first.id).update(status=PostTarget.Status.PUBLISHED)
+        self.assertTrue(is_next_in_line(second, limit=1))
+
+
+class PublishTargetSerializationTest(LeaseTestCase):
+    def test_busy_account_retries_instead_of_publishing(self):
+        first, second = self._target(), self._target()
+        acquire_publish_slot(first, limit=1)
+
+        with self.assertRaises(Retry):
+            publish_target(second.id)
+
+        second.refresh_from_db()
+        self.assertEqual(second.status, PostTarget.Status.QUEUED)
+
+    def test_younger_target_waits_for_older_one(self):
+        first, second = self._target(), self._target()
+
+        with self.assertRaises(Retry):
+            publish_target(second.id)
+
+        publish_target(first.id)
+        publish_target(second.id)
+        self.assertEqual(
+            set(PostTarget.objects.values_list('status', flat=True)), {PostTarget.Status.PUBLISHED},
+        )
+        self.assertFalse(PublishLease.objects.filter(post_target_id__isnull=False).exists())
+
+    @override_settings(PUBLISH_ACCOUNT_ORDER_MAX_RETRIES=3)
+    def test_order_is_given_up_after_max_retries(self):
+        self._target()
+        stuck_behind = self._target()
+
+        publish_target.push_request(retries=3)
+        try:
+            result = publish_target.run(stuck_behind.id)
+        finally:
+            publish_target.pop_request()
+
+        self.assertEqual(result['status'], PostTarget.Status.PUBLISHED)
+
+    @override_settings(PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT=0)
+    def test_limit_can_be_disabled(self):
+        self._target()
+        second = self._target()
+
+        self.assertEqual(publish_target(second.id)['status'], PostTarget.Status.PUBLISHED)
+        self.assertFalse(PublishLease.objects.exists())
@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.admin import PostTargetAdmin
+from apps.posts.models import Post, PostTarget
+
+User = get_user_model()
+
+
+class PostTargetAdminTest(TestCase):
+    url = '/admin/posts/posttarget/'
+
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(username='admin', password='testpass')
+        self.client.force_login(self.admin_user)
+        self.account = SocialAccount.objects.create(user=self.admin_user, platform=Platform.X, display_name='X')
+
+    def _create_targets(self, count):
+        posts = Post.objects.bulk_create(
+            Post(user=self.admin_user, content_type=Post.ContentType.TEXT, caption='Hi') for _ in range(count)
+        )
+        PostTarget.objects.bulk_create(PostTarget(post=post, social_account=self.account) for post in posts)
+
+    def _query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        self._create_targets(2)
+        few = self._query_count()
+        self._create_targets(20)
+        self.assertEqual(self._query_count(), few)
+
+    def test_keyset_pagination(self):
+        self._create_targets(PostTargetAdmin.list_per_page + 5)
+
+        response = self.client.get(self.url)
+        next_url = response.context['cl'].next_cursor_url
+        self.assertIn('before=', next_url)
+        self.assertContains(response, 'Older entries')
+
+        response = self.client.get(self.url + next_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['cl'].result_list), 5)
+        self.assertIsNone(response.context['cl'].next_cursor_url)
+
+    def test_filtering_by_status_with_cursor(self):
+        self._create_targets(3)
+        cursor = PostTarget.objects.order_by('-id')[0].id
+
+        response = self.client.get(self.url, {'status__exact': 'selected', 'before': cursor})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['cl'].result_list), 2)
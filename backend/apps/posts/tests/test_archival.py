@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget
+from apps.posts.services.archival import archive_cutoff, archive_post_targets, archive_posts
+
+User = get_user_model()
+
+
+class ArchivalTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        self.old = timezone.now() - timedelta(days=200)
+
+    def _target(self, status, created_at=None):
+        post = Post.objects.create(
+            user=self.user,
+            content_type=Post.ContentType.PHOTO,
+            caption='Hi',
+            image_file='images/photo.jpg',
+        )
+        target = PostTarget.objects.create(post=post, social_account=self.account, status=status)
+        if created_at:
+            Post.objects.filter(id=post.id).update(created_at=created_at)
+            PostTarget.objects.filter(id=target.id).update(created_at=created_at)
+        return target
+
+    def test_archives_only_old_terminal_targets_in_batches(self):
+        published = self._target(PostTarget.Status.PUBLISHED, self.old)
+        rejected = self._target(PostTarget.Status.REJECTED, self.old)
+        pending = self._target(PostTarget.Status.QUEUED, self.old)
+        recent = self._target(PostTarget.Status.PUBLISHED)
+
+        archived = archive_post_targets(archive_cutoff(90), batch_size=1)
+
+        self.assertEqual(archived, 2)
+        self.assertEqual(set(PostTarget.objects.values_list('id', flat=True)), {pending.id, recent.id})
+        row = ArchivedPostTarget.objects.get(id=published.id)
+        self.assertEqual((row.user_id, row.platform, row.status), (self.user.id, 'x', 'published'))
+        self.assertTrue(ArchivedPostTarget.objects.filter(id=rejected.id).exists())
+
+    def test_rerun_after_interruption_is_safe(self):
+        target = self._target(PostTarget.Status.PUBLISHED, self.old)
+        # Simulate a run that copied the row but died before deleting it.
+        ArchivedPostTarget.objects.create(
+            id=target.id, post_id=target.post_id, user_id=self.user.id, social_account_id=self.account.id,
+            platform='x', status='published', created_at=self.old,
+        )
+
+        self.assertEqual(archive_post_targets(archive_cutoff(90)), 1)
+        self.assertFalse(PostTarget.objects.exists())
+        self.assertEqual(ArchivedPostTarget.objects.count(), 1)
+
+    def test_archives_posts_without_targets_keeping_media_references(self):
+        target = self._target(PostTarget.Status.PUBLISHED, self.old)
+        kept = self._target(PostTarget.Status.QUEUED, self.old)
+        cutoff = archive_cutoff(90)
+
+        archive_post_targets(cutoff)
+        self.assertEqual(archive_posts(cutoff), 1)
+
+        self.assertEqual(list(Post.objects.values_list('id', flat=True)), [kept.post_id])
+        self.assertEqual(ArchivedPost.objects.get(id=target.post_id).image_file, 'images/photo.jpg')
+
+    def test_old_drafts_without_targets_stay_live(self):
+        draft = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Draft')
+        Post.objects.filter(id=draft.id).update(created_at=self.old)
+
+        self.assertEqual(archive_posts(archive_cutoff(90)), 0)
+        self.assertTrue(Post.objects.filter(id=draft.id).exists())
+        self.assertFalse(ArchivedPost.objects.exists())
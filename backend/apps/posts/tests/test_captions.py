@@ -0,0 +1,59 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.integrations.models import Platform
+from apps.posts.models import Post, RenderedCaption
+from apps.posts.services.captions import ELLIPSIS, get_rendered_captions, render_caption
+
+User = get_user_model()
+
+
+class RenderCaptionTest(TestCase):
+    def test_joins_normalized_hashtags(self):
+        text = render_caption('Launch day', ['launch', '#Launch', ' news '], Platform.LINKEDIN.value)
+        self.assertEqual(text, 'Launch day\n\n#launch #news')
+
+    def test_caps_hashtags_per_platform(self):
+        tags = [f'tag{index}' for index in range(40)]
+        text = render_caption('Hello', tags, Platform.INSTAGRAM.value)
+        self.assertEqual(text.count('#'), 30)
+
+    def test_drops_hashtags_before_truncating_caption(self):
+        caption = 'a' * 276
+        text = render_caption(caption, ['one', 'two'], Platform.X.value)
+        self.assertEqual(text, caption)
+
+    def test_truncates_at_word_boundary_and_counts_links_as_shortened(self):
+        url = 'https://example.com/' + 'x' * 100
+        caption = f'{url} ' + 'word ' * 60
+        text = render_caption(caption, [], Platform.X.value)
+        self.assertTrue(text.startswith(url))
+        self.assertTrue(text.endswith(f'word{ELLIPSIS}'))
+
+
+class RenderedCaptionStoreTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.post = Post.objects.create(
+            user=self.user,
+            content_type=Post.ContentType.TEXT,
+            caption='Hello',
+            hashtags=['launch'],
+        )
+
+    def test_renders_once_per_platform(self):
+        get_rendered_captions(self.post, [Platform.X.value, Platform.LINKEDIN.value])
+        with self.assertNumQueries(1):
+            texts = get_rendered_captions(self.post, [Platform.X.value, Platform.LINKEDIN.value])
+        self.assertEqual(texts[Platform.X.value], 'Hello\n\n#launch')
+        self.assertEqual(RenderedCaption.objects.filter(post=self.post).count(), 2)
+
+    def test_rerenders_after_caption_change(self):
+        get_rendered_captions(self.post, [Platform.X.value])
+        self.post.caption = 'Updated'
+        self.post.save()
+
+        texts = get_rendered_captions(self.post, [Platform.X.value])
+
+        self.assertEqual(texts[Platform.X.value], 'Updated\n\n#launch')
+        self.assertEqual(RenderedCaption.objects.get(post=self.post).text, 'Updated\n\n#launch')
@@ -0,0 +1,105 @@
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget, PostTemplate
+
+User = get_user_model()
+
+
+class PostDuplicationTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.post = Post.objects.create(
+            user=self.user,
+            content_type=Post.ContentType.VIDEO,
+            caption='Launch day',
+            hashtags=['launch'],
+            media_metadata={'video_duration': 30},
+        )
+        self.post.video_file.save('launch.mp4', ContentFile(b'video-bytes'))
+        self.accounts = [
+            SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name=f'X {index}')
+            for index in range(5)
+        ]
+        for account in self.accounts:
+            PostTarget.objects.create(post=self.post, social_account=account, status=PostTarget.Status.PUBLISHED)
+
+    def test_duplicate_shares_media_and_resets_targets(self):
+        response = self.client.post(f'/api/posts/{self.post.id}/duplicate', {'caption': 'Launch week'}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        copy = Post.objects.get(id=response.data['id'])
+        self.assertEqual(copy.caption, 'Launch week')
+        self.assertEqual(copy.hashtags, ['launch'])
+        self.assertEqual(copy.video_file.name, self.post.video_file.name)
+        self.assertEqual(
+            set(copy.targets.values_list('social_account_id', 'status')),
+            {(account.id, PostTarget.Status.SELECTED) for account in self.accounts},
+        )
+
+    def test_duplicate_query_count_does_not_grow_with_targets(self):
+        with self.assertNumQueries(10) as context:
+            self.client.post(f'/api/posts/{self.post.id}/duplicate')
+        inserts = [query['sql'] for query in context.captured_queries if 'INSERT INTO "posts_posttarget"' in query['sql']]
+        self.assertEqual(len(inserts), 1)
+
+    def test_replacing_media_on_copy_keeps_original_file(self):
+        copy_id = self.client.post(f'/api/posts/{self.post.id}/duplicate').data['id']
+        copy = Post.objects.get(id=copy_id)
+        copy.video_file.save('recut.mp4', ContentFile(b'new-bytes'))
+
+        self.post.refresh_from_db()
+        self.assertTrue(self.post.video_file.storage.exists(self.post.video_file.name))
+        self.assertNotEqual(copy.video_file.name, self.post.video_file.name)
+
+    def test_cannot_duplicate_another_users_post(self):
+        other = User.objects.create_user(username='other', password='testpass')
+        self.client.force_authenticate(user=other)
+
+        self.assertEqual(self.client.post(f'/api/posts/{self.post.id}/duplicate').status_code, 404)
+
+    def test_save_as_template_and_create_post(self):
+        response = self.client.post(f'/api/posts/{self.post.id}/save-as-template', {'name': 'Launch'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        template = PostTemplate.objects.get(id=response.data['id'])
+        self.assertEqual(template.video_file.name, self.post.video_file.name)
+        self.assertEqual(sorted(response.data['social_account_ids']), [account.id for account in self.accounts])
+
+        self.accounts[0].delete()
+        response = self.client.post(f'/api/posts/templates/{template.id}/create-post')
+
+        self.assertEqual(response.status_code, 201)
+        created = Post.objects.get(id=response.data['id'])
+        self.assertEqual(created.video_file.name, self.post.video_file.name)
+        self.assertEqual(created.targets.count(), 4)
+
+    def test_templates_are_scoped_to_owner(self):
+        other = User.objects.create_user(username='other', password='testpass')
+        foreign_account = SocialAccount.objects.create(user=other, platform=Platform.X, display_name='Other')
+        PostTemplate.objects.create(user=other, name='Theirs', content_type=Post.ContentType.TEXT)
+
+        response = self.client.post('/api/posts/templates', {
+            'name': 'Mine',
+            'content_type': Post.ContentType.TEXT,
+            'caption': 'Hello',
+            'social_account_ids': [foreign_account.id],
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get('/api/posts/templates')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import ArchivedPost, ArchivedPostTarget, Post, PostTarget
+from apps.posts.services.export import export_rows
+
+User = get_user_model()
+
+
+class PostExportTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        self.post = Post.objects.create(
+            user=self.user, content_type=Post.ContentType.TEXT, caption='Hello, "world"', hashtags=['launch', 'news'],
+        )
+        self.target = PostTarget.objects.create(
+            post=self.post, social_account=self.account, status=PostTarget.Status.REJECTED, last_error='Nope',
+        )
+        self.draft = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Draft')
+        now = timezone.now()
+        ArchivedPost.objects.create(
+            id=9001, user_id=self.user.id, content_type='TEXT', caption='Old', created_at=now, hashtags=[],
+        )
+        ArchivedPostTarget.objects.create(
+            id=9101, post_id=9001, user_id=self.user.id, social_account_id=self.account.id, platform='x',
+            content_type='TEXT', status='published', created_at=now,
+        )
+        ArchivedPost.objects.create(
+            id=9002, user_id=self.user.id, content_type='TEXT', caption='Lonely', created_at=now, hashtags=[],
+        )
+        other = User.objects.create_user(username='other', password='testpass')
+        Post.objects.create(user=other, content_type=Post.ContentType.TEXT, caption='Not mine')
+
+    def _body(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_csv_export_streams_live_and_archived_history(self):
+        response = self.client.get('/api/posts/export', HTTP_ACCEPT='text/csv')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(self._body(response))))
+        self.assertEqual(
+            [(row['post_id'], row['target_id'], row['status'], row['archived']) for row in rows],
+            [
+                (str(self.post.id), str(self.target.id), 'rejected', 'False'),
+                (str(self.draft.id), '', '', 'False'),
+                ('9001', '9101', 'published', 'True'),
+                ('9002', '', '', 'True'),
+            ],
+        )
+        self.assertEqual(rows[0]['caption'], 'Hello, "world"')
+        self.assertEqual(rows[0]['hashtags'], 'launch news')
+        self.assertEqual(rows[2]['caption'], 'Old')
+
+    def test_ndjson_export(self):
+        response = self.client.get('/api/posts/export', {'output': 'ndjson'})
+
+        lines = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0]['hashtags'], ['launch', 'news'])
+        self.assertEqual(lines[0]['last_error'], 'Nope')
+
+    def test_unknown_output_is_rejected(self):
+        self.assertEqual(self.client.get('/api/posts/export', {'output': 'xml'}).status_code, 400)
+
+    def test_queries_grow_with_chunks_not_rows(self):
+        for index in range(9):
+            post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption=f'Post {index}')
+            PostTarget.objects.create(post=post, social_account=self.account)
+
+        # 11 live posts in chunks of 4: one post cursor and three target prefetches,
+        # then archived targets, their posts (live and archived) and lone archived posts.
+        with self.assertNumQueries(8):
+            rows = list(export_rows(self.user, chunk_size=4))
+
+        self.assertEqual(len(rows), 13)
@@ -0,0 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.posts.models import Post, PostHashtag
+from apps.posts.services.hashtags import sync_post_hashtags
+
+User = get_user_model()
+
+
+class HashtagIndexTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _post(self, hashtags, user=None):
+        return Post.objects.create(
+            user=user or self.user,
+            content_type=Post.ContentType.TEXT,
+            caption='Hello',
+            hashtags=hashtags,
+        )
+
+    def _indexed(self, post):
+        return set(PostHashtag.objects.filter(post=post).values_list('hashtag__name', flat=True))
+
+    def test_save_keeps_index_in_sync(self):
+        post = self._post(['Launch', '#news'])
+        self.assertEqual(self._indexed(post), {'launch', 'news'})
+
+        post.hashtags = ['news', 'sale']
+        post.save()
+        self.assertEqual(self._indexed(post), {'news', 'sale'})
+
+    def test_bulk_import_sync(self):
+        posts = Post.objects.bulk_create(
+            Post(user=self.user, content_type=Post.ContentType.TEXT, caption='Hi', hashtags=['launch'])
+            for _ in range(3)
+        )
+        with self.assertNumQueries(4):
+            sync_post_hashtags(posts)
+        self.assertEqual(PostHashtag.objects.filter(hashtag__name='launch').count(), 3)
+
+    def test_overlong_hashtags_are_rejected_and_not_indexed(self):
+        response = self.client.post('/api/posts/', {
+            'content_type': 'TEXT', 'caption': 'Hello', 'hashtags': ['launch', 'x' * 256],
+        }, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('hashtags', response.data)
+        self.assertFalse(Post.objects.exists())
+
+        post = self._post(['launch', 'x' * 256])
+        self.assertEqual(self._indexed(post), {'launch'})
+
+    def test_filter_posts_by_hashtag(self):
+        tagged = self._post(['launch'])
+        self._post(['other'])
+        other_user = User.objects.create_user(username='other', password='testpass')
+        self._post(['launch'], user=other_user)
+
+        response = self.client.get('/api/posts/', {'hashtag': '#Launch'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.data], [tagged.id])
+
+    def test_hashtag_frequencies(self):
+        self._post(['launch', 'news'])
+        self._post(['launch'])
+
+        response = self.client.get('/api/posts/hashtags')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [{'hashtag': 'launch', 'count': 2}, {'hashtag': 'news', 'count': 1}])
+
+    def test_hashtag_frequencies_rejects_invalid_limits(self):
+        for limit in ('abc', '0', '-1'):
+            response = self.client.get('/api/posts/hashtags', {'limit': limit})
+
+            self.assertEqual(response.status_code, 400, limit)
+            self.assertEqual(response.data, {'detail': 'Invalid limit.'})
@@ -0,0 +1,101 @@
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from apps.posts.models import Post
+
+User = get_user_model()
+
+VIDEO = bytes(range(256)) * 40
+
+
+class PostMediaViewTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.post = Post.objects.create(user=self.user, content_type=Post.ContentType.VIDEO, caption='Clip')
+        self.post.video_file.save('clip.mp4', ContentFile(VIDEO))
+        self.url = f'/api/posts/{self.post.id}/media/video'
+
+    def _body(self, response):
+        body = b''.join(response.streaming_content)
+        response.close()
+        return body
+
+    def test_full_response_advertises_ranges(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Type'], 'video/mp4')
+        self.assertEqual(self._body(response), VIDEO)
+
+    def test_range_returns_partial_content(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=100-199', HTTP_ACCEPT='video/*')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(VIDEO)}')
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(self._body(response), VIDEO[100:200])
+
+    def test_open_and_suffix_ranges(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=10000-')
+        self.assertEqual(self._body(response), VIDEO[10000:])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-24')
+        self.assertEqual(response['Content-Range'], f'bytes {len(VIDEO) - 24}-{len(VIDEO) - 1}/{len(VIDEO)}')
+        self.assertEqual(self._body(response), VIDEO[-24:])
+
+    def test_unsatisfiable_range(self):
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(VIDEO)}-')
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(VIDEO)}')
+
+    def test_if_range_mismatch_sends_whole_file(self):
+        etag = self.client.get(self.url)['ETag']
+
+        matching = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag)
+        stale = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        old_date = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=http_date(0))
+
+        self.assertEqual(matching.status_code, 206)
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(old_date.status_code, 200)
+        for response in (matching, stale, old_date):
+            response.close()
+
+    def test_other_users_media_is_not_served(self):
+        other = User.objects.create_user(username='other', password='testpass')
+        self.client.force_authenticate(user=other)
+
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_missing_media_kind_is_not_found(self):
+        self.assertEqual(self.client.get(f'/api/posts/{self.post.id}/media/image').status_code, 404)
+
+    @override_settings(MEDIA_DELIVERY='x-accel-redirect', MEDIA_ACCEL_REDIRECT_PREFIX='/protected-media/')
+    def test_accel_redirect_mode_hands_off_to_nginx(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.post.video_file.name}')
+        self.assertEqual(response.content, b'')
+
+    def test_serializer_exposes_preview_url(self):
+        response = self.client.get(f'/api/posts/{self.post.id}')
+
+        self.assertTrue(response.data['video_preview_url'].endswith(self.url))
+        self.assertIsNone(response.data['image_preview_url'])
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import time
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.posts.models import ArchivedPost, Post, PostTemplate
+from apps.posts.services.media_gc import collect_orphaned_media, iter_media_files
+
+User = get_user_model()
+
+DAY = 24 * 60 * 60
+
+
+class CollectOrphanedMediaTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+
+    def _file(self, name, age=2 * DAY):
+        name = default_storage.save(name, ContentFile(b'data'))
+        modified = time.time() - age
+        os.utime(default_storage.path(name), (modified, modified))
+        return name
+
+    def test_deletes_only_old_unreferenced_files(self):
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.PHOTO)
+        post.image_file.name = self._file('images/post.jpg')
+        post.save()
+        PostTemplate.objects.create(
+            user=self.user, name='Launch', content_type=Post.ContentType.VIDEO,
+            video_file=self._file('videos/template.mp4'),
+        )
+        ArchivedPost.objects.create(
+            id=999, user_id=self.user.id, content_type=Post.ContentType.PHOTO,
+            image_file=self._file('images/2023/archived.jpg'), created_at=timezone.now(),
+        )
+        orphan = self._file('images/orphan.jpg')
+        nested_orphan = self._file('videos/2023/orphan.mp4')
+        uploading = self._file('images/uploading.jpg', age=60)
+
+        result = collect_orphaned_media(grace=DAY, batch_size=2)
+
+        self.assertEqual((result.scanned, result.referenced, result.recent, result.deleted), (6, 3, 1, 2))
+        self.assertFalse(default_storage.exists(orphan))
+        self.assertFalse(default_storage.exists(nested_orphan))
+        self.assertTrue(default_storage.exists(uploading))
+        self.assertEqual(
+            sorted(iter_media_files()),
+            ['images/2023/archived.jpg', 'images/post.jpg', 'images/uploading.jpg', 'videos/template.mp4'],
+        )
+
+    def test_shared_file_is_kept_while_any_row_references_it(self):
+        name = self._file('images/shared.jpg')
+        first = Post.objects.create(user=self.user, content_type=Post.ContentType.PHOTO, image_file=name)
+        Post.objects.create(user=self.user, content_type=Post.ContentType.PHOTO, image_file=name)
+
+        first.delete()
+        collect_orphaned_media(grace=DAY)
+
+        self.assertTrue(default_storage.exists(name))
+
+    def test_dry_run_keeps_files(self):
+        orphan = self._file('images/orphan.jpg')
+
+        result = collect_orphaned_media(grace=DAY, dry_run=True)
+
+        self.assertEqual(result.deleted, 1)
+        self.assertTrue(default_storage.exists(orphan))
+
+    def test_lookups_are_batched(self):
+        for index in range(10):
+            self._file(f'images/orphan-{index}.jpg', age=60)
+
+        # One IN lookup per media column per batch; recent files need no recheck.
+        with self.assertNumQueries(12):
+            collect_orphaned_media(grace=DAY, batch_size=5)
+
+    def test_command_reports_counts(self):
+        self._file('images/orphan.jpg')
+        out = StringIO()
+
+        call_command('collect_orphaned_media', '--dry-run', stdout=out)
+
+        self.assertIn('Would delete 1 orphan(s).', out.getvalue())
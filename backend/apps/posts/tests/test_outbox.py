@@ -0,0 +1,79 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget, PublishOutboxEntry
+from apps.posts.routing import publish_queue
+from apps.posts.services.outbox import relay_outbox
+from config.celery import app as celery_app
+
+User = get_user_model()
+
+
+class PublishOutboxTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        self.accounts = [
+            SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name=f'X {index}')
+            for index in range(5)
+        ]
+        self.targets = [PostTarget.objects.create(post=self.post, social_account=account) for account in self.accounts]
+
+    def test_publish_writes_outbox_and_relays_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(f'/api/posts/{self.post.id}/publish')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['queued_post_target_ids']), 5)
+        self.assertEqual(PublishOutboxEntry.objects.count(), 5)
+        self.assertEqual(len(callbacks), 1)
+
+        callbacks[0]()
+        self.assertFalse(PublishOutboxEntry.objects.exists())
+
+    def test_relay_drains_in_batches_to_the_broker(self):
+        PublishOutboxEntry.objects.bulk_create(
+            PublishOutboxEntry(post_target=target, platform=Platform.X.value) for target in self.targets
+        )
+        celery_app.conf.CELERY_TASK_ALWAYS_EAGER = False
+        self.addCleanup(setattr, celery_app.conf, 'CELERY_TASK_ALWAYS_EAGER', True)
+
+        relayed = relay_outbox(batch_size=2)
+
+        self.assertEqual(relayed, 5)
+        self.assertFalse(PublishOutboxEntry.objects.exists())
+        with celery_app.connection_for_write() as broker:
+            self.assertEqual(broker.SimpleQueue(publish_queue(Platform.X.value)).clear(), 5)
+
+    def test_sends_claimed_batches_outside_a_transaction(self):
+        entries = PublishOutboxEntry.objects.bulk_create(
+            PublishOutboxEntry(post_target=target, platform=Platform.X.value) for target in self.targets
+        )
+        # A batch another relay is still sending, and one whose relay died.
+        PublishOutboxEntry.objects.filter(id=entries[0].id).update(claimed_at=timezone.now(), relay_id='busy')
+        PublishOutboxEntry.objects.filter(id=entries[1].id).update(
+            claimed_at=timezone.now() - timedelta(hours=1), relay_id='dead',
+        )
+        outer_blocks = len(connection.atomic_blocks)
+        sent = []
+
+        def enqueue(post_target_id, platform, lane, producer):
+            self.assertEqual(len(connection.atomic_blocks), outer_blocks)
+            claimed = PublishOutboxEntry.objects.get(post_target_id=post_target_id)
+            self.assertNotIn(claimed.relay_id, ('', 'busy', 'dead'))
+            sent.append(post_target_id)
+
+        with mock.patch('apps.posts.services.outbox.enqueue_publish_target', side_effect=enqueue):
+            self.assertEqual(relay_outbox(batch_size=2), 4)
+
+        self.assertEqual(sent, [target.id for target in self.targets[1:]])
+        self.assertEqual(list(PublishOutboxEntry.objects.values_list('id', flat=True)), [entries[0].id])
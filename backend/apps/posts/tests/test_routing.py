@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+from apps.posts.routing import LANE_BULK, publish_queue
+from apps.posts.tasks import enqueue_publish_target
+from config.celery import app as celery_app
+
+User = get_user_model()
+
+
+class PublishRoutingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.VIDEO, caption='Hello')
+        youtube = SocialAccount.objects.create(user=self.user, platform=Platform.YOUTUBE, display_name='YT')
+        x_account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        self.youtube_target = PostTarget.objects.create(post=post, social_account=youtube)
+        self.x_target = PostTarget.objects.create(post=post, social_account=x_account)
+        celery_app.conf.CELERY_TASK_ALWAYS_EAGER = False
+        self.addCleanup(setattr, celery_app.conf, 'CELERY_TASK_ALWAYS_EAGER', True)
+        self.queues = {
+            publish_queue(Platform.YOUTUBE.value, LANE_BULK),
+            publish_queue(Platform.X.value),
+        }
+        self.addCleanup(self._purge)
+
+    def _purge(self):
+        with celery_app.connection_for_write() as connection:
+            for name in self.queues:
+                connection.SimpleQueue(name).clear()
+
+    def _drain(self, connection, name):
+        queue = connection.SimpleQueue(name)
+        messages = []
+        while True:
+            try:
+                message = queue.get(block=False)
+            except queue.Empty:
+                return messages
+            message.ack()
+            messages.append(message)
+
+    def test_slow_platform_backlog_does_not_block_other_platforms(self):
+        for _ in range(50):
+            enqueue_publish_target(self.youtube_target.id, Platform.YOUTUBE.value, lane=LANE_BULK)
+        enqueue_publish_target(self.x_target.id, Platform.X.value)
+
+        with celery_app.connection_for_read() as connection:
+            x_messages = self._drain(connection, publish_queue(Platform.X.value))
+            youtube_messages = self._drain(connection, publish_queue(Platform.YOUTUBE.value, LANE_BULK))
+
+        # The X publish is first in its own queue instead of 51st behind the YouTube backlog.
+        self.assertEqual(len(x_messages), 1)
+        self.assertEqual(list(x_messages[0].payload[0]), [self.x_target.id])
+        self.assertEqual(len(youtube_messages), 50)
@@ -0,0 +1,76 @@
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from apps.posts.models import Post
+from apps.posts.services.search import search_index_missing, search_posts
+
+User = get_user_model()
+
+
+class CaptionSearchTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _post(self, caption):
+        return Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption=caption)
+
+    def test_index_follows_inserts_updates_and_deletes(self):
+        post = self._post('Summer launch party')
+        self.assertEqual(list(search_posts(Post.objects.all(), 'launch')), [post])
+
+        post.caption = 'Winter sale'
+        post.save()
+        self.assertFalse(search_posts(Post.objects.all(), 'launch').exists())
+        self.assertEqual(list(search_posts(Post.objects.all(), 'sale')), [post])
+
+        post.delete()
+        self.assertFalse(search_posts(Post.objects.all(), 'sale').exists())
+
+    def test_query_syntax_is_not_interpreted(self):
+        self._post('Launch: "big" day')
+        self.assertEqual(search_posts(Post.objects.all(), '"big" OR (').count(), 0)
+        self.assertEqual(search_posts(Post.objects.all(), 'launch big').count(), 1)
+
+    def test_posts_search_parameter(self):
+        match = self._post('New product launch')
+        self._post('Unrelated update')
+
+        response = self.client.get('/api/posts/', {'q': 'launch'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.data], [match.id])
+
+    def test_admin_search_uses_index(self):
+        admin_user = User.objects.create_superuser(username='admin', password='testpass')
+        self._post('Admin visible launch')
+        self.client.force_login(admin_user)
+
+        response = self.client.get('/admin/posts/post/', {'q': 'launch'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].result_count, 1)
+
+
+class SearchIndexMigrateTest(TransactionTestCase):
+    def test_index_exists_after_migrate(self):
+        self.assertFalse(search_index_missing(connection))
+
+    def test_migrate_reinstalls_triggers_a_table_rebuild_dropped(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Only SQLite keeps the index in triggers.')
+        # What an AlterField on Post does on SQLite: copy into a new table.
+        with connection.schema_editor() as editor:
+            editor._remake_table(Post)
+        self.assertTrue(search_index_missing(connection))
+
+        call_command('migrate', verbosity=0)
+
+        self.assertFalse(search_index_missing(connection))
+        user = get_user_model().objects.create_user(username='testuser', password='testpass')
+        post = Post.objects.create(user=user, content_type=Post.ContentType.TEXT, caption='Summer launch')
+        self.assertEqual(list(search_posts(Post.objects.all(), 'launch')), [post])
@@ -0,0 +1,88 @@
+from unittest import mock
+
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from apps.analytics.models import DailyPublishStat
+from apps.integrations.models import Platform, SocialAccount
+from apps.integrations.services.publish_client import PublishClient, PublishResult
+from apps.posts.models import Post, PostTarget, RenderedCaption
+from apps.posts.services.loadtest import LoadTestReport
+from apps.posts.tasks import publish_target
+
+User = get_user_model()
+
+
+class FailingPublishClient(PublishClient):
+    def publish(self, target, caption):
+        return PublishResult(ok=False, error='Rate limited.')
+
+
+class PublishTargetTaskTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+        account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        self.target = PostTarget.objects.create(post=post, social_account=account, status=PostTarget.Status.QUEUED)
+
+    def test_publishes_queued_target(self):
+        result = publish_target(self.target.id)
+
+        self.target.refresh_from_db()
+        self.assertEqual(result['status'], PostTarget.Status.PUBLISHED)
+        self.assertEqual(self.target.status, PostTarget.Status.PUBLISHED)
+        self.assertEqual(dict(DailyPublishStat.objects.values_list('status', 'count')), {'published': 1})
+
+    @override_settings(PUBLISH_CLIENT='apps.posts.tests.test_tasks.FailingPublishClient')
+    def test_platform_failure_rejects_target(self):
+        publish_target(self.target.id)
+
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.status, PostTarget.Status.REJECTED)
+        self.assertEqual(self.target.last_error, 'Rate limited.')
+
+    @override_settings(PUBLISH_TRANSIENT_MAX_RETRIES=2, PUBLISH_TRANSIENT_RETRY_DELAY=3)
+    def test_transient_failures_are_retried_with_backoff(self):
+        client = mock.Mock()
+        client.publish.return_value = PublishResult(ok=False, error='Platform answered 503.', retryable=True)
+
+        with mock.patch('apps.posts.tasks.get_publish_client', return_value=client), \
+                mock.patch('apps.posts.tasks.retry_task', return_value=Retry()) as retry:
+            with self.assertRaises(Retry):
+                publish_target(self.target.id, failed_attempts=1)
+            self.assertEqual(retry.call_args.kwargs, {'countdown': 6, 'kwargs': {'failed_attempts': 2}})
+            self.assertEqual(PostTarget.objects.get(id=self.target.id).status, PostTarget.Status.QUEUED)
+
+            publish_target(self.target.id, failed_attempts=2)
+
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.status, PostTarget.Status.REJECTED)
+        self.assertEqual(self.target.last_error, 'Platform answered 503.')
+
+    def test_sends_the_caption_rendered_for_the_platform(self):
+        Post.objects.filter(id=self.target.post_id).update(hashtags=['launch'])
+        client = mock.Mock()
+        client.publish.return_value = PublishResult(ok=True)
+
+        with mock.patch('apps.posts.tasks.get_publish_client', return_value=client):
+            publish_target(self.target.id)
+
+        self.assertEqual(client.publish.call_args.args[1], 'Hello\n\n#launch')
+        self.assertEqual(RenderedCaption.objects.get(post_id=self.target.post_id).text, 'Hello\n\n#launch')
+
+    def test_redelivery_is_ignored(self):
+        publish_target(self.target.id)
+        result = publish_target(self.target.id)
+
+        self.assertIsNone(result['status'])
+        self.assertEqual(DailyPublishStat.objects.get().count, 1)
+
+
+class LoadTestReportTest(TestCase):
+    def test_percentiles_use_nearest_rank(self):
+        report = LoadTestReport(published=100, elapsed=4.0, latencies=[index / 100 for index in range(1, 101)])
+
+        self.assertEqual(report.percentile(50), 0.5)
+        self.assertEqual(report.percentile(99), 0.99)
+        self.assertEqual(report.throughput, 25.0)
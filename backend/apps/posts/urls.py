@@ -1,9 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from apps.posts.views import PostViewSet
+from apps.posts.views import PostTemplateViewSet, PostViewSet
 
 router = DefaultRouter(trailing_slash=False)
+# Registered first so 'templates' is not taken for a post id.
+router.register('templates', PostTemplateViewSet, basename='post-templates')
 router.register('', PostViewSet, basename='posts')
 
 app_name = 'posts'
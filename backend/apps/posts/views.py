@@ -1,25 +1,119 @@
 ﻿from dataclasses import asdict
 
+from django.db import transaction
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.capabilities.services.availability_service import evaluate_availability
-from apps.posts.models import Post, PostTarget
-from apps.posts.serializers import PostSerializer
-from apps.posts.tasks import publish_target
+from apps.analytics.services.stats_service import record_status_changes
+from apps.capabilities.reasons import Reason, encode_reason
+from apps.capabilities.services.availability_service import REASON_ACCOUNT_UNAVAILABLE, evaluate_availability
+from apps.common.db_router import replica_reads
+from apps.common.renderers import PassthroughRenderer
+from apps.common.throttling import ComposerThrottle, PublishThrottle
+from apps.posts.models import Post, PostTarget, PostTemplate
+from apps.posts.serializers import (
+    DuplicatePostSerializer,
+    PostSerializer,
+    PostTemplateSerializer,
+    SaveTemplateSerializer,
+)
+from apps.posts.services.captions import get_rendered_captions
+from apps.posts.services.duplication import create_post_from_template, duplicate_post, save_as_template
+from apps.posts.services.export import EXPORT_FORMATS, stream_export
+from apps.posts.services.hashtags import filter_posts_by_hashtag, hashtag_frequencies
+from apps.posts.services.media_delivery import serve_media
+from apps.posts.services.outbox import add_to_outbox
+from apps.posts.services.search import search_posts
 
 
 class PostViewSet(viewsets.ModelViewSet):
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticated]
+    composer_actions = {'create', 'update', 'partial_update', 'duplicate'}
+
+    def get_throttles(self):
+        if self.action == 'publish':
+            return [PublishThrottle()]
+        if self.action in self.composer_actions:
+            return [ComposerThrottle()]
+        return super().get_throttles()
 
     def get_queryset(self):
-        return Post.objects.filter(user=self.request.user).order_by('-id')
+        queryset = Post.objects.filter(user=self.request.user).order_by('-id')
+        if self.action == 'list':
+            hashtag = self.request.query_params.get('hashtag')
+            if hashtag:
+                queryset = filter_posts_by_hashtag(queryset, self.request.user, hashtag)
+            query = self.request.query_params.get('q')
+            if query:
+                queryset = search_posts(queryset, query)
+        return queryset
+
+    @replica_reads
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @action(detail=False, methods=['get'])
+    @replica_reads
+    def hashtags(self, request):
+        try:
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return Response({'detail': 'Invalid limit.'}, status=status.HTTP_400_BAD_REQUEST)
+        frequencies = hashtag_frequencies(request.user, limit)
+        return Response([{'hashtag': row['hashtag__name'], 'count': row['count']} for row in frequencies])
+
+    @action(detail=False, methods=['get'], renderer_classes=[PassthroughRenderer])
+    def export(self, request):
+        # ``format`` is taken by DRF's renderer override, hence ``output``.
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_FORMATS:
+            return JsonResponse({'detail': 'output must be csv or ndjson.'}, status=status.HTTP_400_BAD_REQUEST)
+        content_type, extension = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(stream_export(request.user, output), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="posts.{extension}"'
+        return response
+
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path=r'media/(?P<kind>image|video)',
+        renderer_classes=[PassthroughRenderer],
+    )
+    def media(self, request, pk=None, kind=None):
+        # get_object() scopes the lookup to the requesting user's posts.
+        field_file = getattr(self.get_object(), f'{kind}_file')
+        if not field_file:
+            raise Http404
+        return serve_media(request, field_file)
+
+    @action(detail=True, methods=['post'])
+    def duplicate(self, request, pk=None):
+        serializer = DuplicatePostSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        post = duplicate_post(self.get_object(), caption=serializer.validated_data.get('caption'))
+        return Response(self.get_serializer(post).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['post'], url_path='save-as-template')
+    def save_as_template(self, request, pk=None):
+        serializer = SaveTemplateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        template = save_as_template(self.get_object(), serializer.validated_data['name'])
+        return Response(
+            PostTemplateSerializer(template, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
 
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def publish(self, request, pk=None):
+        # Status changes and their outbox entries commit together; the relay
+        # sends them to the broker after commit, outside this request.
         post = self.get_object()
         availability = evaluate_availability(request.user, post.content_type, post.media_metadata)
         availability_by_account = {}
@@ -29,29 +123,54 @@ class PostViewSet(viewsets.ModelViewSet):
 
         queued = []
         rejected = []
+        status_changes = []
 
         for target in PostTarget.objects.filter(post=post).select_related('social_account'):
+            previous_status = target.status
             account_availability = availability_by_account.get(target.social_account_id)
             if not account_availability or not account_availability.available:
-                reason = account_availability.reason if account_availability else 'Account not available for publishing.'
+                reason = account_availability.reason if account_availability else REASON_ACCOUNT_UNAVAILABLE
                 target.status = PostTarget.Status.REJECTED
-                target.last_error = reason
-                target.save(update_fields=['status', 'last_error'])
+                target.reason_code, target.last_error = encode_reason(reason)
+                target.save(update_fields=['status', 'reason_code', 'last_error'])
                 rejected.append({
                     'post_target_id': target.id,
                     'social_account_id': target.social_account_id,
+                    'reason_code': target.reason_code,
                     'reason': reason,
                 })
-                continue
-            target.status = PostTarget.Status.QUEUED
-            target.last_error = ''
-            target.save(update_fields=['status', 'last_error'])
-            publish_target.delay(target.id)
-            queued.append(target.id)
+            else:
+                target.status = PostTarget.Status.QUEUED
+                target.reason_code, target.last_error = Reason.NONE, ''
+                target.save(update_fields=['status', 'reason_code', 'last_error'])
+                queued.append(target)
+            if target.status != previous_status:
+                status_changes.append((post.user_id, target.social_account.platform, post.content_type, target.status))
+        record_status_changes(status_changes)
+        get_rendered_captions(post, {target.social_account.platform for target in queued})
+        add_to_outbox(queued)
 
         payload = {
-            'queued_post_target_ids': queued,
+            'queued_post_target_ids': [target.id for target in queued],
             'rejected': rejected,
             'availability': [asdict(item) for item in availability],
         }
         return Response(payload, status=status.HTTP_200_OK)
+
+
+class PostTemplateViewSet(viewsets.ModelViewSet):
+    serializer_class = PostTemplateSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return PostTemplate.objects.filter(user=self.request.user).prefetch_related('social_accounts').order_by('-id')
+
+    @action(detail=True, methods=['post'], url_path='create-post')
+    def create_post(self, request, pk=None):
+        serializer = DuplicatePostSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        post = create_post_from_template(self.get_object(), caption=serializer.validated_data.get('caption'))
+        return Response(
+            PostSerializer(post, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from apps.webhooks.models import WebhookEvent
+
+
+@admin.register(WebhookEvent)
+class WebhookEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'platform', 'post_target_id', 'status', 'received_at']
+    list_filter = ['platform', 'status']
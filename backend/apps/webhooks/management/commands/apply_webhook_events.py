@@ -0,0 +1,25 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.webhooks.services.ingestion_service import apply_webhook_events
+
+
+class Command(BaseCommand):
+    help = 'Apply buffered platform callbacks to post targets in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.WEBHOOK_BATCH_SIZE)
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds to sleep when the buffer is empty.')
+        parser.add_argument('--once', action='store_true', help='Drain the buffer once and exit.')
+
+    def handle(self, *args, **options):
+        while True:
+            consumed = apply_webhook_events(options['batch_size'])
+            if consumed:
+                self.stdout.write(f'Applied {consumed} event(s).')
+            if options['once']:
+                return
+            if not consumed:
+                time.sleep(options['interval'])
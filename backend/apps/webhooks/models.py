@@ -0,0 +1,16 @@
+from django.db import models
+
+from apps.integrations.models import Platform
+
+
+class WebhookEvent(models.Model):
+    """A buffered delivery callback, applied to ``PostTarget`` by ``services.ingestion_service``."""
+
+    platform = models.CharField(max_length=20, choices=Platform.choices)
+    post_target_id = models.BigIntegerField()
+    status = models.CharField(max_length=10)
+    error = models.TextField(blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'{self.platform}:{self.post_target_id}:{self.status}'
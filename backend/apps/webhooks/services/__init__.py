@@ -0,0 +1,11 @@
+from .ingestion_service import (
+    apply_webhook_events,
+    parse_events,
+    verify_signature,
+)
+
+__all__ = [
+    'apply_webhook_events',
+    'parse_events',
+    'verify_signature',
+]
@@ -0,0 +1,100 @@
+import hashlib
+import hmac
+import json
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.analytics.services.stats_service import record_status_changes
+from apps.capabilities.reasons import encode_reason
+from apps.posts.models import PostTarget
+from apps.webhooks.models import WebhookEvent
+
+SIGNATURE_HEADER = 'HTTP_X_WEBHOOK_SIGNATURE'
+ACCEPTED_STATUSES = {PostTarget.Status.PUBLISHED.value, PostTarget.Status.REJECTED.value}
+
+
+class InvalidPayload(ValueError):
+    pass
+
+
+def verify_signature(platform, body, signature):
+    """Check ``signature`` ("sha256=<hex>") against an HMAC of the raw body."""
+    secret = settings.WEBHOOK_SECRETS.get(platform)
+    if not secret or not signature or not signature.startswith('sha256='):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len('sha256='):])
+
+
+def parse_events(platform, body):
+    """Turn a callback body (one event or ``{"events": [...]}``) into unsaved ``WebhookEvent`` rows."""
+    try:
+        payload = json.loads(body)
+    except ValueError as exc:
+        raise InvalidPayload('Body is not valid JSON.') from exc
+    items = payload.get('events', [payload]) if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        raise InvalidPayload('Expected an event object or {"events": [...]}.')
+    events = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise InvalidPayload('Each event must be an object.')
+        post_target_id = item.get('post_target_id')
+        status = item.get('status')
+        if not isinstance(post_target_id, int) or status not in ACCEPTED_STATUSES:
+            raise InvalidPayload('Each event needs an integer post_target_id and a known status.')
+        events.append(WebhookEvent(
+            platform=platform,
+            post_target_id=post_target_id,
+            status=status,
+            error=str(item.get('error') or ''),
+        ))
+    return events
+
+
+def apply_webhook_events(batch_size=None):
+    """Apply buffered events to their targets, one batch per transaction.
+
+    Only the newest event per target in a batch counts, and targets are
+    updated with one UPDATE per (status, reason) group rather than per event.
+    Events for a target on another platform are dropped. Returns the number
+    of events consumed.
+    """
+    batch_size = batch_size or settings.WEBHOOK_BATCH_SIZE
+    consumed = 0
+    while True:
+        with transaction.atomic():
+            events = list(WebhookEvent.objects.select_for_update(skip_locked=True).order_by('id')[:batch_size])
+            if not events:
+                break
+            latest = {event.post_target_id: event for event in events}
+            targets = PostTarget.objects.filter(id__in=latest).values(
+                'id', 'status', 'reason_code', 'last_error', 'social_account__platform', 'post__user_id',
+                'post__content_type',
+            )
+            groups = defaultdict(list)
+            status_changes = []
+            for target in targets:
+                event = latest[target['id']]
+                if event.platform != target['social_account__platform']:
+                    continue
+                outcome = (event.status, *encode_reason(event.error))
+                if (target['status'], target['reason_code'], target['last_error']) == outcome:
+                    continue
+                groups[outcome].append(target['id'])
+                if target['status'] != event.status:
+                    status_changes.append(
+                        (target['post__user_id'], event.platform, target['post__content_type'], event.status)
+                    )
+            for (status, reason_code, last_error), target_ids in groups.items():
+                PostTarget.objects.filter(id__in=target_ids).update(
+                    status=status, reason_code=reason_code, last_error=last_error,
+                )
+            record_status_changes(status_changes)
+            WebhookEvent.objects.filter(id__in=[event.id for event in events]).delete()
+        consumed += len(events)
+        if len(events) < batch_size:
+            break
+    return consumed
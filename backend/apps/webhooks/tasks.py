@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from apps.webhooks.services.ingestion_service import apply_webhook_events as apply_events
+
+
+@shared_task
+def apply_webhook_events():
+    return apply_events()
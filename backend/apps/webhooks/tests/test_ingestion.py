@@ -0,0 +1,136 @@
+import hashlib
+import hmac
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from apps.analytics.models import DailyPublishStat
+from apps.integrations.models import Platform, SocialAccount
+from apps.posts.models import Post, PostTarget
+from apps.webhooks.models import WebhookEvent
+from apps.webhooks.services.ingestion_service import apply_webhook_events
+
+User = get_user_model()
+
+SECRETS = {'x': 'x-secret', 'youtube': 'yt-secret'}
+
+
+def sign(secret, body):
+    return 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+@override_settings(WEBHOOK_SECRETS=SECRETS)
+class WebhookReceiverTest(TestCase):
+    def _post(self, platform, payload, secret=None):
+        body = json.dumps(payload).encode()
+        return self.client.post(
+            f'/api/webhooks/{platform}',
+            data=body,
+            content_type='application/json',
+            HTTP_X_WEBHOOK_SIGNATURE=sign(secret or SECRETS[platform], body),
+        )
+
+    def test_valid_callback_is_buffered_and_acknowledged(self):
+        response = self._post('x', {'events': [
+            {'post_target_id': 1, 'status': 'published'},
+            {'post_target_id': 2, 'status': 'rejected', 'error': 'Media rejected'},
+        ]})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {'accepted': 2})
+        self.assertEqual(
+            list(WebhookEvent.objects.order_by('id').values_list('platform', 'post_target_id', 'status', 'error')),
+            [('x', 1, 'published', ''), ('x', 2, 'rejected', 'Media rejected')],
+        )
+
+    def test_bad_signature_is_rejected(self):
+        response = self._post('x', {'post_target_id': 1, 'status': 'published'}, secret='wrong')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_platform_without_secret_is_rejected(self):
+        response = self._post('tiktok', {'post_target_id': 1, 'status': 'published'}, secret='anything')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_malformed_event_is_rejected(self):
+        response = self._post('x', {'post_target_id': '1', 'status': 'done'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+
+class ApplyWebhookEventsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.x_account = SocialAccount.objects.create(user=self.user, platform=Platform.X, display_name='X')
+        self.youtube = SocialAccount.objects.create(user=self.user, platform=Platform.YOUTUBE, display_name='YT')
+
+    def _targets(self, count, account):
+        targets = []
+        for _ in range(count):
+            post = Post.objects.create(user=self.user, content_type=Post.ContentType.TEXT, caption='Hello')
+            targets.append(PostTarget.objects.create(
+                post=post, social_account=account, status=PostTarget.Status.QUEUED,
+            ))
+        return targets
+
+    def test_events_are_applied_in_bulk(self):
+        targets = self._targets(20, self.x_account)
+        WebhookEvent.objects.bulk_create([
+            WebhookEvent(platform='x', post_target_id=target.id, status='published') for target in targets[:15]
+        ] + [
+            WebhookEvent(platform='x', post_target_id=target.id, status='rejected', error='Rate limited')
+            for target in targets[15:]
+        ])
+
+        # One UPDATE per (status, error) group plus the per-counter stats upserts,
+        # independent of how many events were buffered.
+        with self.assertNumQueries(15):
+            consumed = apply_webhook_events()
+
+        self.assertEqual(consumed, 20)
+        self.assertEqual(PostTarget.objects.filter(status=PostTarget.Status.PUBLISHED).count(), 15)
+        self.assertEqual(
+            set(PostTarget.objects.filter(status=PostTarget.Status.REJECTED).values_list('last_error', flat=True)),
+            {'Rate limited'},
+        )
+        self.assertFalse(WebhookEvent.objects.exists())
+        self.assertEqual(
+            dict(DailyPublishStat.objects.values_list('status', 'count')),
+            {'published': 15, 'rejected': 5},
+        )
+
+    def test_newest_event_wins_and_repeats_are_not_counted(self):
+        target, = self._targets(1, self.x_account)
+        WebhookEvent.objects.create(platform='x', post_target_id=target.id, status='rejected', error='Timeout')
+        WebhookEvent.objects.create(platform='x', post_target_id=target.id, status='published')
+        apply_webhook_events()
+        WebhookEvent.objects.create(platform='x', post_target_id=target.id, status='published')
+        apply_webhook_events()
+
+        target.refresh_from_db()
+        self.assertEqual(target.status, PostTarget.Status.PUBLISHED)
+        self.assertEqual(dict(DailyPublishStat.objects.values_list('status', 'count')), {'published': 1})
+
+    def test_events_for_another_platform_are_dropped(self):
+        target, = self._targets(1, self.youtube)
+        WebhookEvent.objects.create(platform='x', post_target_id=target.id, status='published')
+        WebhookEvent.objects.create(platform='x', post_target_id=999999, status='published')
+
+        self.assertEqual(apply_webhook_events(), 2)
+
+        target.refresh_from_db()
+        self.assertEqual(target.status, PostTarget.Status.QUEUED)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_large_buffer_is_drained_in_batches(self):
+        targets = self._targets(5, self.x_account)
+        WebhookEvent.objects.bulk_create([
+            WebhookEvent(platform='x', post_target_id=target.id, status='published') for target in targets
+        ])
+
+        self.assertEqual(apply_webhook_events(batch_size=2), 5)
+        self.assertEqual(PostTarget.objects.filter(status=PostTarget.Status.PUBLISHED).count(), 5)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.webhooks.views import receive_webhook
+
+app_name = 'webhooks'
+
+urlpatterns = [
+    path('<str:platform>', receive_webhook, name='receive'),
+]
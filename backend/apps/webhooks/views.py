@@ -0,0 +1,32 @@
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.integrations.models import Platform
+from apps.webhooks.models import WebhookEvent
+from apps.webhooks.services.ingestion_service import (
+    SIGNATURE_HEADER,
+    InvalidPayload,
+    parse_events,
+    verify_signature,
+)
+
+
+@csrf_exempt
+@require_POST
+def receive_webhook(request, platform):
+    """Verify, buffer and acknowledge a platform delivery callback.
+
+    Events are only stored here; ``apply_webhook_events`` updates the targets
+    in batches.
+    """
+    if platform not in Platform.values:
+        return JsonResponse({'detail': 'Unknown platform.'}, status=404)
+    if not verify_signature(platform, request.body, request.META.get(SIGNATURE_HEADER)):
+        return JsonResponse({'detail': 'Invalid signature.'}, status=403)
+    try:
+        events = parse_events(platform, request.body)
+    except InvalidPayload as exc:
+        return JsonResponse({'detail': str(exc)}, status=400)
+    WebhookEvent.objects.bulk_create(events)
+    return JsonResponse({'accepted': len(events)}, status=202)
@@ -2,9 +2,11 @@ import os
 
 from celery import Celery
 
+import apps.common.task_metrics  # noqa: F401  (connects task instrumentation signals)
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-app = Celery('postautomation')
+app = Celery('postautomation', task_cls='apps.common.local_tasks:LocalTask')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
@@ -1,6 +1,7 @@
 """
 Base settings for PostAutomation project.
 """
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -24,9 +25,12 @@ INSTALLED_APPS = [
     'apps.integrations',
     'apps.capabilities',
     'apps.common',
+    'apps.analytics',
+    'apps.webhooks',
 ]
 
 MIDDLEWARE = [
+    'apps.common.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -65,6 +69,11 @@ DATABASES = {
     }
 }
 
+# Optional read replica. Only reads made inside
+# apps.common.db_router.read_from_replica() are sent to it.
+DATABASE_REPLICA_ALIAS = 'replica'
+DATABASE_ROUTERS = ['apps.common.db_router.ReadReplicaRouter']
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -95,6 +104,12 @@ STATIC_ROOT = BASE_DIR / 'static'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# How the posts media action sends file bytes: 'django' (ranged FileResponse),
+# 'x-accel-redirect' (nginx internal location at MEDIA_ACCEL_REDIRECT_PREFIX)
+# or 'x-sendfile' (Apache/lighttpd, absolute path).
+MEDIA_DELIVERY = 'django'
+MEDIA_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -107,6 +122,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Per user and endpoint, enforced by apps.common.throttling in the shared cache.
+    'DEFAULT_THROTTLE_RATES': {
+        'composer': '120/min',
+        'publish': '30/min',
+    },
 }
 
 # Celery Configuration
@@ -114,6 +134,124 @@ CELERY_BROKER_URL = 'memory://'
 CELERY_RESULT_BACKEND = 'cache+memory://'
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_TASK_ROUTES = ['apps.posts.routing.route_publish_task']
+
+# Publishing queues: one queue per (platform, lane), named
+# '<prefix>.<platform>.<lane>', each served by its own worker pool.
+# Start a pool with `python manage.py publish_worker <platform> --lane <lane>`.
+PUBLISH_QUEUE_PREFIX = 'publish'
+PUBLISH_WORKER_CONCURRENCY = {
+    'instagram': {'interactive': 4, 'bulk': 2},
+    'facebook': {'interactive': 4, 'bulk': 2},
+    'tiktok': {'interactive': 2, 'bulk': 1},
+    'youtube': {'interactive': 2, 'bulk': 1},
+    'linkedin': {'interactive': 4, 'bulk': 2},
+    'x': {'interactive': 8, 'bulk': 4},
+}
+
+# Publishes are written to an outbox table and sent to the broker by
+# `python manage.py relay_outbox`. Relaying on commit keeps eager/dev setups
+# working without a relay process. A batch claimed by a relay that has not
+# finished sending it after PUBLISH_OUTBOX_CLAIM_TIMEOUT seconds is picked up
+# again by the next relay.
+PUBLISH_OUTBOX_BATCH_SIZE = 500
+PUBLISH_OUTBOX_CLAIM_TIMEOUT = 300
+PUBLISH_OUTBOX_RELAY_ON_COMMIT = CELERY_TASK_ALWAYS_EAGER
+
+# Single-node installs without a broker can run tasks on a thread pool inside
+# the app server instead of eagerly in the request. At most
+# LOCAL_TASK_MAX_PENDING tasks are queued; on exit the pool gets
+# LOCAL_TASK_DRAIN_TIMEOUT seconds to finish pending work.
+LOCAL_TASK_EXECUTION = False
+LOCAL_TASK_WORKERS = 4
+LOCAL_TASK_MAX_PENDING = 1000
+LOCAL_TASK_DRAIN_TIMEOUT = 30
+
+# Published and rejected targets older than this are moved to the archive
+# tables by `python manage.py archive_history`.
+ARCHIVE_AFTER_DAYS = 90
+
+# Media files no post, template or archived post references are deleted by
+# `python manage.py collect_orphaned_media` and a daily beat task. Files newer
+# than MEDIA_GC_GRACE_PERIOD seconds are kept so in-flight uploads survive.
+MEDIA_GC_GRACE_PERIOD = 24 * 60 * 60
+MEDIA_GC_BATCH_SIZE = 1000
+
+# SocialAccount health checks refresh the availability flags in the
+# background so requests only read stored values.
+SOCIAL_ACCOUNT_HEALTH_CHECKER = 'apps.integrations.services.health_service.FakeHealthChecker'
+SOCIAL_ACCOUNT_HEALTH_INTERVAL = 6 * 60 * 60
+SOCIAL_ACCOUNT_HEALTH_BATCH_SIZE = 200
+SOCIAL_ACCOUNT_HEALTH_MAX_WORKERS = 16
+
+# Publishes in flight per social account (0 = unlimited). Tasks that find
+# the account busy, or older targets of it still queued, retry after
+# PUBLISH_ACCOUNT_RETRY_DELAY seconds; creation order is given up after
+# PUBLISH_ACCOUNT_ORDER_MAX_RETRIES retries. Leases of crashed workers expire
+# after PUBLISH_ACCOUNT_LEASE_TTL seconds.
+PUBLISH_MAX_IN_FLIGHT_PER_ACCOUNT = 1
+PUBLISH_ACCOUNT_RETRY_DELAY = 1.0
+PUBLISH_ACCOUNT_ORDER_MAX_RETRIES = 300
+PUBLISH_ACCOUNT_LEASE_TTL = 300
+
+# Client used by publish_target to talk to platforms. HttpPublishClient posts
+# to PUBLISH_CLIENT_BASE_URL (e.g. the fake platform server used by loadtest_publish).
+PUBLISH_CLIENT = 'apps.integrations.services.publish_client.FakePublishClient'
+PUBLISH_CLIENT_BASE_URL = 'http://127.0.0.1:8765'
+PUBLISH_CLIENT_TIMEOUT = 10
+
+# Unreachable platforms, 5xx and 429 answers are retried after
+# PUBLISH_TRANSIENT_RETRY_DELAY seconds, doubling each time, before the
+# target is rejected.
+PUBLISH_TRANSIENT_MAX_RETRIES = 5
+PUBLISH_TRANSIENT_RETRY_DELAY = 2.0
+
+# Bulk account sync: accounts accepted per request.
+ACCOUNT_SYNC_MAX_ITEMS = 5000
+
+# Per-user availability results served by GET /capabilities; invalidated
+# whenever a user's accounts change.
+AVAILABILITY_CACHE_TIMEOUT = 5 * 60
+
+# GET /dashboard/summary is cached per user for this many seconds.
+DASHBOARD_SUMMARY_CACHE_TIMEOUT = 30
+
+# Platform delivery callbacks: HMAC secrets per platform, and the batch size
+# used when buffered events are applied to post targets.
+WEBHOOK_SECRETS = {
+    platform: os.environ.get(f'WEBHOOK_SECRET_{platform.upper()}', '')
+    for platform in ('instagram', 'facebook', 'tiktok', 'youtube', 'linkedin', 'x')
+}
+WEBHOOK_BATCH_SIZE = 1000
+
+# GET /metrics answers staff users and scrapers sending this bearer token;
+# with no token set, only staff users.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+CELERY_BEAT_SCHEDULE = {
+    'refresh-social-account-health': {
+        'task': 'apps.integrations.tasks.refresh_social_account_health',
+        'schedule': 15 * 60,
+    },
+    'apply-webhook-events': {
+        'task': 'apps.webhooks.tasks.apply_webhook_events',
+        'schedule': 5,
+    },
+    'collect-orphaned-media': {
+        'task': 'apps.posts.tasks.collect_orphaned_media',
+        'schedule': 24 * 60 * 60,
+    },
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+# Deployments running more than one process need a shared cache; system
+# checks then reject caches that only live in one process's memory.
+REQUIRE_SHARED_CACHE = False
 
 # CORS settings
 CORS_ALLOW_CREDENTIALS = True
@@ -5,6 +5,13 @@ from .base import *
 
 DEBUG = True
 
+# A second, unreplicated SQLite database for the replica routing tests. Reads
+# are only routed to it where a test sets DATABASE_REPLICA_ALIAS to it.
+DATABASES['local_replica'] = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': BASE_DIR / 'db.replica.sqlite3',
+}
+
 ALLOWED_HOSTS = ['localhost', '127.0.0.1']
 
 # CORS settings for development
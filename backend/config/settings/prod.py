@@ -14,11 +14,49 @@ SECRET_KEY = os.environ.get('SECRET_KEY', 'change-me-in-production')
 CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', '').split(',')
 CSRF_TRUSTED_ORIGINS = os.environ.get('CSRF_TRUSTED_ORIGINS', '').split(',')
 
-# Database (override with production database)
-# DATABASES = {
-#     'default': {
-#         'ENGINE': 'django.db.backends.postgresql',
-#         ...
-#     }
-# }
+# Celery: tasks run eagerly only while no broker is configured. With a broker,
+# publishes are relayed to it by the relay_outbox process.
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', CELERY_BROKER_URL)
+CELERY_TASK_ALWAYS_EAGER = CELERY_BROKER_URL == 'memory://'
+# LOCAL_TASK_EXECUTION=true runs them on a thread pool in the app server instead.
+LOCAL_TASK_EXECUTION = os.environ.get('LOCAL_TASK_EXECUTION', '').lower() in ('1', 'true', 'yes')
+LOCAL_TASK_WORKERS = int(os.environ.get('LOCAL_TASK_WORKERS', LOCAL_TASK_WORKERS))
+PUBLISH_OUTBOX_RELAY_ON_COMMIT = CELERY_TASK_ALWAYS_EAGER or LOCAL_TASK_EXECUTION
 
+# Share the cache between processes when REDIS_URL is set (needs the redis package).
+# Without it, startup checks fail unless REQUIRE_SHARED_CACHE=false says this
+# is a single-process install.
+REQUIRE_SHARED_CACHE = os.environ.get('REQUIRE_SHARED_CACHE', 'true').lower() in ('1', 'true', 'yes')
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        },
+    }
+
+# Hand media bytes to the front-end server (e.g. MEDIA_DELIVERY=x-accel-redirect).
+MEDIA_DELIVERY = os.environ.get('MEDIA_DELIVERY', MEDIA_DELIVERY)
+MEDIA_ACCEL_REDIRECT_PREFIX = os.environ.get('MEDIA_ACCEL_REDIRECT_PREFIX', MEDIA_ACCEL_REDIRECT_PREFIX)
+
+# Database
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('DATABASE_NAME', 'postautomation'),
+        'USER': os.environ.get('DATABASE_USER', 'postautomation'),
+        'PASSWORD': os.environ.get('DATABASE_PASSWORD', ''),
+        'HOST': os.environ.get('DATABASE_HOST', 'localhost'),
+        'PORT': os.environ.get('DATABASE_PORT', '5432'),
+        'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+if os.environ.get('DATABASE_REPLICA_HOST'):
+    DATABASES[DATABASE_REPLICA_ALIAS] = {
+        **DATABASES['default'],
+        'HOST': os.environ['DATABASE_REPLICA_HOST'],
+        'PORT': os.environ.get('DATABASE_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
@@ -1,9 +1,16 @@
 from django.contrib import admin
 from django.urls import include, path
 
+from apps.common.views import metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/capabilities/', include('apps.capabilities.urls')),
+    path('api/dashboard/', include('apps.analytics.dashboard_urls')),
+    path('api/integrations/', include('apps.integrations.urls')),
     path('api/posts/', include('apps.posts.urls')),
+    path('api/stats/', include('apps.analytics.urls')),
+    path('api/webhooks/', include('apps.webhooks.urls')),
+    path('metrics', metrics, name='metrics'),
 ]
 
@@ -8,7 +8,7 @@ import { AppLayout } from "@/components/layout/app-layout";
 import { ProtectedRoute } from "@/components/protected-route";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
-import { postsApi, Post } from "@/lib/api";
+import { dashboardApi, postsApi, DashboardSummary, Post } from "@/lib/api";
 import { BackgroundPaths } from "@/components/ui/background-paths";
 
 const contentTypeIcons = {
@@ -25,12 +25,23 @@ const contentTypeColors = {
 
 export default function DashboardPage() {
   const [posts, setPosts] = useState<Post[]>([]);
+  const [summary, setSummary] = useState<DashboardSummary | null>(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     loadPosts();
+    loadSummary();
   }, []);
 
+  const loadSummary = async () => {
+    try {
+      const response = await dashboardApi.summary();
+      setSummary(response.data);
+    } catch (error) {
+      console.error("Failed to load dashboard summary:", error);
+    }
+  };
+
   const loadPosts = async () => {
     try {
       // For demo, we'll use mock data
@@ -83,6 +94,8 @@ export default function DashboardPage() {
             </Link>
           </div>
 
+          {summary && <SummaryCards summary={summary} />}
+
           {loading ? (
             <div className="text-center py-12">Loading posts...</div>
           ) : posts.length === 0 ? (
@@ -110,6 +123,56 @@ export default function DashboardPage() {
   );
 }
 
+function SummaryCards({ summary }: { summary: DashboardSummary }) {
+  const stats = [
+    { label: "Posts", value: summary.posts.total },
+    { label: "Published", value: summary.targets.by_status.published },
+    { label: "In queue", value: summary.targets.by_status.queued },
+    { label: "Rejected", value: summary.targets.by_status.rejected },
+  ];
+  const available = summary.availability.filter((item) =>
+    Object.values(item.content_types).some((entry) => entry.available)
+  );
+
+  return (
+    <div className="mb-8 space-y-4">
+      <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+        {stats.map((stat) => (
+          <Card key={stat.label}>
+            <CardHeader>
+              <CardDescription>{stat.label}</CardDescription>
+              <CardTitle className="text-3xl">{stat.value}</CardTitle>
+            </CardHeader>
+          </Card>
+        ))}
+      </div>
+      <p className="text-sm text-muted-foreground">
+        Publishing available on {available.length} of {summary.availability.length} platforms.
+      </p>
+      {summary.recent_failures.length > 0 && (
+        <Card>
+          <CardHeader>
+            <CardTitle>Recent failures</CardTitle>
+          </CardHeader>
+          <CardContent className="space-y-2">
+            {summary.recent_failures.map((failure) => (
+              <Link
+                key={failure.post_target_id}
+                href={`/posts/${failure.post_id}`}
+                className="block text-sm hover:underline"
+              >
+                <span className="font-medium capitalize">{failure.platform}</span>
+                {" · "}
+                <span className="text-muted-foreground">{failure.last_error}</span>
+              </Link>
+            ))}
+          </CardContent>
+        </Card>
+      )}
+    </div>
+  );
+}
+
 function PostCard({ post, index }: { post: Post; index: number }) {
   const Icon = contentTypeIcons[post.content_type];
 
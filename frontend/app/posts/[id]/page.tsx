@@ -164,7 +164,7 @@ export default function PostDetailsPage() {
                   <div>
                     <h3 className="font-semibold mb-2">Image</h3>
                     <img
-                      src={post.image_file}
+                      src={post.image_preview_url || post.image_file}
                       alt="Post"
                       className="rounded-lg max-w-full h-auto"
                     />
@@ -175,8 +175,9 @@ export default function PostDetailsPage() {
                   <div>
                     <h3 className="font-semibold mb-2">Video</h3>
                     <video
-                      src={post.video_file}
+                      src={post.video_preview_url || post.video_file}
                       controls
+                      preload="metadata"
                       className="rounded-lg max-w-full"
                     />
                   </div>
@@ -55,6 +55,10 @@ export const postsApi = {
   publish: (id: number) => api.post(`/posts/${id}/publish`),
 };
 
+export const dashboardApi = {
+  summary: () => api.get<DashboardSummary>('/dashboard/summary'),
+};
+
 export const capabilitiesApi = {
   get: (contentType: 'TEXT' | 'PHOTO' | 'VIDEO') =>
     api.get(`/capabilities?content_type=${contentType}`),
@@ -88,6 +92,8 @@ export interface Post {
   hashtags: string[];
   image_file?: string;
   video_file?: string;
+  image_preview_url?: string | null;
+  video_preview_url?: string | null;
   media_metadata?: Record<string, any>;
   created_at: string;
   targets?: PostTarget[];
@@ -97,6 +103,39 @@ export interface PostTarget {
   id: number;
   social_account_id: number;
   status: 'selected' | 'queued' | 'rejected' | 'published';
+  reason_code?: number;
   last_error?: string;
 }
 
+export interface DashboardSummary {
+  posts: {
+    total: number;
+    by_content_type: Record<ContentType, number>;
+  };
+  targets: {
+    by_status: Record<PostTarget['status'], number>;
+    by_platform: Record<string, Record<PostTarget['status'], number>>;
+  };
+  recent_failures: {
+    post_target_id: number;
+    post_id: number;
+    content_type: ContentType;
+    caption: string;
+    platform: string;
+    account: string;
+    reason_code: number;
+    last_error: string;
+    created_at: string;
+  }[];
+  availability: {
+    platform: string;
+    connected_accounts: number;
+    content_types: Record<ContentType, {
+      available: boolean;
+      reason: string | null;
+      requires_action: boolean | null;
+      action_hint: string | null;
+    }>;
+  }[];
+  generated_at: string;
+}